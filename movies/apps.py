@@ -1,4 +1,11 @@
 from django.apps import AppConfig
+from django.core import checks
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
 
 
 class MoviesConfig(AppConfig):
@@ -6,34 +13,29 @@ class MoviesConfig(AppConfig):
     name = "movies"
 
     def ready(self):
-        from movies.serializers.genre_serializer import FullGenreSerializer
-        from movies.services.tmdb_service import TmdbService
+        from movies.models import Actor, Genre, Movie, MovieGenre, MovieListing
+        from movies.services.movie_facet_service import MovieFacetService
+        from movies.services.movie_listing_service import MovieListingService
+        from movies.utils.genre_registry import GenreRegistry
+        from movies.utils.tmdb_rate_limiter import check_shared_cache
 
-        # genres: dict = TmdbService().fetch_genre_list()
-        # genre_serializer: FullGenreSerializer = FullGenreSerializer(
-        #     data=[
-        #         {"name": "Action"},
-        #         {"name": "Adventure"},
-        #         {"name": "Animation"},
-        #         {"name": "Comedy"},
-        #         {"name": "Crime"},
-        #         {"name": "Documentary"},
-        #         {"name": "Drama"},
-        #         {"name": "Family"},
-        #         {"name": "Fantasy"},
-        #         {"name": "History"},
-        #         {"name": "Horror"},
-        #         {"name": "Music"},
-        #         {"name": "Mystery"},
-        #         {"name": "Romance"},
-        #         {"name": "Science Fiction"},
-        #         {"name": "TV Movie"},
-        #         {"name": "Thriller"},
-        #         {"name": "War"},
-        #         {"name": "Western"},
-        #     ],
-        #     many=True,
-        # )
-        #
-        # genre_serializer.is_valid()
-        # genre_serializer.save()
+        checks.register(check_shared_cache)
+
+        # The registry is built lazily on first use, genres are seeded by sync_genres
+        post_save.connect(GenreRegistry.invalidate, sender=Genre)
+        post_delete.connect(GenreRegistry.invalidate, sender=Genre)
+
+        # Bulk writes skip these signals and call MovieListingService.refresh directly
+        post_save.connect(MovieListingService.movie_saved, sender=Movie)
+        pre_delete.connect(MovieListingService.movie_deleting, sender=Movie)
+        post_delete.connect(MovieListingService.movie_deleted, sender=Movie)
+        post_save.connect(MovieListingService.movie_genre_changed, sender=MovieGenre)
+        post_delete.connect(MovieListingService.movie_genre_changed, sender=MovieGenre)
+        m2m_changed.connect(
+            MovieListingService.cast_changed, sender=Movie.actors.through
+        )
+        post_save.connect(MovieListingService.actor_saved, sender=Actor)
+        pre_delete.connect(MovieListingService.actor_deleting, sender=Actor)
+        post_delete.connect(MovieListingService.actor_deleted, sender=Actor)
+        post_save.connect(MovieListingService.genre_saved, sender=Genre)
+        post_delete.connect(MovieFacetService.listing_deleted, sender=MovieListing)
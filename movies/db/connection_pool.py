@@ -0,0 +1,253 @@
+import atexit
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+@dataclass
+class PooledConnection:
+    connection: Any
+    created_at: float
+    returned_at: float
+
+
+class ConnectionPool:
+    _shared_lock = threading.Lock()
+    _shared: Dict[Hashable, "ConnectionPool"] = {}
+    _pid: Optional[int] = None
+
+    def __init__(
+        self,
+        check: Callable[[Any, float], bool],
+        reset: Callable[[Any], bool],
+        min_size: int = 0,
+        max_size: int = 10,
+        timeout: float = 10.0,
+        max_idle: float = 300.0,
+        max_lifetime: float = 3600.0,
+    ) -> None:
+        self.check = check
+        self.reset = reset
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self._condition = threading.Condition()
+        # Most recently returned last, checkouts reuse the warmest connection
+        self._idle: List[PooledConnection] = []
+        self._in_use: Dict[int, PooledConnection] = {}
+        self.size = 0
+        self.waiting = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.health_check_failures = 0
+        self.opened = 0
+        self.closed = 0
+        self.prewarmed = False
+
+    @classmethod
+    def shared(
+        cls, key: Hashable, factory: Callable[[], "ConnectionPool"]
+    ) -> "ConnectionPool":
+        # Connections are not shared across fork(), every worker process builds its own
+        with cls._shared_lock:
+            if cls._pid != os.getpid():
+                cls._shared = {}
+                cls._pid = os.getpid()
+            pool: Optional[ConnectionPool] = cls._shared.get(key)
+            if pool is None:
+                pool = factory()
+                cls._shared[key] = pool
+            return pool
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._shared_lock:
+            if cls._pid == os.getpid():
+                for pool in cls._shared.values():
+                    pool.close()
+            cls._shared = {}
+            cls._pid = None
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        # Drop inherited sockets without closing them, the parent still owns them
+        cls._shared_lock = threading.Lock()
+        cls._shared = {}
+        cls._pid = None
+
+    def checkout(self, connect: Callable[[], Any]) -> Any:
+        deadline: float = time.monotonic() + self.timeout
+        while True:
+            expired: List[PooledConnection] = []
+            entry: Optional[PooledConnection] = None
+            with self._condition:
+                self.checkouts += 1
+                waited: bool = False
+                while True:
+                    entry = self._take_idle(expired)
+                    if entry is not None or self.size < self.max_size:
+                        break
+                    remaining: float = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timeouts += 1
+                        self._close_entries(expired)
+                        raise PoolTimeout(
+                            f"No database connection available within {self.timeout}s "
+                            f"({self.max_size} in use)"
+                        )
+                    if not waited:
+                        self.waits += 1
+                        waited = True
+                    self.waiting += 1
+                    try:
+                        self._condition.wait(remaining)
+                    finally:
+                        self.waiting -= 1
+                if entry is None:
+                    # Reserve the slot before connecting outside the lock
+                    self.size += 1
+            self._close_entries(expired)
+            if entry is None:
+                return self._open(connect)
+            idle: float = time.monotonic() - entry.returned_at
+            if self.check(entry.connection, idle):
+                with self._condition:
+                    self._in_use[id(entry.connection)] = entry
+                return entry.connection
+            with self._condition:
+                self.health_check_failures += 1
+                self.checkouts -= 1
+                self._release_slot()
+            self._close_entries([entry])
+
+    def prewarm(self, connect: Callable[[], Any]) -> None:
+        # Once per pool, best effort, a failing connect surfaces again on checkout
+        with self._condition:
+            if self.prewarmed:
+                return
+            self.prewarmed = True
+        while True:
+            with self._condition:
+                if self.size >= self.min_size:
+                    return
+                self.size += 1
+            try:
+                connection: Any = connect()
+            except Exception:
+                with self._condition:
+                    self._release_slot()
+                return
+            now: float = time.monotonic()
+            with self._condition:
+                self.opened += 1
+                self._idle.append(PooledConnection(connection, now, now))
+                self._condition.notify()
+
+    def checkin(self, connection: Any) -> None:
+        with self._condition:
+            entry: Optional[PooledConnection] = self._in_use.pop(id(connection), None)
+        if entry is None:
+            # Not handed out by this pool, e.g. opened before the pool was reset
+            self._close_entries([PooledConnection(connection, 0.0, 0.0)])
+            return
+        now: float = time.monotonic()
+        reusable: bool = now - entry.created_at < self.max_lifetime and self.reset(
+            connection
+        )
+        expired: List[PooledConnection] = []
+        with self._condition:
+            if reusable:
+                entry.returned_at = now
+                self._idle.append(entry)
+                self._condition.notify()
+            else:
+                expired.append(entry)
+                self._release_slot()
+            self._prune_idle(now, expired)
+        self._close_entries(expired)
+
+    def close(self) -> None:
+        with self._condition:
+            expired: List[PooledConnection] = self._idle
+            self._idle = []
+            self.size -= len(expired)
+            self._condition.notify_all()
+        self._close_entries(expired)
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                "size": self.size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "max_size": self.max_size,
+                "waiting": self.waiting,
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "health_check_failures": self.health_check_failures,
+                "opened": self.opened,
+                "closed": self.closed,
+            }
+
+    def _open(self, connect: Callable[[], Any]) -> Any:
+        try:
+            connection: Any = connect()
+        except BaseException:
+            with self._condition:
+                self._release_slot()
+            raise
+        now: float = time.monotonic()
+        with self._condition:
+            self.opened += 1
+            self._in_use[id(connection)] = PooledConnection(connection, now, now)
+        return connection
+
+    def _take_idle(self, expired: List[PooledConnection]) -> Optional[PooledConnection]:
+        now: float = time.monotonic()
+        self._prune_idle(now, expired)
+        while self._idle:
+            entry: PooledConnection = self._idle.pop()
+            if now - entry.created_at < self.max_lifetime:
+                return entry
+            expired.append(entry)
+            self.size -= 1
+        return None
+
+    def _prune_idle(self, now: float, expired: List[PooledConnection]) -> None:
+        # Oldest returned first, keep min_size connections open through quiet periods
+        while (
+            self._idle
+            and self.size > self.min_size
+            and now - self._idle[0].returned_at >= self.max_idle
+        ):
+            expired.append(self._idle.pop(0))
+            self.size -= 1
+
+    def _release_slot(self) -> None:
+        self.size -= 1
+        self._condition.notify()
+
+    def _close_entries(self, entries: List[PooledConnection]) -> None:
+        for entry in entries:
+            try:
+                entry.connection.close()
+            except Exception:
+                pass
+        if entries:
+            with self._condition:
+                self.closed += len(entries)
+
+
+atexit.register(ConnectionPool.close_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=ConnectionPool.reset_after_fork)
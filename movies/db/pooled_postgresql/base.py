@@ -0,0 +1,93 @@
+import json
+from typing import Any, Dict, Tuple
+
+from django.db.backends.postgresql import base as postgresql
+from psycopg2 import extensions
+
+from movies.db.connection_pool import ConnectionPool, PoolTimeout
+
+Database = postgresql.Database
+
+
+class DatabaseWrapper(postgresql.DatabaseWrapper):
+    @property
+    def pool(self) -> ConnectionPool:
+        return ConnectionPool.shared(self.pool_key(), self.create_pool)
+
+    def pool_key(self) -> Tuple[str, ...]:
+        # Test database setup and _nodb_cursor reuse the alias for other databases
+        return (
+            self.alias,
+            str(self.settings_dict["HOST"]),
+            str(self.settings_dict["PORT"]),
+            str(self.settings_dict["NAME"]),
+            str(self.settings_dict["USER"]),
+            json.dumps(self.settings_dict["OPTIONS"], sort_keys=True, default=str),
+        )
+
+    def create_pool(self) -> ConnectionPool:
+        options: Dict[str, Any] = self.settings_dict.get("POOL", {})
+        ping_after: float = options.get("PING_AFTER_IDLE", 1.0)
+        return ConnectionPool(
+            check=lambda connection, idle: DatabaseWrapper.check_connection(
+                connection, idle, ping_after
+            ),
+            reset=self.reset_connection,
+            min_size=options.get("MIN_SIZE", 0),
+            max_size=options.get("MAX_SIZE", 10),
+            timeout=options.get("TIMEOUT", 10.0),
+            max_idle=options.get("MAX_IDLE", 300.0),
+            max_lifetime=options.get("MAX_LIFETIME", 3600.0),
+        )
+
+    def pool_stats(self) -> Dict[str, int]:
+        return self.pool.stats()
+
+    def get_new_connection(self, conn_params: Dict[str, Any]) -> Any:
+        def connect() -> Any:
+            return super(DatabaseWrapper, self).get_new_connection(conn_params)
+
+        pool: ConnectionPool = self.pool
+        # The first connection of a pool opens MIN_SIZE, outside the shared pool lock
+        pool.prewarm(connect)
+        try:
+            connection = pool.checkout(connect)
+        except PoolTimeout as e:
+            raise Database.OperationalError(str(e)) from e
+        self.isolation_level = self.settings_dict["OPTIONS"].get(
+            "isolation_level", connection.isolation_level
+        )
+        return connection
+
+    def _close(self) -> None:
+        # Hand the connection back instead of closing it, the pool decides its fate
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self.pool.checkin(self.connection)
+
+    @staticmethod
+    def check_connection(connection: Any, idle: float, ping_after: float) -> bool:
+        if connection.closed:
+            return False
+        # Recently used connections skip the round trip, the server was just there
+        if idle < ping_after:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except Database.Error:
+            return False
+
+    @staticmethod
+    def reset_connection(connection: Any) -> bool:
+        if connection.closed:
+            return False
+        try:
+            status: int = connection.get_transaction_status()
+            if status != extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+            connection.autocommit = True
+            return True
+        except Database.Error:
+            return False
@@ -0,0 +1,176 @@
+import json
+import math
+import re
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+
+TRAFFIC_FILE = Path(__file__).resolve().parent / "traffic.jsonl"
+ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+TOTAL = "TOTAL"
+# Absolute error-rate increase tolerated before a run counts as a regression
+ERROR_RATE_MARGIN = 0.01
+
+
+@dataclass
+class TrafficRequest:
+    method: str
+    path: str
+    body: Optional[Dict[str, Any]] = None
+
+    @property
+    def endpoint(self) -> str:
+        path: str = urllib.parse.urlsplit(self.path).path
+        return f"{self.method} {ID_SEGMENT.sub('/{id}', path)}"
+
+
+@dataclass
+class EndpointReport:
+    requests: int
+    errors: int
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+
+
+def read_traffic(path: Path) -> List[TrafficRequest]:
+    with open(path, encoding="utf-8") as traffic:
+        return [TrafficRequest(**json.loads(line)) for line in traffic if line.strip()]
+
+
+def percentile(latencies: List[float], rank: float) -> float:
+    if not latencies:
+        return 0.0
+    index: int = max(0, math.ceil(rank / 100 * len(latencies)) - 1)
+    return latencies[index]
+
+
+class LoadDriver:
+    def __init__(
+        self,
+        base_url: str,
+        traffic: List[TrafficRequest],
+        rps: float,
+        duration: float,
+        concurrency: int,
+        token: Optional[str] = None,
+    ) -> None:
+        self.base_url = base_url
+        self.traffic = traffic
+        self.rps = rps
+        self.duration = duration
+        self.concurrency = concurrency
+        self.headers: Dict[str, str] = (
+            {"Authorization": f"Bearer {token}"} if token else {}
+        )
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def run(self) -> Dict[str, EndpointReport]:
+        total_requests: int = int(self.rps * self.duration)
+        started: float = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = []
+            for index in range(total_requests):
+                # Open-loop schedule: latency is measured from the planned send time,
+                # so a saturated server is not hidden by the driver slowing down
+                scheduled: float = started + index / self.rps
+                delay: float = scheduled - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                request: TrafficRequest = self.traffic[index % len(self.traffic)]
+                futures.append(executor.submit(self.send, request, scheduled))
+            wait(futures)
+        return self.report(time.monotonic() - started)
+
+    def send(self, request: TrafficRequest, scheduled: float) -> None:
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        failed: bool
+        try:
+            response = session.request(
+                request.method,
+                urllib.parse.urljoin(self.base_url, request.path),
+                json=request.body,
+                headers=self.headers,
+                timeout=30,
+            )
+            failed = response.status_code >= 400
+        except requests.RequestException:
+            failed = True
+        latency: float = time.monotonic() - scheduled
+        with self._lock:
+            self.latencies.setdefault(request.endpoint, []).append(latency)
+            if failed:
+                self.errors[request.endpoint] = self.errors.get(request.endpoint, 0) + 1
+
+    def report(self, elapsed: float) -> Dict[str, EndpointReport]:
+        latencies: Dict[str, List[float]] = dict(self.latencies)
+        latencies[TOTAL] = [
+            latency for values in self.latencies.values() for latency in values
+        ]
+        errors: Dict[str, int] = {**self.errors, TOTAL: sum(self.errors.values())}
+        reports: Dict[str, EndpointReport] = {}
+        for endpoint, values in sorted(latencies.items()):
+            values.sort()
+            reports[endpoint] = EndpointReport(
+                requests=len(values),
+                errors=errors.get(endpoint, 0),
+                throughput=len(values) / elapsed if elapsed else 0.0,
+                p50=percentile(values, 50),
+                p95=percentile(values, 95),
+                p99=percentile(values, 99),
+            )
+        return reports
+
+
+def save_baseline(reports: Dict[str, EndpointReport], path: Path) -> None:
+    with open(path, "w", encoding="utf-8") as baseline:
+        json.dump({key: asdict(report) for key, report in reports.items()}, baseline)
+
+
+def load_baseline(path: Path) -> Dict[str, EndpointReport]:
+    with open(path, encoding="utf-8") as baseline:
+        return {
+            key: EndpointReport(**report) for key, report in json.load(baseline).items()
+        }
+
+
+def compare_reports(
+    reports: Dict[str, EndpointReport],
+    baseline: Dict[str, EndpointReport],
+    tolerance: float,
+) -> List[str]:
+    regressions: List[str] = []
+    for endpoint, report in reports.items():
+        previous: Optional[EndpointReport] = baseline.get(endpoint)
+        if previous is None:
+            continue
+        if previous.p95 and report.p95 > previous.p95 * (1 + tolerance):
+            regressions.append(
+                f"{endpoint}: p95 {previous.p95 * 1000:.1f}ms -> "
+                f"{report.p95 * 1000:.1f}ms"
+            )
+        previous_error_rate: float = previous.errors / max(previous.requests, 1)
+        error_rate: float = report.errors / max(report.requests, 1)
+        if error_rate > previous_error_rate + ERROR_RATE_MARGIN:
+            regressions.append(
+                f"{endpoint}: error rate {previous_error_rate:.1%} -> {error_rate:.1%}"
+            )
+        if report.throughput < previous.throughput * (1 - tolerance):
+            regressions.append(
+                f"{endpoint}: throughput {previous.throughput:.1f}/s -> "
+                f"{report.throughput:.1f}/s"
+            )
+    return regressions
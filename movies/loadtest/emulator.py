@@ -0,0 +1,157 @@
+import json
+import random
+import re
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+@dataclass
+class EmulatorConfig:
+    latency: float = 0.05
+    jitter: float = 0.02
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    fixtures_dir: Path = FIXTURES_DIR
+
+
+class TmdbFixtures:
+    def __init__(self, fixtures_dir: Path) -> None:
+        self.payloads: Dict[str, Dict[str, Any]] = {}
+        for name in ("movie", "videos", "credits", "person", "search", "genres"):
+            path: Path = fixtures_dir / f"{name}.json"
+            if not path.exists():
+                path = FIXTURES_DIR / f"{name}.json"
+            self.payloads[name] = json.loads(path.read_text(encoding="utf-8"))
+        self.routes: List[Tuple[Pattern[str], Callable[..., Dict[str, Any]]]] = [
+            (re.compile(r"^movie/(\d+)$"), self.movie),
+            (re.compile(r"^movie/(\d+)/videos$"), self.videos),
+            (re.compile(r"^movie/(\d+)/credits$"), self.credits),
+            (re.compile(r"^person/(\d+)$"), self.person),
+            (re.compile(r"^search/movie$"), self.search),
+            (re.compile(r"^genre/movie/list$"), self.genres),
+        ]
+
+    def resolve(self, path: str, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        for pattern, handler in self.routes:
+            match = pattern.match(path)
+            if match:
+                return handler(params, *match.groups())
+        return None
+
+    def movie(self, params: Dict[str, str], movie_id: str) -> Dict[str, Any]:
+        movie: Dict[str, Any] = self.with_id("movie", movie_id, "title")
+        appended: List[str] = params.get("append_to_response", "").split(",")
+        if "videos" in appended:
+            movie["videos"] = self.videos(params, movie_id)
+        if "credits" in appended:
+            movie["credits"] = self.credits(params, movie_id)
+        return movie
+
+    def videos(self, params: Dict[str, str], movie_id: str) -> Dict[str, Any]:
+        return {**self.payloads["videos"], "id": int(movie_id)}
+
+    def credits(self, params: Dict[str, str], movie_id: str) -> Dict[str, Any]:
+        return {**self.payloads["credits"], "id": int(movie_id)}
+
+    def person(self, params: Dict[str, str], person_id: str) -> Dict[str, Any]:
+        return self.with_id("person", person_id, "name")
+
+    def search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        return self.payloads["search"]
+
+    def genres(self, params: Dict[str, str]) -> Dict[str, Any]:
+        return self.payloads["genres"]
+
+    def with_id(self, name: str, resource_id: str, label: str) -> Dict[str, Any]:
+        # Distinct labels keep (title, release_date) and (name, birthday) unique
+        payload: Dict[str, Any] = dict(self.payloads[name])
+        if payload["id"] != int(resource_id):
+            payload[label] = f"{payload[label]} {resource_id}"
+        payload["id"] = int(resource_id)
+        return payload
+
+
+class TmdbEmulatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config: EmulatorConfig
+    fixtures: TmdbFixtures
+
+    def do_GET(self) -> None:
+        delay: float = max(0.0, random.gauss(self.config.latency, self.config.jitter))
+        time.sleep(delay)
+        url = urllib.parse.urlsplit(self.path)
+        path: str = url.path.strip("/")
+        # Accept both "/movie/1" and "/3/movie/1" base URIs
+        path = path[2:] if path.startswith("3/") else path
+        params: Dict[str, str] = dict(urllib.parse.parse_qsl(url.query))
+
+        chance: float = random.random()
+        if chance < self.config.throttle_rate:
+            self.send_json(
+                429,
+                {"status_code": 25, "status_message": "Request count over limit"},
+                {"Retry-After": str(self.config.retry_after)},
+            )
+            return
+        if chance < self.config.throttle_rate + self.config.error_rate:
+            self.send_json(500, {"status_code": 11, "status_message": "Internal error"})
+            return
+        payload: Optional[Dict[str, Any]] = self.fixtures.resolve(path, params)
+        if payload is None:
+            self.send_json(404, {"status_code": 34, "status_message": "Not found"})
+            return
+        self.send_json(200, payload)
+
+    def send_json(
+        self,
+        status_code: int,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        body: bytes = json.dumps(payload).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class TmdbEmulator:
+    def __init__(self, config: EmulatorConfig, host: str = "127.0.0.1", port: int = 0):
+        handler = type(
+            "ConfiguredTmdbEmulatorHandler",
+            (TmdbEmulatorHandler,),
+            {"config": config, "fixtures": TmdbFixtures(config.fixtures_dir)},
+        )
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_uri(self) -> str:
+        host, port = self.server.socket.getsockname()[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def serve_forever(self) -> None:
+        self.server.serve_forever()
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,218 @@
+import asyncio
+import gzip
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from asgiref.sync import sync_to_async
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections, transaction
+from rest_framework.exceptions import APIException, NotFound
+
+from movies.models import Movie, MovieGenre
+from movies.serializers.movie_serializer import BulkTmdbMovieSerializer
+from movies.services.async_tmdb_service import AsyncTmdbService
+from movies.services.movie_listing_service import MovieListingService
+from movies.services.movie_service import MovieService
+from movies.utils.async_tmdb_client import AsyncTmdbClient
+from movies.utils.genre_registry import GenreRegistry
+
+# (line number in the export, TMDB movie id)
+ExportLine = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class WriteResult:
+    imported: int
+    skipped: int
+    failed: int
+    last_line: int
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream TMDB movie ids from an NDJSON export (optionally gzip'd), "
+        "fetch them concurrently and bulk-load them in batches"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="NDJSON file, one TMDB id or object per line")
+        parser.add_argument("--parallelism", type=int, default=8)
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument(
+            "--checkpoint", help="Checkpoint file, defaults to <path>.checkpoint"
+        )
+        parser.add_argument(
+            "--resume", action="store_true", help="Continue after the checkpoint"
+        )
+
+    def handle(self, *args, **options) -> None:
+        self.checkpoint_path: str = (
+            options["checkpoint"] or f"{options['path']}.checkpoint"
+        )
+        start_line: int = self.load_checkpoint() if options["resume"] else 0
+        self.imported = 0
+        self.skipped = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        asyncio.run(
+            self.run_import(
+                self.read_export(options["path"], start_line),
+                options["parallelism"],
+                options["batch_size"],
+            )
+        )
+        self.stdout.write(self.style.SUCCESS(self.progress("Finished")))
+
+    @staticmethod
+    def read_export(path: str, start_line: int) -> Iterator[ExportLine]:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as export:
+            for line_number, line in enumerate(export, start=1):
+                if line_number <= start_line or not line.strip():
+                    continue
+                record = json.loads(line)
+                tmdb_id: int = record["id"] if isinstance(record, dict) else int(record)
+                yield line_number, tmdb_id
+
+    async def run_import(
+        self, export: Iterator[ExportLine], parallelism: int, batch_size: int
+    ) -> None:
+        service = AsyncTmdbService()
+        # Every movie is fetched once, caching them would only evict hot entries
+        service.cache = None
+        semaphore = asyncio.Semaphore(parallelism)
+        # Writes get their own thread and connection, so the next batch's lookup
+        # and fetches are not queued behind the pending write
+        writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tmdb-import-write"
+        )
+        write_batch = sync_to_async(
+            self.write_batch, thread_sensitive=False, executor=writer
+        )
+        pending_write: "Optional[asyncio.Future[WriteResult]]" = None
+        try:
+            while True:
+                batch: List[ExportLine] = list(itertools.islice(export, batch_size))
+                if not batch:
+                    break
+                existing_ids: Set[int] = await sync_to_async(
+                    MovieService.find_existing_tmdb_ids
+                )([tmdb_id for _, tmdb_id in batch])
+                self.skipped += sum(
+                    1 for _, tmdb_id in batch if tmdb_id in existing_ids
+                )
+                payloads: List[Optional[Dict[str, Any]]] = await asyncio.gather(
+                    *[
+                        self.fetch_movie(service, semaphore, tmdb_id)
+                        for _, tmdb_id in batch
+                        if tmdb_id not in existing_ids
+                    ]
+                )
+                # The next batch is fetched while this one is written
+                if pending_write is not None:
+                    self.record_write(await pending_write)
+                pending_write = asyncio.ensure_future(
+                    write_batch(
+                        [payload for payload in payloads if payload], batch[-1][0]
+                    )
+                )
+            if pending_write is not None:
+                self.record_write(await pending_write)
+        finally:
+            await sync_to_async(
+                connections.close_all, thread_sensitive=False, executor=writer
+            )()
+            writer.shutdown()
+            await AsyncTmdbClient.aclose()
+
+    async def fetch_movie(
+        self, service: AsyncTmdbService, semaphore: asyncio.Semaphore, tmdb_id: int
+    ) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            try:
+                return await service.fetch_full_movie(tmdb_id)
+            except NotFound:
+                self.skipped += 1
+            except APIException as e:
+                self.failed += 1
+                self.stderr.write(f"Movie {tmdb_id} failed: {e}")
+            return None
+
+    def write_batch(
+        self, payloads: List[Dict[str, Any]], last_line: int
+    ) -> WriteResult:
+        # Runs on the writer thread, counters are applied on the event loop
+        invalid: int = 0
+        movies: List[Movie] = []
+        movie_genres: Dict[int, List[Dict[str, Any]]] = {}
+        for payload in payloads:
+            serializer = BulkTmdbMovieSerializer(data=payload)
+            try:
+                is_valid: bool = serializer.is_valid()
+            except (StopIteration, IndexError, KeyError):
+                # No director or no trailer in the TMDB payload
+                is_valid = False
+            if not is_valid:
+                invalid += 1
+                continue
+            movies.append(Movie(**serializer.validated_data))
+            movie_genres[payload["id"]] = payload.get("genres", [])
+
+        with transaction.atomic():
+            known_ids: Set[int] = MovieService.find_existing_tmdb_ids(movie_genres)
+            Movie.objects.bulk_create(movies, ignore_conflicts=True)
+            # Rows dropped by ignore_conflicts (an existing tmdb_id, or title and
+            # release date) are not imported and keep their genre links
+            inserted_movies = [
+                (movie_id, tmdb_id)
+                for movie_id, tmdb_id in Movie.objects.filter(
+                    tmdb_id__in=movie_genres
+                ).values_list("id", "tmdb_id")
+                if tmdb_id not in known_ids
+            ]
+            genres: GenreRegistry = GenreRegistry.current()
+            MovieGenre.objects.bulk_create(
+                [
+                    MovieGenre(movie_id=movie_id, genre_id=genre_id)
+                    for movie_id, tmdb_id in inserted_movies
+                    for genre_id in genres.resolve(movie_genres[tmdb_id])
+                ]
+            )
+            MovieListingService.refresh(movie_id for movie_id, _ in inserted_movies)
+        self.save_checkpoint(last_line)
+        return WriteResult(
+            imported=len(inserted_movies),
+            skipped=len(movies) - len(inserted_movies),
+            failed=invalid,
+            last_line=last_line,
+        )
+
+    def record_write(self, result: WriteResult) -> None:
+        self.imported += result.imported
+        self.skipped += result.skipped
+        self.failed += result.failed
+        self.stdout.write(self.progress(f"Line {result.last_line}"))
+
+    def progress(self, prefix: str) -> str:
+        elapsed: float = max(time.monotonic() - self.started, 1e-6)
+        return (
+            f"{prefix}: {self.imported} imported, {self.skipped} skipped, "
+            f"{self.failed} failed ({self.imported / elapsed:.1f} movies/s)"
+        )
+
+    def load_checkpoint(self) -> int:
+        if not os.path.exists(self.checkpoint_path):
+            return 0
+        with open(self.checkpoint_path, encoding="utf-8") as checkpoint:
+            return json.load(checkpoint)["line"]
+
+    def save_checkpoint(self, line: int) -> None:
+        temporary_path: str = f"{self.checkpoint_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as checkpoint:
+            json.dump({"line": line}, checkpoint)
+        os.replace(temporary_path, self.checkpoint_path)
@@ -0,0 +1,76 @@
+from pathlib import Path
+from typing import Dict, List
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from movies.loadtest.driver import (
+    TRAFFIC_FILE,
+    EndpointReport,
+    LoadDriver,
+    TrafficRequest,
+    compare_reports,
+    load_baseline,
+    read_traffic,
+    save_baseline,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay a JSONL traffic file ({method, path, body} per line) against the app "
+        "at a target rate and report latency percentiles per endpoint"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--traffic", type=Path, default=TRAFFIC_FILE)
+        parser.add_argument("--rps", type=float, default=20.0)
+        parser.add_argument("--duration", type=float, default=30.0)
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--token", help="JWT access token sent as Bearer")
+        parser.add_argument("--save-baseline", type=Path)
+        parser.add_argument("--baseline", type=Path)
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.1,
+            help="Allowed relative p95/throughput change against the baseline",
+        )
+
+    def handle(self, *args, **options) -> None:
+        traffic: List[TrafficRequest] = read_traffic(options["traffic"])
+        if not traffic:
+            raise CommandError(f"No requests in {options['traffic']}")
+        driver = LoadDriver(
+            base_url=options["base_url"],
+            traffic=traffic,
+            rps=options["rps"],
+            duration=options["duration"],
+            concurrency=options["concurrency"],
+            token=options["token"],
+        )
+        reports: Dict[str, EndpointReport] = driver.run()
+        self.print_reports(reports)
+
+        if options["save_baseline"]:
+            save_baseline(reports, options["save_baseline"])
+            self.stdout.write(f"Baseline saved to {options['save_baseline']}")
+        if options["baseline"]:
+            regressions: List[str] = compare_reports(
+                reports, load_baseline(options["baseline"]), options["tolerance"]
+            )
+            if regressions:
+                raise CommandError("Regressions:\n" + "\n".join(regressions))
+            self.stdout.write(self.style.SUCCESS("No regressions against baseline"))
+
+    def print_reports(self, reports: Dict[str, EndpointReport]) -> None:
+        self.stdout.write(
+            f"{'endpoint':<40} {'requests':>8} {'errors':>6} {'rps':>7} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for endpoint, report in reports.items():
+            self.stdout.write(
+                f"{endpoint:<40} {report.requests:>8} {report.errors:>6} "
+                f"{report.throughput:>7.1f} {report.p50 * 1000:>8.1f} "
+                f"{report.p95 * 1000:>8.1f} {report.p99 * 1000:>8.1f}"
+            )
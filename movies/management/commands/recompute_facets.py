@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from movies.services.movie_facet_service import MovieFacetService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the movie facet counters from movie_listing to repair drift"
+
+    def handle(self, *args, **options) -> None:
+        counters: int = MovieFacetService.recompute()
+        self.stdout.write(self.style.SUCCESS(f"Recomputed {counters} facet counters"))
@@ -0,0 +1,21 @@
+from typing import Any, Dict, List
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from movies.models import Genre
+from movies.services.tmdb_service import TmdbService
+
+
+class Command(BaseCommand):
+    help = "Create or update genres from the TMDB genre list, keyed by name"
+
+    def handle(self, *args, **options) -> None:
+        tmdb_genres: List[Dict[str, Any]] = TmdbService().fetch_genre_list()["genres"]
+        with transaction.atomic():
+            for tmdb_genre in tmdb_genres:
+                # Saving through the model fires the signals that refresh the registry
+                Genre.objects.update_or_create(
+                    name=tmdb_genre["name"], defaults={"tmdb_id": tmdb_genre["id"]}
+                )
+        self.stdout.write(self.style.SUCCESS(f"Synced {len(tmdb_genres)} genres"))
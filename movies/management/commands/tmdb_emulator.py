@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from movies.loadtest.emulator import FIXTURES_DIR, EmulatorConfig, TmdbEmulator
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve TMDB fixture payloads locally with injected latency, errors and 429s; "
+        "point the app at it with TMDB_URI=http://<host>:<port>/"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8001)
+        parser.add_argument("--latency-ms", type=float, default=50.0)
+        parser.add_argument("--jitter-ms", type=float, default=20.0)
+        parser.add_argument("--error-rate", type=float, default=0.0)
+        parser.add_argument("--throttle-rate", type=float, default=0.0)
+        parser.add_argument("--retry-after", type=int, default=1)
+        parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+
+    def handle(self, *args, **options) -> None:
+        config = EmulatorConfig(
+            latency=options["latency_ms"] / 1000,
+            jitter=options["jitter_ms"] / 1000,
+            error_rate=options["error_rate"],
+            throttle_rate=options["throttle_rate"],
+            retry_after=options["retry_after"],
+            fixtures_dir=options["fixtures"],
+        )
+        emulator = TmdbEmulator(config, options["host"], options["port"])
+        self.stdout.write(f"TMDB emulator listening on {emulator.base_uri}")
+        try:
+            emulator.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            emulator.stop()
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0029_alter_movie_tmdb_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="genre",
+            name="tmdb_id",
+            field=models.IntegerField(null=True, unique=True),
+        ),
+    ]
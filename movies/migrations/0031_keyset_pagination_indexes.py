@@ -0,0 +1,32 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0030_genre_tmdb_id"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="actor",
+            index=models.Index(fields=["name", "id"], name="actor_name_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="actor",
+            index=models.Index(
+                fields=["date_of_birth", "id"], name="actor_date_of_birth_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(fields=["title", "id"], name="movie_title_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["release_date", "id"], name="movie_release_date_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def clear_ambiguous_tmdb_ids(apps, schema_editor):
+    Movie = apps.get_model("movies", "Movie")
+    # Movies created before 0028 got the placeholder tmdb_id 0
+    Movie.objects.filter(tmdb_id=0).update(tmdb_id=None)
+    duplicates = (
+        Movie.objects.exclude(tmdb_id=None)
+        .values("tmdb_id")
+        .annotate(count=Count("id"), first_id=Min("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        Movie.objects.filter(tmdb_id=duplicate["tmdb_id"]).exclude(
+            id=duplicate["first_id"]
+        ).update(tmdb_id=None)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0031_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="movie",
+            name="tmdb_id",
+            field=models.IntegerField(null=True),
+        ),
+        migrations.RunPython(clear_ambiguous_tmdb_ids, migrations.RunPython.noop),
+    ]
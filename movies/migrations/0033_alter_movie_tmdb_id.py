@@ -0,0 +1,17 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0032_clear_ambiguous_movie_tmdb_ids"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="movie",
+            name="tmdb_id",
+            field=models.IntegerField(null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0033_alter_movie_tmdb_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="actors",
+            field=models.ManyToManyField(blank=True, to="movies.actor"),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="genres",
+            field=models.ManyToManyField(
+                blank=True, through="movies.MovieGenre", to="movies.genre"
+            ),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:31
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# (table, weighted columns) kept in sync with CatalogSearchService
+SEARCH_VECTORS = {
+    "movie": (("title", "A"), ("tagline", "B"), ("description", "C")),
+    "actor": (("name", "A"), ("biography", "B")),
+}
+TRIGRAM_COLUMNS = {"movie": "title", "actor": "name"}
+
+
+def search_vector_sql(table, prefix):
+    return " || ".join(
+        f"setweight(to_tsvector('english', coalesce({prefix}{column}, '')), '{weight}')"
+        for column, weight in SEARCH_VECTORS[table]
+    )
+
+
+def create_search_objects(apps, schema_editor):
+    # GIN indexes and plpgsql triggers only exist on PostgreSQL, SQLite falls back
+    # to LIKE matching in CatalogSearchService
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, weighted_columns in SEARCH_VECTORS.items():
+        columns = ", ".join(column for column, _ in weighted_columns)
+        schema_editor.execute(
+            f"CREATE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$ "
+            f"BEGIN NEW.search_vector := {search_vector_sql(table, 'NEW.')}; "
+            f"RETURN NEW; END $$ LANGUAGE plpgsql"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_vector_trigger "
+            f"BEFORE INSERT OR UPDATE OF {columns} ON {table} "
+            f"FOR EACH ROW EXECUTE PROCEDURE {table}_search_vector_update()"
+        )
+        schema_editor.execute(
+            f"UPDATE {table} SET search_vector = {search_vector_sql(table, '')}"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX {table}_search_vector_idx ON {table} USING gin (search_vector)"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX {table}_{TRIGRAM_COLUMNS[table]}_trgm_idx ON {table} "
+            f"USING gin ({TRIGRAM_COLUMNS[table]} gin_trgm_ops)"
+        )
+
+
+def drop_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table in SEARCH_VECTORS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_vector_idx")
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS {table}_{TRIGRAM_COLUMNS[table]}_trgm_idx"
+        )
+        schema_editor.execute(
+            f"DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table}"
+        )
+        schema_editor.execute(f"DROP FUNCTION IF EXISTS {table}_search_vector_update()")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0034_movie_actors_genres"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="actor",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_search_objects, drop_search_objects),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:35
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_movie_listing(apps, schema_editor):
+    Movie = apps.get_model("movies", "Movie")
+    MovieGenre = apps.get_model("movies", "MovieGenre")
+    MovieListing = apps.get_model("movies", "MovieListing")
+    movie_ids = list(Movie.objects.order_by("id").values_list("id", flat=True))
+    for start in range(0, len(movie_ids), BACKFILL_BATCH_SIZE):
+        ids = movie_ids[start : start + BACKFILL_BATCH_SIZE]
+        genres = defaultdict(list)
+        for movie_id, name in (
+            MovieGenre.objects.filter(movie_id__in=ids)
+            .order_by("genre__name")
+            .values_list("movie_id", "genre__name")
+            .distinct()
+        ):
+            genres[movie_id].append(name)
+        lead_actors = defaultdict(list)
+        for movie_id, name in (
+            Movie.actors.through.objects.filter(movie_id__in=ids)
+            .order_by("id")
+            .values_list("movie_id", "actor__name")
+        ):
+            if len(lead_actors[movie_id]) < settings.MOVIE_LISTING_LEAD_ACTORS:
+                lead_actors[movie_id].append(name)
+        MovieListing.objects.bulk_create(
+            MovieListing(
+                movie_id=movie.id,
+                title=movie.title,
+                release_date=movie.release_date,
+                duration=movie.duration,
+                description=movie.description,
+                poster_key=movie.poster_key,
+                director=movie.director,
+                genres=genres[movie.id],
+                lead_actors=lead_actors[movie.id],
+            )
+            for movie in Movie.objects.filter(id__in=ids)
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0035_catalog_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieListing",
+            fields=[
+                (
+                    "movie",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="listing",
+                        serialize=False,
+                        to="movies.movie",
+                    ),
+                ),
+                ("title", models.CharField(max_length=100)),
+                ("release_date", models.DateField()),
+                ("duration", models.IntegerField(default=0)),
+                (
+                    "description",
+                    models.CharField(blank=True, default="", max_length=500),
+                ),
+                ("poster_key", models.CharField(default="", max_length=500)),
+                ("director", models.CharField(default="", max_length=50)),
+                ("genres", models.JSONField(default=list)),
+                ("lead_actors", models.JSONField(default=list)),
+            ],
+            options={
+                "db_table": "movie_listing",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(fields=["title", "movie"], name="listing_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["release_date", "movie"], name="listing_release_date_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_movie_listing, migrations.RunPython.noop),
+    ]
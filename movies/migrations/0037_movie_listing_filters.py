@@ -0,0 +1,122 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:44
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+LISTING_FILTER_FIELDS = ("status", "adult", "revenue", "box_office")
+
+
+def backfill_listing_filters(apps, schema_editor):
+    Movie = apps.get_model("movies", "Movie")
+    MovieListing = apps.get_model("movies", "MovieListing")
+    movies = Movie.objects.filter(pk=OuterRef("movie_id"))
+    MovieListing.objects.update(
+        **{field: Subquery(movies.values(field)[:1]) for field in LISTING_FILTER_FIELDS}
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0036_movielisting"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="movie",
+            name="movie_title_id_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="movie",
+            name="movie_release_date_id_idx",
+        ),
+        migrations.AddField(
+            model_name="movielisting",
+            name="adult",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name="movielisting",
+            name="box_office",
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddField(
+            model_name="movielisting",
+            name="revenue",
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddField(
+            model_name="movielisting",
+            name="status",
+            field=models.CharField(default="", max_length=50),
+        ),
+        migrations.RunPython(backfill_listing_filters, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="moviegenre",
+            index=models.Index(
+                fields=["genre", "movie"], name="movie_genre_genre_movie_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(fields=["revenue", "movie"], name="listing_revenue_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["box_office", "movie"], name="listing_box_office_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["duration", "movie"], name="listing_duration_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["adult", "title", "movie"], name="listing_adult_title_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["adult", "release_date", "movie"],
+                name="listing_adult_release_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["adult", "revenue", "movie"], name="listing_adult_revenue_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["adult", "box_office", "movie"],
+                name="listing_adult_box_office_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["status", "release_date", "movie"],
+                name="listing_status_release_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["status", "adult", "release_date", "movie"],
+                name="listing_status_adult_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["director", "release_date", "movie"],
+                name="listing_director_release_idx",
+            ),
+        ),
+    ]
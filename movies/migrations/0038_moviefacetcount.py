@@ -0,0 +1,77 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:46
+
+from collections import Counter
+
+from django.db import migrations, models
+
+
+def backfill_facet_counts(apps, schema_editor):
+    MovieListing = apps.get_model("movies", "MovieListing")
+    MovieFacetCount = apps.get_model("movies", "MovieFacetCount")
+    counts = Counter()
+    for genres, release_date, status, director in MovieListing.objects.values_list(
+        "genres", "release_date", "status", "director"
+    ).iterator():
+        values = [("genre", name) for name in genres]
+        values.append(("decade", str(release_date.year // 10 * 10)))
+        values.extend(
+            (facet, value)
+            for facet, value in (("status", status), ("director", director))
+            if value
+        )
+        for facet, value in values:
+            counts[("", "", facet, value)] += 1
+            for filter_facet, filter_value in values:
+                counts[(filter_facet, filter_value, facet, value)] += 1
+    MovieFacetCount.objects.bulk_create(
+        (
+            MovieFacetCount(
+                filter_facet=filter_facet,
+                filter_value=filter_value,
+                facet=facet,
+                value=value,
+                count=count,
+            )
+            for (filter_facet, filter_value, facet, value), count in counts.items()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0037_movie_listing_filters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieFacetCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("filter_facet", models.CharField(default="", max_length=20)),
+                ("filter_value", models.CharField(default="", max_length=100)),
+                ("facet", models.CharField(max_length=20)),
+                ("value", models.CharField(max_length=100)),
+                ("count", models.IntegerField(default=0)),
+            ],
+            options={
+                "db_table": "movie_facet_count",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="moviefacetcount",
+            constraint=models.UniqueConstraint(
+                fields=("filter_facet", "filter_value", "facet", "value"),
+                name="movie_facet_count_key",
+            ),
+        ),
+        migrations.RunPython(backfill_facet_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:46
+
+from collections import Counter
+
+from django.db import migrations
+
+
+def rebuild_facet_counts(apps, schema_editor):
+    MovieListing = apps.get_model("movies", "MovieListing")
+    MovieFacetCount = apps.get_model("movies", "MovieFacetCount")
+    counts = Counter()
+    rows = MovieListing.objects.values_list(
+        "genres", "release_date", "status", "director", "adult"
+    )
+    for genres, release_date, status, director, adult in rows.iterator():
+        values = [("genre", name) for name in genres]
+        values.append(("decade", str(release_date.year // 10 * 10)))
+        values.extend(
+            (facet, value)
+            for facet, value in (("status", status), ("director", director))
+            if value
+        )
+        values.append(("adult", "true" if adult else "false"))
+        for facet, value in values:
+            counts[("", "", facet, value)] += 1
+            for filter_facet, filter_value in values:
+                counts[(filter_facet, filter_value, facet, value)] += 1
+    MovieFacetCount.objects.all().delete()
+    MovieFacetCount.objects.bulk_create(
+        (
+            MovieFacetCount(
+                filter_facet=filter_facet,
+                filter_value=filter_value,
+                facet=facet,
+                value=value,
+                count=count,
+            )
+            for (filter_facet, filter_value, facet, value), count in counts.items()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0038_moviefacetcount"),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_facet_counts, migrations.RunPython.noop),
+    ]
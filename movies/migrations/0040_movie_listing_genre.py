@@ -0,0 +1,172 @@
+# Generated by Django 4.1.13 on 2026-10-18 13:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_listing_genres(apps, schema_editor):
+    MovieListing = apps.get_model("movies", "MovieListing")
+    MovieGenre = apps.get_model("movies", "MovieGenre")
+    MovieListingGenre = apps.get_model("movies", "MovieListingGenre")
+    listings = MovieListing.objects.in_bulk()
+    links = MovieGenre.objects.filter(movie_id__in=listings).values_list(
+        "movie_id", "genre_id"
+    )
+    MovieListingGenre.objects.bulk_create(
+        (
+            MovieListingGenre(
+                listing_id=movie_id,
+                genre_id=genre_id,
+                title=listings[movie_id].title,
+                release_date=listings[movie_id].release_date,
+                duration=listings[movie_id].duration,
+                revenue=listings[movie_id].revenue,
+                box_office=listings[movie_id].box_office,
+            )
+            for movie_id, genre_id in links.distinct().iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0039_adult_facet_counts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieListingGenre",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(max_length=100)),
+                ("release_date", models.DateField()),
+                ("duration", models.IntegerField(default=0)),
+                ("revenue", models.FloatField(default=0.0)),
+                ("box_office", models.FloatField(default=0.0)),
+            ],
+            options={
+                "db_table": "movie_listing_genre",
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name="moviegenre",
+            name="movie_genre_genre_movie_idx",
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(fields=["adult", "movie"], name="listing_adult_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(fields=["status", "movie"], name="listing_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["status", "title", "movie"], name="listing_status_title_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["status", "revenue", "movie"], name="listing_status_revenue_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["status", "box_office", "movie"],
+                name="listing_status_box_office_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["director", "movie"], name="listing_director_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["director", "title", "movie"], name="listing_director_title_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["director", "revenue", "movie"],
+                name="listing_director_revenue_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielisting",
+            index=models.Index(
+                fields=["director", "box_office", "movie"],
+                name="listing_director_box_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="movielistinggenre",
+            name="genre",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, to="movies.genre"
+            ),
+        ),
+        migrations.AddField(
+            model_name="movielistinggenre",
+            name="listing",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="genre_entries",
+                to="movies.movielisting",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielistinggenre",
+            index=models.Index(fields=["genre", "listing"], name="listing_genre_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="movielistinggenre",
+            index=models.Index(
+                fields=["genre", "title", "listing"], name="listing_genre_title_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielistinggenre",
+            index=models.Index(
+                fields=["genre", "release_date", "listing"],
+                name="listing_genre_release_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielistinggenre",
+            index=models.Index(
+                fields=["genre", "revenue", "listing"], name="listing_genre_revenue_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielistinggenre",
+            index=models.Index(
+                fields=["genre", "box_office", "listing"],
+                name="listing_genre_box_office_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movielistinggenre",
+            index=models.Index(
+                fields=["genre", "duration", "listing"],
+                name="listing_genre_duration_idx",
+            ),
+        ),
+        migrations.RunPython(build_listing_genres, migrations.RunPython.noop),
+    ]
@@ -2,3 +2,6 @@ from .actor import *
 from .genre import *
 from .movie import *
 from .movie_genre import *
+from .movie_listing import *
+from .movie_facet_count import *
+from .movie_listing_genre import *
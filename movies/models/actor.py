@@ -1,6 +1,7 @@
 from datetime import date, datetime
 from typing import Union
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from movies.payload.tmdb_actor_response import TmdbActorResponse
@@ -15,10 +16,18 @@ class Actor(models.Model):
     date_of_birth = models.DateField(default=date.today)
     imdb_path = models.CharField(max_length=50, default="")
     poster_path = models.CharField(max_length=500, default="")
+    # Maintained by a database trigger on PostgreSQL, see migration 0035
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         db_table = "actor"
         unique_together = ("name", "date_of_birth")
+        indexes = [
+            models.Index(fields=["name", "id"], name="actor_name_id_idx"),
+            models.Index(
+                fields=["date_of_birth", "id"], name="actor_date_of_birth_id_idx"
+            ),
+        ]
 
     @classmethod
     def from_response(cls, actor_details: dict):
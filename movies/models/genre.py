@@ -5,6 +5,7 @@ from django.db import models
 
 class Genre(models.Model):
     name = models.CharField(max_length=50, unique=True)
+    tmdb_id = models.IntegerField(null=True, unique=True)
 
     class Meta:
         db_table = "genre"
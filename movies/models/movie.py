@@ -1,5 +1,6 @@
 from datetime import date
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 
@@ -18,7 +19,13 @@ class Movie(models.Model):
     tagline = models.CharField(max_length=500, default="", blank=True)
     trailer_key = models.CharField(max_length=500, default="")
     director = models.CharField(max_length=50, default="")
-    tmdb_id = models.IntegerField()
+    tmdb_id = models.IntegerField(null=True, unique=True)
+    # Maintained by a database trigger on PostgreSQL, see migration 0035
+    search_vector = SearchVectorField(null=True, editable=False)
+    actors = models.ManyToManyField("movies.Actor", blank=True)
+    genres = models.ManyToManyField(
+        "movies.Genre", through="movies.MovieGenre", blank=True
+    )
 
     class Meta:
         db_table = "movie"
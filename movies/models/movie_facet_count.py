@@ -0,0 +1,21 @@
+from django.db import models
+
+
+# Pre-aggregated facet counts over movie_listing. Rows with an empty filter_facet
+# count the whole catalog, the others count movies sharing the filter value.
+# Kept current by MovieFacetService, rebuilt by the recompute_facets command
+class MovieFacetCount(models.Model):
+    filter_facet = models.CharField(max_length=20, default="")
+    filter_value = models.CharField(max_length=100, default="")
+    facet = models.CharField(max_length=20)
+    value = models.CharField(max_length=100)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "movie_facet_count"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["filter_facet", "filter_value", "facet", "value"],
+                name="movie_facet_count_key",
+            )
+        ]
@@ -0,0 +1,91 @@
+from django.db import models
+
+from movies.models import Movie
+
+
+# Read model for list endpoints, rebuilt by MovieListingService when a movie,
+# its genre links or its cast change
+class MovieListing(models.Model):
+    movie = models.OneToOneField(
+        Movie, primary_key=True, on_delete=models.CASCADE, related_name="listing"
+    )
+    title = models.CharField(max_length=100)
+    release_date = models.DateField()
+    duration = models.IntegerField(default=0)
+    description = models.CharField(max_length=500, default="", blank=True)
+    poster_key = models.CharField(max_length=500, default="")
+    director = models.CharField(max_length=50, default="")
+    status = models.CharField(max_length=50, default="")
+    adult = models.BooleanField(default=True)
+    revenue = models.FloatField(default=0.0)
+    box_office = models.FloatField(default=0.0)
+    genres = models.JSONField(default=list)
+    lead_actors = models.JSONField(default=list)
+
+    class Meta:
+        db_table = "movie_listing"
+        # Equality filters, then the sort column (which also takes range filters),
+        # then the movie as keyset tiebreaker, which alone is the id sort.
+        # MovieListingService only accepts filter and sort combinations matching one
+        # of these or of the MovieListingGenre indexes
+        indexes = [
+            models.Index(fields=["title", "movie"], name="listing_title_idx"),
+            models.Index(
+                fields=["release_date", "movie"], name="listing_release_date_idx"
+            ),
+            models.Index(fields=["revenue", "movie"], name="listing_revenue_idx"),
+            models.Index(fields=["box_office", "movie"], name="listing_box_office_idx"),
+            models.Index(fields=["duration", "movie"], name="listing_duration_idx"),
+            models.Index(fields=["adult", "movie"], name="listing_adult_idx"),
+            models.Index(
+                fields=["adult", "title", "movie"], name="listing_adult_title_idx"
+            ),
+            models.Index(
+                fields=["adult", "release_date", "movie"],
+                name="listing_adult_release_date_idx",
+            ),
+            models.Index(
+                fields=["adult", "revenue", "movie"], name="listing_adult_revenue_idx"
+            ),
+            models.Index(
+                fields=["adult", "box_office", "movie"],
+                name="listing_adult_box_office_idx",
+            ),
+            models.Index(fields=["status", "movie"], name="listing_status_idx"),
+            models.Index(
+                fields=["status", "title", "movie"], name="listing_status_title_idx"
+            ),
+            models.Index(
+                fields=["status", "release_date", "movie"],
+                name="listing_status_release_idx",
+            ),
+            models.Index(
+                fields=["status", "revenue", "movie"],
+                name="listing_status_revenue_idx",
+            ),
+            models.Index(
+                fields=["status", "box_office", "movie"],
+                name="listing_status_box_office_idx",
+            ),
+            models.Index(
+                fields=["status", "adult", "release_date", "movie"],
+                name="listing_status_adult_idx",
+            ),
+            models.Index(fields=["director", "movie"], name="listing_director_idx"),
+            models.Index(
+                fields=["director", "title", "movie"],
+                name="listing_director_title_idx",
+            ),
+            models.Index(
+                fields=["director", "release_date", "movie"],
+                name="listing_director_release_idx",
+            ),
+            models.Index(
+                fields=["director", "revenue", "movie"],
+                name="listing_director_revenue_idx",
+            ),
+            models.Index(
+                fields=["director", "box_office", "movie"],
+                name="listing_director_box_idx",
+            ),
+        ]
@@ -0,0 +1,43 @@
+from django.db import models
+
+from movies.models import Genre, MovieListing
+
+
+# One row per genre of a listed movie, carrying the listing's sort columns so the
+# genre filter is served in sort order by a (genre, sort column, listing) index.
+# Rebuilt with the listing by MovieListingService
+class MovieListingGenre(models.Model):
+    listing = models.ForeignKey(
+        MovieListing, on_delete=models.CASCADE, related_name="genre_entries"
+    )
+    genre = models.ForeignKey(Genre, on_delete=models.CASCADE)
+    title = models.CharField(max_length=100)
+    release_date = models.DateField()
+    duration = models.IntegerField(default=0)
+    revenue = models.FloatField(default=0.0)
+    box_office = models.FloatField(default=0.0)
+
+    class Meta:
+        db_table = "movie_listing_genre"
+        indexes = [
+            models.Index(fields=["genre", "listing"], name="listing_genre_idx"),
+            models.Index(
+                fields=["genre", "title", "listing"], name="listing_genre_title_idx"
+            ),
+            models.Index(
+                fields=["genre", "release_date", "listing"],
+                name="listing_genre_release_date_idx",
+            ),
+            models.Index(
+                fields=["genre", "revenue", "listing"],
+                name="listing_genre_revenue_idx",
+            ),
+            models.Index(
+                fields=["genre", "box_office", "listing"],
+                name="listing_genre_box_office_idx",
+            ),
+            models.Index(
+                fields=["genre", "duration", "listing"],
+                name="listing_genre_duration_idx",
+            ),
+        ]
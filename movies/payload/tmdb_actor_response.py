@@ -4,6 +4,15 @@ from typing import Union
 
 @dataclass
 class TmdbActorResponse:
+    __slots__ = (
+        "name",
+        "biography",
+        "place_of_birth",
+        "birthday",
+        "imdb_id",
+        "profile_path",
+    )
+
     name: str
     biography: str
     place_of_birth: Union[str, None]
@@ -4,10 +4,14 @@ from typing import Union
 
 @dataclass
 class TmdbMovieSearchResponse:
+    __slots__ = ("id", "title", "poster_path")
+
+    id: int
     title: str
     poster_path: Union[str, None]
 
     def __init__(self, **kwargs) -> None:
+        self.id = kwargs["id"]
         self.title = kwargs["title"]
         poster_path: Union[str, None] = kwargs["poster_path"]
         self.poster_path = (
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 
 @dataclass
 class UserCreateRequest:
+    __slots__ = ("username", "password")
+
     username: str
     password: str
 
@@ -1,16 +1,17 @@
 from rest_framework import serializers
 
 from movies.models.actor import Actor
+from movies.serializers.sparse_fieldset import SparseFieldsetSerializer
 
 
-class FullActorSerializer(serializers.ModelSerializer[Actor]):
+class FullActorSerializer(SparseFieldsetSerializer[Actor]):
     class Meta:
         id = serializers.ReadOnlyField()
         model = Actor
-        fields = "__all__"
+        exclude = ("search_vector",)
 
 
-class SimpleActorSerializer(serializers.ModelSerializer[Actor]):
+class SimpleActorSerializer(SparseFieldsetSerializer[Actor]):
     class Meta:
         id = serializers.ReadOnlyField()
         model = Actor
@@ -1,7 +1,7 @@
 from rest_framework import serializers
 
 from movies.models.genre import Genre
-from movies.utils.genre_name import GenreName
+from movies.utils.genre_name import GENRE_NAMES, GenreName
 
 
 class FullGenreSerializer(serializers.ModelSerializer[Genre]):
@@ -11,4 +11,4 @@ class FullGenreSerializer(serializers.ModelSerializer[Genre]):
         fields = ("name",)
 
     def validate_name(self, genre):
-        return genre if genre in GenreName.values() else GenreName.OTHER
\ No newline at end of file
+        return genre if genre in GENRE_NAMES else GenreName.OTHER.value
\ No newline at end of file
@@ -4,6 +4,8 @@ from typing import List, Any
 from rest_framework import serializers
 
 from movies.models.movie import Movie
+from movies.models.movie_listing import MovieListing
+from movies.serializers.sparse_fieldset import SparseFieldsetSerializer
 
 
 class FullTmdbMovieSerializer(serializers.ModelSerializer[Movie]):
@@ -77,11 +79,18 @@ class FullTmdbMovieSerializer(serializers.ModelSerializer[Movie]):
         return trailer_key
 
 
-class FullMovieSerializer(serializers.ModelSerializer[Movie]):
+class BulkTmdbMovieSerializer(FullTmdbMovieSerializer):
+    # Bulk imports drop duplicates in bulk_create, skip the per-row unique check query
+    def get_validators(self) -> List[Any]:
+        return []
+
+
+class FullMovieSerializer(SparseFieldsetSerializer[Movie]):
     class Meta:
         id = serializers.ReadOnlyField()
         model = Movie
-        fields = "__all__"
+        # Relations are loaded on demand, see MovieService.get_movie
+        exclude = ("actors", "genres", "search_vector")
 
 
 class SimpleMovieSerializer(serializers.ModelSerializer[Movie]):
@@ -98,7 +107,32 @@ class SimpleMovieSerializer(serializers.ModelSerializer[Movie]):
         )
 
 
+class MovieListingSerializer(SparseFieldsetSerializer[MovieListing]):
+    id = serializers.IntegerField(source="movie_id", read_only=True)
+
+    class Meta:
+        model = MovieListing
+        fields = (
+            "id",
+            "title",
+            "release_date",
+            "duration",
+            "description",
+            "poster_key",
+            "director",
+            "status",
+            "adult",
+            "revenue",
+            "box_office",
+            "genres",
+            "lead_actors",
+        )
+
+
 class SearchMovieSerializer(serializers.ModelSerializer[Movie]):
+    # Serializes TmdbMovieSearchResponse records, Movie has no poster_path column
+    poster_path = serializers.CharField(allow_null=True, read_only=True)
+
     class Meta:
         id = serializers.ReadOnlyField()
         model = Movie
@@ -0,0 +1,40 @@
+from typing import Any, List, Optional, Sequence, Set, Type, TypeVar
+
+from django.db.models import Model
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+_MT = TypeVar("_MT", bound=Model)
+
+
+class SparseFieldsetSerializer(serializers.ModelSerializer[_MT]):
+    def __init__(self, *args: Any, fields: Optional[Sequence[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Optional[List[str]]:
+    if fields is None:
+        return None
+    requested: List[str] = list(
+        dict.fromkeys(name.strip() for name in fields.split(",") if name.strip())
+    )
+    if not requested or any(name not in allowed for name in requested):
+        raise ValidationError({"fields": f"Supported fields: {', '.join(allowed)}"})
+    return requested
+
+
+def only_columns(
+    serializer_class: Type[SparseFieldsetSerializer[Any]], fields: Sequence[str]
+) -> List[str]:
+    # Model columns behind the requested fields, for QuerySet.only()
+    model_fields: Set[str] = set()
+    for field in serializer_class.Meta.model._meta.concrete_fields:
+        model_fields.update((field.name, field.attname))
+    return [
+        field.source
+        for field in serializer_class(fields=fields).fields.values()
+        if field.source in model_fields
+    ]
@@ -1,37 +1,77 @@
-from typing import List, Union, Mapping, Any
+from datetime import date
+from typing import List, Mapping, Any, Dict, Optional, Tuple
 
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections, router
 from django.db.models import QuerySet
 from django.forms.models import model_to_dict
 from django.http import JsonResponse, HttpRequest
 from rest_framework import status
-from rest_framework.exceptions import ValidationError, NotFound, ErrorDetail
+from rest_framework.exceptions import NotFound
 from rest_framework.parsers import JSONParser
 from rest_framework.utils.serializer_helpers import ReturnDict
 
 from movies.models.actor import Actor
 from movies.models.movie import Movie
 from movies.payload.actor_update_request import ActorUpdateRequest
-from movies.payload.tmdb_actor_response import TmdbActorResponse
 from movies.serializers.actor_serializer import FullActorSerializer, SimpleActorSerializer
 from movies.serializers.movie_serializer import SimpleMovieSerializer
+from movies.serializers.sparse_fieldset import only_columns, parse_fields
+from movies.services.async_tmdb_service import AsyncTmdbService
 from movies.services.tmdb_service import TmdbService
+from movies.utils.keyset_pagination import KeysetPage, KeysetPaginator
+from movies.utils.tmdb_event_loop import TmdbEventLoop
+
+
+ACTOR_COLUMNS = (
+    "name",
+    "biography",
+    "place_of_birth",
+    "date_of_birth",
+    "imdb_path",
+    "poster_path",
+)
+# ?fields= whitelists per endpoint
+ACTOR_FIELDS = ("id",) + ACTOR_COLUMNS
+ACTOR_LIST_FIELDS = SimpleActorSerializer.Meta.fields
 
 
 class ActorService:
+    actor_paginator: KeysetPaginator = KeysetPaginator(
+        {"id": "pk", "name": "name", "date_of_birth": "date_of_birth"}
+    )
+
     def __init__(self) -> None:
         self.tmdb_service = TmdbService()
+        self.async_tmdb_service = AsyncTmdbService()
         super().__init__()
 
-    def get_actor(self, actor_id: int) -> ReturnDict:
-        actor: Actor = self.find_actor(actor_id)
-        return FullActorSerializer(actor).data
-
-    def get_all_actors(self) -> ReturnDict:
-        actors: QuerySet[Actor] = Actor.objects.all()
-        actor_serializer: SimpleActorSerializer = SimpleActorSerializer(
-            actors, many=True
+    def get_actor(self, actor_id: int, fields: Optional[str] = None) -> ReturnDict:
+        requested: Optional[List[str]] = parse_fields(fields, ACTOR_FIELDS)
+        if requested is None:
+            return FullActorSerializer(self.find_actor(actor_id)).data
+        actor: Actor = self.find_actor(
+            actor_id,
+            Actor.objects.only(*only_columns(FullActorSerializer, requested)),
+        )
+        return FullActorSerializer(actor, fields=requested).data
+
+    def get_all_actors(
+        self,
+        sort: str = "id",
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        fields: Optional[str] = None,
+    ) -> KeysetPage:
+        return self.actor_paginator.paginate(
+            Actor.objects.all(),
+            SimpleActorSerializer,
+            sort,
+            cursor,
+            page_size,
+            parse_fields(fields, ACTOR_LIST_FIELDS),
         )
-        return actor_serializer.data
 
     def create_actor(self, request: HttpRequest) -> ReturnDict:
         actor_id: int = JSONParser().parse(request)["actor_id"]
@@ -73,9 +113,13 @@ class ActorService:
         actor: Any = self.find_actor(actor_id)
         actor.movie_set.add(movie)
 
-    def find_actor(self, actor_id: int) -> Actor:
+    def find_actor(
+        self, actor_id: int, actors: Optional[QuerySet[Actor]] = None
+    ) -> Actor:
         try:
-            actor: Actor = Actor.objects.get(pk=actor_id)
+            actor: Actor = (actors if actors is not None else Actor.objects).get(
+                pk=actor_id
+            )
         except Actor.DoesNotExist:
             raise NotFound(
                 detail={"detail": f"Actor with id {actor_id} does not exist"}
@@ -83,39 +127,59 @@ class ActorService:
         return actor
 
     def get_or_create_actors(self, cast_members: List[int]) -> List[Actor]:
-        actor_ids: List[int] = cast_members[:5]
-        movie_actors: List[Actor] = []
-        for actor_id in actor_ids:
+        actor_ids: List[int] = cast_members[: settings.MOVIE_CAST_LIMIT]
+        actors_details: List[Dict[str, Any]] = TmdbEventLoop.run(
+            self.async_tmdb_service.fetch_actors(actor_ids)
+        )
+        movie_actors: Dict[Tuple[str, date], Actor] = {}
+        for actor_details in actors_details:
+            actor: Actor = Actor.from_response(actor_details)
             try:
-                actor_details: TmdbActorResponse = self.tmdb_service.fetch_actor(
-                    actor_id
-                )
-            except NotFound:
+                actor.clean_fields()
+            except DjangoValidationError:
                 continue
-            actor: Actor = Actor.from_response(actor_details)
-            actor_serializer: FullActorSerializer = FullActorSerializer(
-                data=model_to_dict(actor)
+            movie_actors.setdefault((actor.name, actor.date_of_birth), actor)
+        return self.save_actors(list(movie_actors.values()))
+
+    def save_actors(self, actors: List[Actor]) -> List[Actor]:
+        if not actors:
+            return []
+        unique_actors: Dict[Tuple[str, date], Actor] = {}
+        for actor in actors:
+            unique_actors.setdefault((actor.name, actor.date_of_birth), actor)
+        # One INSERT ... ON CONFLICT statement returns new and existing rows alike;
+        # bulk_create(update_conflicts=True) only returns primary keys from Django 5.0
+        fields = [
+            field
+            for field in Actor._meta.concrete_fields
+            if field.column in ACTOR_COLUMNS
+        ]
+        database: str = router.db_for_write(Actor)
+        connection = connections[database]
+        quote_name = connection.ops.quote_name
+        columns: str = ", ".join(quote_name(field.column) for field in fields)
+        row: str = f"({', '.join(['%s'] * len(fields))})"
+        params: List[Any] = [
+            field.get_db_prep_save(getattr(actor, field.attname), connection)
+            for actor in unique_actors.values()
+            for field in fields
+        ]
+        saved_actors: Dict[Tuple[str, date], Actor] = {
+            (actor.name, actor.date_of_birth): actor
+            for actor in Actor.objects.db_manager(database).raw(
+                f"INSERT INTO {quote_name(Actor._meta.db_table)} ({columns}) "
+                f"VALUES {', '.join([row] * len(unique_actors))} "
+                # A no-op update keeps manual edits but still returns the row
+                f"ON CONFLICT (name, date_of_birth) DO UPDATE SET name = EXCLUDED.name "
+                f"RETURNING {quote_name(Actor._meta.pk.column)}, {columns}",
+                params,
             )
-            try:
-                actor_serializer.is_valid(raise_exception=True)
-            except ValidationError as ex:
-                non_field_errors_key: Union[ErrorDetail, None] = (
-                    ex.args[0]["non_field_errors"][0]
-                    if "non_field_errors" in ex.args[0]
-                    else None
-                )
-                if non_field_errors_key and non_field_errors_key.code == "unique":
-                    existing_actor: Actor = Actor.objects.get(
-                        name=actor_details.name, date_of_birth=actor_details.birthday
-                    )
-                    movie_actors.append(existing_actor)
-                    continue
-                else:
-                    continue
-            actor = actor_serializer.save()
-            movie_actors.append(actor)
-
-        return movie_actors
+        }
+        return [
+            saved_actors[(actor.name, actor.date_of_birth)]
+            for actor in actors
+            if (actor.name, actor.date_of_birth) in saved_actors
+        ]
 
     def find_movie_actors(self, movie_id):
         try:
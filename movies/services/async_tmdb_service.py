@@ -0,0 +1,96 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from rest_framework.exceptions import NotFound
+
+from movies.services.tmdb_service import TmdbService
+from movies.utils.async_tmdb_client import AsyncTmdbClient
+from movies.utils import tmdb_json
+from movies.utils.single_flight import AsyncSingleFlight
+from movies.utils.tmdb_cache import TmdbResponseCache
+
+
+class AsyncTmdbService:
+    single_flight: AsyncSingleFlight = AsyncSingleFlight()
+
+    def __init__(self) -> None:
+        self.client = AsyncTmdbClient()
+        self.cache: Optional[TmdbResponseCache] = TmdbResponseCache.for_services()
+        super().__init__()
+
+    async def fetch_actor(self, actor_id: int) -> Dict[str, Any]:
+        return await self.get_json("actor", path=f"person/{actor_id}")
+
+    async def fetch_actors(
+        self, actor_ids: List[int], concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(concurrency or settings.TMDB_CAST_CONCURRENCY)
+
+        async def fetch_actor(actor_id: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.fetch_actor(actor_id)
+
+        results: List[Any] = await asyncio.gather(
+            *[fetch_actor(actor_id) for actor_id in actor_ids],
+            return_exceptions=True,
+        )
+        actors: List[Dict[str, Any]] = []
+        for result in results:
+            if isinstance(result, NotFound):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            actors.append(result)
+        return actors
+
+    async def fetch_movie(self, movie_id: int) -> Dict[str, Any]:
+        return await self.get_json("movie", path=f"movie/{movie_id}")
+
+    async def fetch_full_movie(self, movie_id: int) -> Dict[str, Any]:
+        movie: Dict[str, Any] = await self.get_json(
+            "movie",
+            path=f"movie/{movie_id}",
+            params={"append_to_response": "videos,credits"},
+        )
+        TmdbService.cache_full_movie_parts(self.cache, movie_id, movie)
+        return TmdbService.flatten_full_movie(movie)
+
+    async def fetch_movie_trailer(self, movie_id) -> Dict[str, Any]:
+        return await self.get_json("videos", path=f"movie/{movie_id}/videos")
+
+    async def fetch_movie_credits(self, movie_id: int) -> Dict[str, Any]:
+        return await self.get_json("credits", path=f"movie/{movie_id}/credits")
+
+    async def movie_search(self, search_query) -> Dict[str, Any]:
+        return await self.get_json(
+            "search", path="search/movie", params={"query": search_query}
+        )
+
+    async def fetch_genre_list(self) -> Dict[str, Any]:
+        return await self.get_json("genre", path="genre/movie/list")
+
+    async def get_json(
+        self, endpoint: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        key: str = TmdbResponseCache.make_key(path, params)
+        content: Optional[bytes] = (
+            self.cache.get(key) if self.cache is not None else None
+        )
+        if content is not None:
+            return tmdb_json.loads(content)
+        # Merged callers share one payload, none of them may modify it
+        return await self.single_flight.do(
+            key, lambda: self.fetch_payload(endpoint, key, path, params)
+        )
+
+    async def fetch_payload(
+        self, endpoint: str, key: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        response_content: bytes = (
+            await self.client.get(path=path, params=params)
+        ).content
+        payload: Dict[str, Any] = tmdb_json.decode_projected(endpoint, response_content)
+        if self.cache is not None:
+            self.cache.put(endpoint, key, tmdb_json.dumps(payload))
+        return payload
@@ -0,0 +1,99 @@
+from typing import Optional, Tuple, Type
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramSimilarity,
+)
+from django.db import connection
+from django.db.models import Case, F, FloatField, Model, Q, QuerySet, Value, When
+from django.db.models.functions import Cast
+from rest_framework.serializers import BaseSerializer
+
+from movies.models.actor import Actor
+from movies.models.movie import Movie
+from movies.serializers.actor_serializer import SimpleActorSerializer
+from movies.serializers.movie_serializer import SimpleMovieSerializer
+from movies.utils.keyset_pagination import KeysetPage, KeysetPaginator
+
+# Must match the text search configuration used by the triggers in migration 0035
+SEARCH_CONFIG = "english"
+# Weighted columns in relevance order, the first one also carries the trigram index
+MOVIE_SEARCH_FIELDS: Tuple[str, ...] = ("title", "tagline", "description")
+ACTOR_SEARCH_FIELDS: Tuple[str, ...] = ("name", "biography")
+
+
+class CatalogSearchService:
+    paginator: KeysetPaginator = KeysetPaginator({"relevance": "relevance"})
+
+    def search_movies(
+        self, query: str, cursor: Optional[str] = None, page_size: Optional[int] = None
+    ) -> KeysetPage:
+        return self.search(
+            Movie, MOVIE_SEARCH_FIELDS, SimpleMovieSerializer, query, cursor, page_size
+        )
+
+    def search_actors(
+        self, query: str, cursor: Optional[str] = None, page_size: Optional[int] = None
+    ) -> KeysetPage:
+        return self.search(
+            Actor, ACTOR_SEARCH_FIELDS, SimpleActorSerializer, query, cursor, page_size
+        )
+
+    def search(
+        self,
+        model: Type[Model],
+        fields: Tuple[str, ...],
+        serializer_class: Type[BaseSerializer],
+        query: str,
+        cursor: Optional[str],
+        page_size: Optional[int],
+    ) -> KeysetPage:
+        query = " ".join(query.split())
+        if not query:
+            return KeysetPage([], None)
+        matches: QuerySet = (
+            self.rank_full_text(model, fields, query)
+            if connection.vendor == "postgresql"
+            else self.rank_substring(model, fields, query)
+        )
+        return self.paginator.paginate(
+            matches, serializer_class, "-relevance", cursor, page_size
+        )
+
+    @staticmethod
+    def rank_full_text(
+        model: Type[Model], fields: Tuple[str, ...], query: str
+    ) -> QuerySet:
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+        # Both predicates are served by GIN indexes: @@ on search_vector and % on the
+        # trigram column, which keeps typo'd titles and names matching
+        return model.objects.filter(
+            Q(search_vector=search_query)
+            | Q(**{f"{fields[0]}__trigram_similar": query})
+        ).annotate(
+            # float8 so the relevance survives the round trip through a cursor
+            relevance=Cast(
+                SearchRank(F("search_vector"), search_query)
+                + TrigramSimilarity(fields[0], query),
+                FloatField(),
+            )
+        )
+
+    @staticmethod
+    def rank_substring(
+        model: Type[Model], fields: Tuple[str, ...], query: str
+    ) -> QuerySet:
+        # SQLite has no text search, rank by the weight of the first matching column
+        matches = Q()
+        for field in fields:
+            matches |= Q(**{f"{field}__icontains": query})
+        weights = [
+            When(
+                **{f"{field}__icontains": query}, then=Value(float(len(fields) - index))
+            )
+            for index, field in enumerate(fields)
+        ]
+        return model.objects.filter(matches).annotate(
+            relevance=Case(*weights, default=Value(0.0), output_field=FloatField())
+        )
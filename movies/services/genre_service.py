@@ -1,7 +1,16 @@
-from movies.models import Genre
+from typing import Any, Dict, Iterable, List
+
+from movies.utils.genre_registry import GenreRegistry
 
 
 class GenreService:
-    def get_genres_by_name(self, movie_genres):
-        return list(Genre.objects.filter(name__in=movie_genres).all().values())
+    def get_genres_by_name(self, movie_genres: Iterable[str]) -> List[Dict[str, Any]]:
+        ids_by_name = GenreRegistry.current().ids_by_name
+        return [
+            {"id": ids_by_name[name], "name": name}
+            for name in movie_genres
+            if name in ids_by_name
+        ]
 
+    def resolve_genre_ids(self, tmdb_genres: Iterable[Dict[str, Any]]) -> List[int]:
+        return GenreRegistry.current().resolve(tmdb_genres)
@@ -0,0 +1,217 @@
+from collections import Counter
+from datetime import date
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from rest_framework.exceptions import ValidationError
+
+from movies.models import MovieFacetCount, MovieListing
+
+FACETS = ("genre", "decade", "status", "director", "adult")
+FACET_SOURCE_FIELDS = ("genres", "release_date", "status", "director", "adult")
+# Movie list filters that narrow the counts, release years must span one decade
+FACET_FILTERS = (
+    "genre",
+    "director",
+    "status",
+    "adult",
+    "release_year_min",
+    "release_year_max",
+)
+RECOMPUTE_BATCH_SIZE = 1000
+UPSERT_BATCH_SIZE = 500
+FACET_KEY_FIELDS = ("filter_facet", "filter_value", "facet", "value")
+
+FacetValue = Tuple[str, str]
+# (filter facet, filter value, facet, value), empty filter for the whole catalog
+FacetKey = Tuple[str, str, str, str]
+
+
+def facet_values(listing: Mapping[str, Any]) -> List[FacetValue]:
+    release_date: date = listing["release_date"]
+    values: List[FacetValue] = [("genre", name) for name in listing["genres"]]
+    values.append(("decade", str(release_date.year // 10 * 10)))
+    values.extend(
+        (facet, listing[facet]) for facet in ("status", "director") if listing[facet]
+    )
+    values.append(("adult", "true" if listing["adult"] else "false"))
+    return values
+
+
+def facet_counts(listings: Iterable[Mapping[str, Any]]) -> Counter[FacetKey]:
+    # Every value counts once globally and once under each value of the same movie,
+    # which answers "counts for the current filter" for a single active filter
+    counts: Counter[FacetKey] = Counter()
+    for listing in listings:
+        values: List[FacetValue] = facet_values(listing)
+        for facet, value in values:
+            counts[("", "", facet, value)] += 1
+            for filter_facet, filter_value in values:
+                counts[(filter_facet, filter_value, facet, value)] += 1
+    return counts
+
+
+class MovieFacetService:
+    def get_facets(self, filters: Mapping[str, str]) -> Dict[str, List[Dict[str, Any]]]:
+        unknown: List[str] = sorted(set(filters) - set(FACET_FILTERS))
+        if unknown:
+            raise ValidationError(
+                {
+                    name: f"Supported filters: {', '.join(FACET_FILTERS)}"
+                    for name in unknown
+                }
+            )
+        active: List[FacetValue] = [
+            (facet, filters[facet])
+            for facet in ("genre", "director", "status")
+            if facet in filters
+        ]
+        if "adult" in filters:
+            active.append(("adult", self.parse_flag(filters["adult"])))
+        if "release_year_min" in filters or "release_year_max" in filters:
+            active.append(("decade", self.parse_decade(filters)))
+        # Counters are kept per single filter value, combinations are counted from
+        # the listing rows they select
+        if len(active) > 1:
+            return self.combined_facets(filters)
+        filter_facet, filter_value = active[0] if active else ("", "")
+        return self.group(
+            MovieFacetCount.objects.filter(
+                filter_facet=filter_facet, filter_value=filter_value, count__gt=0
+            )
+            .order_by("facet", "-count", "value")
+            .values_list("facet", "value", "count")
+        )
+
+    @classmethod
+    def combined_facets(
+        cls, filters: Mapping[str, str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        # Imported here, the listing service updates the counters through this module
+        from movies.services.movie_listing_service import MovieListingService
+
+        # Same index-backed filter and sort combinations as the movie list, the
+        # rows read are capped so a broad combination can't scan the catalog
+        listing_service: MovieListingService = MovieListingService()
+        sorts: List[str] = listing_service.supported_sorts(filters)
+        limit: int = settings.FACET_COMBINED_MAX_MOVIES
+        rows: List[Dict[str, Any]] = list(
+            listing_service.filter_listings(
+                MovieListing.objects.all(), sorts[0] if sorts else "id", filters
+            ).values(*FACET_SOURCE_FIELDS)[: limit + 1]
+        )
+        if len(rows) > limit:
+            raise ValidationError(
+                {
+                    "filters": f"Combined filters match more than {limit} movies, "
+                    "narrow them down or use a single filter"
+                }
+            )
+        counts: Counter[FacetValue] = Counter(
+            value for row in rows for value in facet_values(row)
+        )
+        return cls.group(
+            (facet, value, count)
+            for (facet, value), count in sorted(
+                counts.items(), key=lambda item: (item[0][0], -item[1], item[0][1])
+            )
+        )
+
+    @staticmethod
+    def group(rows: Iterable[Tuple[str, str, int]]) -> Dict[str, List[Dict[str, Any]]]:
+        facets: Dict[str, List[Dict[str, Any]]] = {facet: [] for facet in FACETS}
+        for facet, value, count in rows:
+            facets[facet].append({"value": value, "count": count})
+        return facets
+
+    @staticmethod
+    def parse_flag(value: str) -> str:
+        if value.lower() not in ("true", "false"):
+            raise ValidationError({"adult": "Must be true or false"})
+        return value.lower()
+
+    @staticmethod
+    def parse_decade(filters: Mapping[str, str]) -> str:
+        try:
+            start: int = int(filters.get("release_year_min", ""))
+            end: int = int(filters.get("release_year_max", ""))
+        except ValueError:
+            raise ValidationError(
+                {"filters": "Facet counts need both release_year_min and max"}
+            )
+        if start % 10 or end != start + 9:
+            raise ValidationError(
+                {"filters": "Release years must span one decade, e.g. 1990 to 1999"}
+            )
+        return str(start)
+
+    @classmethod
+    def listings_changed(
+        cls,
+        before: Iterable[Mapping[str, Any]],
+        after: Iterable[Mapping[str, Any]],
+    ) -> None:
+        deltas: Counter[FacetKey] = facet_counts(after)
+        deltas.subtract(facet_counts(before))
+        cls.apply(deltas)
+
+    @classmethod
+    def listing_deleted(cls, sender: Any, instance: MovieListing, **kwargs) -> None:
+        cls.listings_changed([cls.facet_source(instance)], [])
+
+    @staticmethod
+    def facet_source(listing: MovieListing) -> Dict[str, Any]:
+        return {field: getattr(listing, field) for field in FACET_SOURCE_FIELDS}
+
+    @classmethod
+    def apply(cls, deltas: Counter[FacetKey]) -> None:
+        changes: List[Tuple[FacetKey, int]] = [
+            (key, delta) for key, delta in deltas.items() if delta
+        ]
+        if not changes:
+            return
+        # Upserts add the deltas, concurrent writers never overwrite each other
+        database: str = router.db_for_write(MovieFacetCount)
+        connection = connections[database]
+        quote_name = connection.ops.quote_name
+        table: str = quote_name(MovieFacetCount._meta.db_table)
+        columns: str = ", ".join(map(quote_name, FACET_KEY_FIELDS))
+        for start in range(0, len(changes), UPSERT_BATCH_SIZE):
+            batch: List[Tuple[FacetKey, int]] = changes[
+                start : start + UPSERT_BATCH_SIZE
+            ]
+            params: List[Any] = [
+                param for key, delta in batch for param in (*key, delta)
+            ]
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {table} ({columns}, {quote_name('count')}) "
+                    f"VALUES {', '.join(['(%s, %s, %s, %s, %s)'] * len(batch))} "
+                    f"ON CONFLICT ({columns}) DO UPDATE SET {quote_name('count')} "
+                    f"= {table}.{quote_name('count')} + EXCLUDED.{quote_name('count')}",
+                    params,
+                )
+
+    @classmethod
+    def recompute(cls) -> int:
+        counts: Counter[FacetKey] = Counter()
+        with transaction.atomic():
+            last_id: Optional[int] = 0
+            while last_id is not None:
+                batch: List[Dict[str, Any]] = list(
+                    MovieListing.objects.filter(movie_id__gt=last_id)
+                    .order_by("movie_id")
+                    .values("movie_id", *FACET_SOURCE_FIELDS)[:RECOMPUTE_BATCH_SIZE]
+                )
+                counts.update(facet_counts(batch))
+                last_id = batch[-1]["movie_id"] if batch else None
+            MovieFacetCount.objects.all().delete()
+            MovieFacetCount.objects.bulk_create(
+                (
+                    MovieFacetCount(**dict(zip(FACET_KEY_FIELDS, key)), count=count)
+                    for key, count in counts.items()
+                ),
+                batch_size=RECOMPUTE_BATCH_SIZE,
+            )
+        return len(counts)
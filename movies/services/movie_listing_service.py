@@ -0,0 +1,354 @@
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Model, QuerySet
+from rest_framework.exceptions import ValidationError
+
+from movies.models import (
+    Actor,
+    Genre,
+    Movie,
+    MovieGenre,
+    MovieListing,
+    MovieListingGenre,
+)
+from movies.serializers.movie_serializer import MovieListingSerializer
+from movies.serializers.sparse_fieldset import parse_fields
+from movies.services.movie_facet_service import FACET_SOURCE_FIELDS, MovieFacetService
+from movies.utils.genre_registry import GenreRegistry
+from movies.utils.keyset_pagination import KeysetPage, KeysetPaginator
+
+LISTED_MOVIE_FIELDS = (
+    "id",
+    "title",
+    "release_date",
+    "duration",
+    "description",
+    "poster_key",
+    "director",
+    "status",
+    "adult",
+    "revenue",
+    "box_office",
+)
+# Listing columns copied to each MovieListingGenre row of the movie
+LISTING_GENRE_FIELDS = ("title", "release_date", "duration", "revenue", "box_office")
+EQUALITY_FILTERS = ("director", "status", "adult")
+# Query parameter -> (column, lookup), the column must be the sort column
+RANGE_FILTERS = {
+    "release_year_min": ("release_date", "gte"),
+    "release_year_max": ("release_date", "lt"),
+    "duration_min": ("duration", "gte"),
+    "duration_max": ("duration", "lte"),
+}
+# Query parameters of the list endpoint that are not filters
+PAGE_PARAMETERS = ("sort", "cursor", "page_size", "fields")
+# A genre filter sorts and pages on the movie's MovieListingGenre row of that genre,
+# through aliases, a later filter() on the reverse relation would join it again
+GENRE_KEY_PATHS = {
+    "pk": "genre_listing_id",
+    **{field: f"genre_{field}" for field in LISTING_GENRE_FIELDS},
+}
+
+
+def indexed_combinations() -> Set[Tuple[FrozenSet[str], str]]:
+    # (equality columns, sort column) pairs backed by a listing index, an index
+    # ending in an equality column before the tiebreaker backs the id sort
+    combinations: Set[Tuple[FrozenSet[str], str]] = {(frozenset(), "pk")}
+    for model in (MovieListing, MovieListingGenre):
+        for index in model._meta.indexes:
+            *columns, _ = index.fields
+            if columns[-1] in ("genre", *EQUALITY_FILTERS):
+                combinations.add((frozenset(columns), "pk"))
+            else:
+                combinations.add((frozenset(columns[:-1]), columns[-1]))
+    return combinations
+
+
+class MovieListingService:
+    _local = threading.local()
+    paginator: KeysetPaginator = KeysetPaginator(
+        {
+            "id": "pk",
+            "title": "title",
+            "release_date": "release_date",
+            "revenue": "revenue",
+            "box_office": "box_office",
+            "duration": "duration",
+        }
+    )
+    indexed: Set[Tuple[FrozenSet[str], str]] = indexed_combinations()
+
+    def get_page(
+        self,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        fields: Optional[str] = None,
+        filters: Optional[Mapping[str, str]] = None,
+    ) -> KeysetPage:
+        filters = filters or {}
+        sort = sort or self.default_sort(filters)
+        return self.paginator.paginate(
+            self.filter_listings(MovieListing.objects.all(), sort, filters),
+            MovieListingSerializer,
+            sort,
+            cursor,
+            page_size,
+            parse_fields(fields, MovieListingSerializer.Meta.fields),
+            GENRE_KEY_PATHS if "genre" in filters else None,
+        )
+
+    @staticmethod
+    def default_sort(filters: Mapping[str, str]) -> str:
+        # Range filters only work on the sort column, so one filtered column sorts
+        columns: Set[str] = {
+            column for name, (column, _) in RANGE_FILTERS.items() if name in filters
+        }
+        return columns.pop() if len(columns) == 1 else "id"
+
+    def filter_listings(
+        self, listings: QuerySet, sort: str, filters: Mapping[str, str]
+    ) -> QuerySet:
+        supported: List[str] = ["genre", *EQUALITY_FILTERS, *RANGE_FILTERS]
+        unknown: List[str] = sorted(
+            set(filters) - set(supported) - set(PAGE_PARAMETERS)
+        )
+        if unknown:
+            raise ValidationError(
+                {name: f"Supported filters: {', '.join(supported)}" for name in unknown}
+            )
+        self.paginator.parse_sort(sort)
+        lookups: Dict[str, Any] = {}
+        for name in EQUALITY_FILTERS:
+            if name in filters:
+                lookups[name] = filters[name]
+        if "adult" in lookups:
+            lookups["adult"] = self.parse_flag("adult", lookups["adult"])
+        for name, (column, lookup) in RANGE_FILTERS.items():
+            if name not in filters:
+                continue
+            value: int = self.parse_number(name, filters[name])
+            bound: Union[int, date] = value
+            if column == "release_date":
+                # Year bounds become date bounds so the release_date index is used
+                year: int = value + 1 if lookup == "lt" else value
+                if not 1 <= year <= 9999:
+                    raise ValidationError({name: "Must be a year between 1 and 9998"})
+                bound = date(year, 1, 1)
+            lookups[f"{column}__{lookup}"] = bound
+        sorts: List[str] = self.supported_sorts(filters)
+        if sort.lstrip("-") not in sorts:
+            raise ValidationError({"filters": self.unsupported_message(sorts)})
+        if "genre" in filters:
+            genre_id: Optional[int] = GenreRegistry.current().ids_by_name.get(
+                filters["genre"]
+            )
+            if genre_id is None:
+                raise ValidationError({"genre": "Unknown genre"})
+            listings = listings.filter(genre_entries__genre_id=genre_id).alias(
+                **{
+                    f"genre_{field}": F(f"genre_entries__{field}")
+                    for field in ("listing_id", *LISTING_GENRE_FIELDS)
+                }
+            )
+            lookups = {f"genre_{name}": value for name, value in lookups.items()}
+        return listings.filter(**lookups)
+
+    def supported_sorts(self, filters: Mapping[str, str]) -> List[str]:
+        equal: FrozenSet[str] = frozenset(
+            name for name in ("genre", *EQUALITY_FILTERS) if name in filters
+        )
+        range_columns: Set[str] = {
+            column for name, (column, _) in RANGE_FILTERS.items() if name in filters
+        }
+        return [
+            key
+            for key, column in self.paginator.sort_fields.items()
+            if range_columns <= {column} and (equal, column) in self.indexed
+        ]
+
+    @staticmethod
+    def unsupported_message(sorts: List[str]) -> str:
+        if not sorts:
+            return "No sort supports these filters together"
+        return f"Supported sort keys for these filters: {', '.join(sorts)}"
+
+    @staticmethod
+    def parse_flag(name: str, value: str) -> bool:
+        if value.lower() not in ("true", "false"):
+            raise ValidationError({name: "Must be true or false"})
+        return value.lower() == "true"
+
+    @staticmethod
+    def parse_number(name: str, value: str) -> int:
+        try:
+            return int(value)
+        except ValueError:
+            raise ValidationError({name: "Must be an integer"})
+
+    @classmethod
+    def refresh(cls, movie_ids: Iterable[int]) -> None:
+        # A fixed number of queries, however many movies changed
+        ids: Set[int] = set(movie_ids) - cls.deleting_movie_ids()
+        if not ids:
+            return
+        with transaction.atomic():
+            # Locking the movie rows serializes concurrent refreshes of a movie, also
+            # the first one, when there is no listing row to lock yet. Each refresh
+            # then diffs against what the previous one wrote
+            movies: List[Dict[str, Any]] = list(
+                Movie.objects.select_for_update()
+                .filter(pk__in=ids)
+                .order_by("pk")
+                .values(*LISTED_MOVIE_FIELDS)
+            )
+            genres: Dict[int, List[str]] = defaultdict(list)
+            genre_ids: Dict[int, List[int]] = defaultdict(list)
+            for movie_id, genre_id, name in (
+                MovieGenre.objects.filter(movie_id__in=ids)
+                .order_by("genre__name")
+                .values_list("movie_id", "genre_id", "genre__name")
+                .distinct()
+            ):
+                genres[movie_id].append(name)
+                genre_ids[movie_id].append(genre_id)
+            lead_actors: Dict[int, List[str]] = defaultdict(list)
+            for movie_id, name in (
+                Movie.actors.through.objects.filter(movie_id__in=ids)
+                .order_by("id")
+                .values_list("movie_id", "actor__name")
+            ):
+                if len(lead_actors[movie_id]) < settings.MOVIE_LISTING_LEAD_ACTORS:
+                    lead_actors[movie_id].append(name)
+            listings: List[MovieListing] = []
+            for movie in movies:
+                movie_id = movie.pop("id")
+                listings.append(
+                    MovieListing(
+                        movie_id=movie_id,
+                        genres=genres[movie_id],
+                        lead_actors=lead_actors[movie_id],
+                        **movie,
+                    )
+                )
+            before: List[Dict[str, Any]] = list(
+                MovieListing.objects.filter(movie_id__in=ids).values(
+                    *FACET_SOURCE_FIELDS
+                )
+            )
+            MovieListing.objects.bulk_create(
+                listings,
+                update_conflicts=True,
+                unique_fields=["movie"],
+                update_fields=[*LISTED_MOVIE_FIELDS[1:], "genres", "lead_actors"],
+            )
+            MovieListingGenre.objects.filter(listing_id__in=ids).delete()
+            MovieListingGenre.objects.bulk_create(
+                MovieListingGenre(
+                    listing=listing,
+                    genre_id=genre_id,
+                    **{
+                        field: getattr(listing, field) for field in LISTING_GENRE_FIELDS
+                    },
+                )
+                for listing in listings
+                for genre_id in genre_ids[listing.movie_id]
+            )
+            MovieFacetService.listings_changed(
+                before,
+                [MovieFacetService.facet_source(listing) for listing in listings],
+            )
+
+    @classmethod
+    def movie_saved(
+        cls, sender: Any, instance: Movie, raw: bool = False, **kwargs
+    ) -> None:
+        if not raw:
+            cls.refresh([instance.pk])
+
+    @classmethod
+    def movie_genre_changed(cls, sender: Any, instance: MovieGenre, **kwargs) -> None:
+        if not kwargs.get("raw"):
+            cls.refresh([instance.movie_id])
+
+    @classmethod
+    def movie_deleting(cls, sender: Any, instance: Movie, **kwargs) -> None:
+        # Cascaded MovieGenre deletes fire before the movie row is gone, don't let
+        # them recreate its listing
+        cls.deleting_movie_ids().add(instance.pk)
+
+    @classmethod
+    def movie_deleted(cls, sender: Any, instance: Movie, **kwargs) -> None:
+        cls.deleting_movie_ids().discard(instance.pk)
+
+    @classmethod
+    def actor_deleting(cls, sender: Any, instance: Actor, **kwargs) -> None:
+        # Cast links are cascaded without signals, remember whose listings to rebuild
+        instance._listed_movie_ids = list(
+            instance.movie_set.values_list("id", flat=True)
+        )
+
+    @classmethod
+    def actor_deleted(cls, sender: Any, instance: Actor, **kwargs) -> None:
+        cls.refresh(getattr(instance, "_listed_movie_ids", []))
+
+    @classmethod
+    def deleting_movie_ids(cls) -> Set[int]:
+        if not hasattr(cls._local, "deleting_movie_ids"):
+            cls._local.deleting_movie_ids = set()
+        return cls._local.deleting_movie_ids
+
+    @classmethod
+    def cast_changed(
+        cls,
+        sender: Any,
+        instance: Model,
+        action: str,
+        reverse: bool,
+        pk_set: Optional[Set[int]],
+        **kwargs,
+    ) -> None:
+        if action == "pre_clear" and reverse:
+            instance._listed_movie_ids = list(
+                instance.movie_set.values_list("id", flat=True)
+            )
+        elif action in ("post_add", "post_remove"):
+            cls.refresh((pk_set or set()) if reverse else [instance.pk])
+        elif action == "post_clear":
+            cls.refresh(
+                getattr(instance, "_listed_movie_ids", []) if reverse else [instance.pk]
+            )
+
+    @classmethod
+    def actor_saved(
+        cls, sender: Any, instance: Actor, raw: bool = False, **kwargs
+    ) -> None:
+        if not raw:
+            cls.refresh(instance.movie_set.values_list("id", flat=True))
+
+    @classmethod
+    def genre_saved(
+        cls, sender: Any, instance: Genre, raw: bool = False, **kwargs
+    ) -> None:
+        if not raw:
+            cls.refresh(
+                MovieGenre.objects.filter(genre_id=instance.pk).values_list(
+                    "movie_id", flat=True
+                )
+            )
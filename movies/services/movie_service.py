@@ -1,9 +1,13 @@
 import os
-from typing import List, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
-from django.db import transaction
-from rest_framework.exceptions import NotFound
-from rest_framework.utils.serializer_helpers import ReturnDict
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
 
 from movies.models import MovieGenre, Genre
 from movies.models.actor import Actor
@@ -13,59 +17,155 @@ from movies.serializers.genre_serializer import FullGenreSerializer
 from movies.serializers.movie_serializer import (
     FullTmdbMovieSerializer,
     SearchMovieSerializer,
-    SimpleMovieSerializer,
     FullMovieSerializer,
 )
+from movies.serializers.sparse_fieldset import only_columns, parse_fields
 from movies.services.actor_service import ActorService
 from movies.services.genre_service import GenreService
+from movies.services.movie_listing_service import MovieListingService
+from movies.utils.circuit_breaker import CircuitBreaker, TmdbUnavailable
+from movies.utils.keyset_pagination import KeysetPage
+from movies.utils.search_cache import SearchResultCache, normalize_query
+from movies.utils.stale_results import StaleResults
 
 tmdb_key = os.getenv("TMDB_KEY")
 tmdb_uri = "https://api.themoviedb.org/3"
 headers = {"Authorization": "Bearer " + tmdb_key} if tmdb_key else None
+MOVIE_RELATIONS = ("genres", "actors")
+# ?fields= whitelist for movie details, relations are requested with ?include=
+MOVIE_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "box_office",
+    "duration",
+    "release_date",
+    "poster_key",
+    "backdrop_key",
+    "adult",
+    "imdb_key",
+    "revenue",
+    "status",
+    "tagline",
+    "trailer_key",
+    "director",
+    "tmdb_id",
+)
 
 
 class MovieService:
+    search_refresher: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="tmdb-search-refresh"
+    )
+
     def __init__(self, tmdb_service) -> None:
         self.tmdb_service = tmdb_service
         self.actor_service = ActorService()
         self.genre_service = GenreService()
+        self.movie_listing_service = MovieListingService()
 
-    def get_movie(self, movie_id: int) -> dict:
-        return FullMovieSerializer(self.find_movie(movie_id)).data
+    def get_movie(
+        self, movie_id: int, include: Iterable[str] = (), fields: Optional[str] = None
+    ) -> Dict[str, Any]:
+        relations: List[str] = list(dict.fromkeys(include))
+        unknown: List[str] = [name for name in relations if name not in MOVIE_RELATIONS]
+        if unknown:
+            raise ValidationError(
+                {"include": f"Supported relations: {', '.join(MOVIE_RELATIONS)}"}
+            )
+        requested: Optional[List[str]] = parse_fields(fields, MOVIE_FIELDS)
+        movies: QuerySet[Movie] = Movie.objects.prefetch_related(*relations)
+        if requested is not None:
+            movies = movies.only(*only_columns(FullMovieSerializer, requested))
+        # One query for the movie plus one per included relation
+        movie: Movie = self.find_movie(movie_id, movies)
+        movie_data: Dict[str, Any] = dict(
+            FullMovieSerializer(movie, fields=requested).data
+        )
+        if "genres" in relations:
+            movie_data["genres"] = FullGenreSerializer(
+                movie.genres.all(), many=True
+            ).data
+        if "actors" in relations:
+            movie_data["actors"] = self.actor_service.serialize_to_simple_actors(movie)
+        return movie_data
 
-    def get_all_movies(self) -> List[Dict]:
-        return SimpleMovieSerializer(Movie.objects.all(), many=True).data
+    def get_all_movies(
+        self,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        fields: Optional[str] = None,
+        filters: Optional[Mapping[str, str]] = None,
+    ) -> KeysetPage:
+        return self.movie_listing_service.get_page(
+            sort, cursor, page_size, fields, filters
+        )
 
-    def create_movie(self, movie_id: int) -> dict:
+    def create_movie(self, movie_id: int) -> Tuple[Dict[str, Any], bool]:
+        existing_movie: Optional[Movie] = Movie.objects.filter(tmdb_id=movie_id).first()
+        if existing_movie is not None:
+            return self.created_movie_data(existing_movie), False
         movie_request = self.prepare_movie_data(movie_id)
         serializer = FullTmdbMovieSerializer(data=movie_request)
         serializer.is_valid(raise_exception=True)
-        movie: Movie = serializer.save()
+        try:
+            with transaction.atomic():
+                movie: Movie = serializer.save()
+        except IntegrityError:
+            # A concurrent request created the same TMDB movie after our lookup, or
+            # the catalog already holds this title and release date under another id
+            data: Dict[str, Any] = serializer.validated_data
+            existing_movie = Movie.objects.filter(
+                Q(tmdb_id=movie_id)
+                | Q(title=data["title"], release_date=data["release_date"])
+            ).first()
+            if existing_movie is None:
+                raise
+            return self.created_movie_data(existing_movie), False
+        self.link_genres(movie.id, movie_request.get("genres", []))
         # TODO: return id directly from serializer .data
-        return {"id": movie.id, **serializer.validated_data}
+        return {"id": movie.id, **serializer.validated_data}, True
+
+    @staticmethod
+    def created_movie_data(movie: Movie) -> Dict[str, Any]:
+        # Same fields as a fresh import, relations are left to ?include= on GET
+        return dict(FullMovieSerializer(movie).data)
+
+    @staticmethod
+    def find_existing_tmdb_ids(tmdb_ids: Iterable[int]) -> Set[int]:
+        return set(
+            Movie.objects.filter(tmdb_id__in=tmdb_ids).values_list("tmdb_id", flat=True)
+        )
 
     def add_genres_to_movie(self, movie_id):
         movie: Movie = self.find_movie(movie_id)
         tmdb_movie = self.tmdb_service.fetch_movie(movie.tmdb_id)
-        genre_names = [genre["name"] for genre in tmdb_movie["genres"]]
-        genres = self.genre_service.get_genres_by_name(genre_names)
+        self.link_genres(movie_id, tmdb_movie["genres"])
+
+    def link_genres(self, movie_id: int, tmdb_genres: List[Dict[str, Any]]) -> None:
+        genre_ids = self.genre_service.resolve_genre_ids(tmdb_genres)
+        linked_genres = set(
+            MovieGenre.objects.filter(movie_id=movie_id).values_list(
+                "genre_id", flat=True
+            )
+        )
         movie_genres = [
-            MovieGenre(movie_id=movie_id, genre_id=genre["id"]) for genre in genres
+            MovieGenre(movie_id=movie_id, genre_id=genre_id)
+            for genre_id in genre_ids
+            if genre_id not in linked_genres
         ]
-        MovieGenre.objects.bulk_create(movie_genres)
+        if movie_genres:
+            MovieGenre.objects.bulk_create(movie_genres)
+            MovieListingService.refresh([movie_id])
 
-    def get_genres_from_movie(self, movie_id):
-        movie_genres = list(MovieGenre.objects.filter(movie_id=movie_id).all().values())
-        genres_id = [movie_genre["genre_id"] for movie_genre in movie_genres]
+    def get_genres_from_movie(self, movie_id: int) -> ReturnList:
         return FullGenreSerializer(
-            Genre.objects.filter(id__in=genres_id), many=True
+            Genre.objects.filter(moviegenre__movie_id=movie_id).distinct(), many=True
         ).data
 
     def prepare_movie_data(self, movie_id: int) -> dict:
-        movie_details: dict = self.tmdb_service.fetch_movie(movie_id)
-        movie_trailer: dict = self.tmdb_service.fetch_movie_trailer(movie_id)
-        movie_credits: dict = self.tmdb_service.fetch_movie_credits(movie_id)
-        return {**movie_details, **movie_credits, **movie_trailer}
+        return self.tmdb_service.fetch_full_movie(movie_id)
 
     def update_movie(self, movie_id: int, update_request: dict) -> ReturnDict:
         movie: Movie = self.find_movie(movie_id)
@@ -84,9 +184,13 @@ class MovieService:
         movie: Movie = self.find_movie(movie_id)
         return self.actor_service.serialize_to_simple_actors(movie)
 
-    def find_movie(self, movie_id: int) -> Movie:
+    def find_movie(
+        self, movie_id: int, movies: Optional[QuerySet[Movie]] = None
+    ) -> Movie:
         try:
-            movie: Movie = Movie.objects.get(pk=movie_id)
+            movie: Movie = (movies if movies is not None else Movie.objects).get(
+                pk=movie_id
+            )
         except Movie.DoesNotExist:
             raise NotFound(
                 detail={"detail": f"Movie with id {movie_id} does not exist"}
@@ -104,12 +208,54 @@ class MovieService:
         actor: Actor = self.actor_service.find_actor(actor_id)
         movie.actors.add(actor)
 
-    def movie_admin_search(self, search_query: str) -> ReturnDict:
-        search_results: List[TmdbMovieSearchResponse] = self.tmdb_service.movie_search(
-            search_query
-        )
-        movie_serializer: SearchMovieSerializer = SearchMovieSerializer(
-            data=search_results, many=True
+    def movie_admin_search(self, search_query: str) -> Tuple[ReturnList, bool]:
+        # Normalized only for the cache keys, TMDB gets the query as typed
+        search_query = " ".join(search_query.split())
+        cache_key: str = normalize_query(search_query)
+        if not cache_key:
+            return self.serialize_search_results({"results": []}), False
+        search_cache: Optional[SearchResultCache] = (
+            SearchResultCache.shared() if settings.SEARCH_CACHE_ENABLED else None
         )
-        movie_serializer.is_valid()
-        return movie_serializer.data
+        if search_cache is not None:
+            cached_results: Optional[Dict[str, Any]] = search_cache.get(cache_key)
+            if cached_results is not None:
+                return self.serialize_search_results(cached_results), False
+        stale_results: StaleResults = StaleResults.shared()
+        try:
+            search_results: Dict[str, Any] = self.tmdb_service.movie_search(
+                search_query
+            )
+        except TmdbUnavailable:
+            stale_search_results: Optional[Dict[str, Any]] = stale_results.get(
+                cache_key
+            )
+            if stale_search_results is None:
+                raise
+            self.schedule_search_refresh(cache_key, search_query)
+            return self.serialize_search_results(stale_search_results), True
+        stale_results.put(cache_key, search_results)
+        if search_cache is not None:
+            search_cache.put(cache_key, search_results)
+        return self.serialize_search_results(search_results), False
+
+    def serialize_search_results(self, search_results: Dict[str, Any]) -> ReturnList:
+        movies: List[TmdbMovieSearchResponse] = [
+            TmdbMovieSearchResponse(**movie) for movie in search_results["results"]
+        ]
+        return SearchMovieSerializer(movies, many=True).data
+
+    def schedule_search_refresh(self, cache_key: str, search_query: str) -> None:
+        if StaleResults.shared().start_refresh(cache_key):
+            self.search_refresher.submit(self.refresh_search, cache_key, search_query)
+
+    def refresh_search(self, cache_key: str, search_query: str) -> None:
+        stale_results: StaleResults = StaleResults.shared()
+        try:
+            # Wait for the circuit to let a probe through instead of failing fast
+            time.sleep(CircuitBreaker.shared().retry_in())
+            stale_results.put(cache_key, self.tmdb_service.movie_search(search_query))
+        except APIException:
+            pass
+        finally:
+            stale_results.finish_refresh(cache_key)
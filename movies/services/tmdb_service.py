@@ -1,27 +1,105 @@
+from typing import Any, Dict, Optional
+
+from movies.utils import tmdb_json
+from movies.utils.single_flight import SingleFlight
+from movies.utils.tmdb_cache import TmdbResponseCache
 from movies.utils.tmdb_client import TmdbClient
 
 
 class TmdbService:
+    # Shared by every instance so concurrent imports merge identical requests
+    single_flight: SingleFlight = SingleFlight()
+
     def __init__(self) -> None:
         self.client = TmdbClient()
+        self.cache: Optional[TmdbResponseCache] = TmdbResponseCache.for_services()
         super().__init__()
 
     def fetch_actor(self, actor_id: int) -> dict:
-        return self.client.get(path=f"person/{actor_id}").json()
+        return self.get_json("actor", path=f"person/{actor_id}")
 
     def fetch_movie(self, movie_id: int) -> dict:
-        return self.client.get(path=f"movie/{movie_id}").json()
+        return self.get_json("movie", path=f"movie/{movie_id}")
+
+    def fetch_full_movie(self, movie_id: int) -> Dict[str, Any]:
+        movie: Dict[str, Any] = self.get_json(
+            "movie",
+            path=f"movie/{movie_id}",
+            params={"append_to_response": "videos,credits"},
+        )
+        self.cache_full_movie_parts(self.cache, movie_id, movie)
+        return self.flatten_full_movie(movie)
+
+    @staticmethod
+    def cache_full_movie_parts(
+        cache: Optional[TmdbResponseCache], movie_id: int, movie: Dict[str, Any]
+    ) -> None:
+        # Lets the single movie, credits and videos fetches reuse the import payload
+        if cache is None:
+            return
+        details: Dict[str, Any] = {
+            key: value
+            for key, value in movie.items()
+            if key not in ("videos", "credits")
+        }
+        parts = (
+            ("movie", f"movie/{movie_id}", details),
+            ("credits", f"movie/{movie_id}/credits", movie.get("credits")),
+            ("videos", f"movie/{movie_id}/videos", movie.get("videos")),
+        )
+        for endpoint, path, part in parts:
+            if part is not None:
+                cache.put(
+                    endpoint,
+                    TmdbResponseCache.make_key(path),
+                    tmdb_json.dumps(part),
+                )
+
+    @staticmethod
+    def flatten_full_movie(movie: Dict[str, Any]) -> Dict[str, Any]:
+        details: Dict[str, Any] = {
+            key: value
+            for key, value in movie.items()
+            if key not in ("videos", "credits")
+        }
+        movie_trailer: Dict[str, Any] = movie.get("videos", {"results": []})
+        movie_credits: Dict[str, Any] = movie.get("credits", {"cast": [], "crew": []})
+        return {**details, **movie_credits, **movie_trailer}
 
     def fetch_movie_trailer(self, movie_id) -> dict:
-        return self.client.get(path=f"movie/{movie_id}/videos").json()
+        return self.get_json("videos", path=f"movie/{movie_id}/videos")
 
     def fetch_movie_credits(self, movie_id: int) -> dict:
-        return self.client.get(path=f"movie/{movie_id}/credits").json()
+        return self.get_json("credits", path=f"movie/{movie_id}/credits")
 
     def movie_search(self, search_query) -> dict:
-        return self.client.get(
-            path=f"search/movie", params={"query": search_query}
-        ).json()
+        return self.get_json(
+            "search", path=f"search/movie", params={"query": search_query}
+        )
 
     def fetch_genre_list(self) -> dict:
-        return self.client.get(path="genre/movie/list").json()
+        return self.get_json("genre", path="genre/movie/list")
+
+    def get_json(
+        self, endpoint: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        key: str = TmdbResponseCache.make_key(path, params)
+        content: Optional[bytes] = (
+            self.cache.get(key) if self.cache is not None else None
+        )
+        if content is not None:
+            return tmdb_json.loads(content)
+        # Merged callers share one payload, none of them may modify it
+        return self.single_flight.do(
+            key, lambda: self.fetch_payload(endpoint, key, path, params)
+        )
+
+    def fetch_payload(
+        self, endpoint: str, key: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = tmdb_json.decode_projected(
+            endpoint, self.client.get(path=path, params=params).content
+        )
+        if self.cache is not None:
+            self.cache.put(endpoint, key, tmdb_json.dumps(payload))
+        return payload
@@ -8,11 +8,14 @@ from .views.user_view import *
 urlpatterns = [
     path("movies", MovieView.as_view()),
     path("movies/search", MovieSearchView.as_view()),
+    path("movies/catalog-search", MovieCatalogSearchView.as_view()),
+    path("movies/facets", MovieFacetsView.as_view()),
     path("movies/<int:movie_id>", MovieView.as_view()),
     path("movies/<int:movie_id>/actors", MovieActorsView.as_view()),
     path("movies/<int:movie_id>/actors/<int:actor_id>", MovieActorsView.as_view()),
     path("movies/<int:movie_id>/genres", MovieGenresView.as_view()),
     path("actors", ActorView.as_view()),
+    path("actors/catalog-search", ActorCatalogSearchView.as_view()),
     path("actors/<int:actor_id>", ActorView.as_view()),
     path("actors/<int:actor_id>/movies", ActorMoviesView.as_view()),
     path("actors/<int:actor_id>/movies/<int:movie_id>", ActorMoviesView.as_view()),
@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import httpx
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, Throttled
+
+from movies.utils.circuit_breaker import CircuitBreaker, TmdbUnavailable
+from movies.utils.tmdb_client import TmdbClient, RETRY_STATUSES
+from movies.utils.tmdb_rate_limiter import TmdbRateLimiter
+from movies.utils.tmdb_store import TmdbResponseStore, TmdbStoreMode
+
+
+class AsyncTmdbClient:
+    # httpx.AsyncClient is bound to the loop it was created on, so every running
+    # loop (ASGI server loop, TmdbEventLoop, asyncio.run in a command) gets its own pool
+    _lock = threading.Lock()
+    _clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+        WeakKeyDictionary()
+    )
+
+    def __init__(self) -> None:
+        self.base_uri = settings.TMDB_URI
+        self.rate_limiter = TmdbRateLimiter.shared()
+        self.circuit_breaker = CircuitBreaker.shared()
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        with cls._lock:
+            client: Optional[httpx.AsyncClient] = cls._clients.get(loop)
+            if client is None or client.is_closed:
+                client = cls.create_client()
+                cls._clients[loop] = client
+            return client
+
+    @classmethod
+    def create_client(cls) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.TMDB_POOL_MAXSIZE,
+                max_keepalive_connections=settings.TMDB_POOL_MAXSIZE,
+            ),
+            timeout=httpx.Timeout(
+                settings.TMDB_TIMEOUT[1], connect=settings.TMDB_TIMEOUT[0]
+            ),
+        )
+
+    @classmethod
+    async def aclose(cls) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        with cls._lock:
+            client: Optional[httpx.AsyncClient] = cls._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    async def get(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        return await self.make_request("GET", path, params)
+
+    async def make_request(
+        self, method: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> httpx.Response:
+        params = params if params else {}
+        headers = TmdbClient.get_auth_headers()
+
+        store_mode: TmdbStoreMode = TmdbStoreMode.current()
+        store_key: str = TmdbResponseStore.make_key(method, path, params)
+        if store_mode.reads:
+            stored: Optional[Tuple[int, bytes]] = (
+                await TmdbResponseStore.shared().aload(store_key)
+            )
+            if stored is not None:
+                status_code, content = stored
+                response: httpx.Response = httpx.Response(
+                    status_code,
+                    content=content,
+                    request=httpx.Request(
+                        method, urllib.parse.urljoin(self.base_uri, path)
+                    ),
+                )
+                self.handle_exception(response)
+                return response
+            if store_mode is TmdbStoreMode.REPLAY:
+                raise APIException(f"No recorded TMDB response for {store_key}")
+
+        trial: bool = self.circuit_breaker.before_call()
+        try:
+            response = await self.send_with_retries(method, path, params, headers)
+        except httpx.HTTPError as e:
+            self.circuit_breaker.record_failure()
+            raise TmdbUnavailable(e)
+        except BaseException:
+            # Cancelled or failed otherwise, don't leave the circuit half-open
+            if trial:
+                self.circuit_breaker.record_failure()
+            raise
+        self.circuit_breaker.record_response(response.status_code)
+        if store_mode.writes and TmdbResponseStore.storable(response.status_code):
+            await TmdbResponseStore.shared().asave(
+                store_key, response.status_code, response.content
+            )
+        self.handle_exception(response)
+        return response
+
+    async def send_with_retries(
+        self, method: str, path: str, params: Dict[str, Any], headers: Dict[str, str]
+    ) -> httpx.Response:
+        attempt: int = 0
+        while True:
+            response: httpx.Response = await self.send(method, path, params, headers)
+            if (
+                response.status_code not in RETRY_STATUSES
+                or attempt >= settings.TMDB_MAX_RETRIES
+            ):
+                return response
+            await asyncio.sleep(
+                await self.rate_limiter.abackoff_delay(
+                    attempt, response.headers.get("Retry-After")
+                )
+            )
+            attempt += 1
+
+    async def send(
+        self, method: str, path: str, params: Dict[str, Any], headers: Dict[str, str]
+    ) -> httpx.Response:
+        await self.rate_limiter.aacquire()
+        started: float = time.monotonic()
+        try:
+            response: httpx.Response = await self.get_client().request(
+                method=method,
+                url=urllib.parse.urljoin(self.base_uri, path),
+                params=params,
+                headers=headers,
+            )
+        except httpx.HTTPError:
+            self.rate_limiter.release(float("inf"), throttled=False)
+            raise
+        self.rate_limiter.release(
+            time.monotonic() - started,
+            throttled=response.status_code == status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+        return response
+
+    def handle_exception(self, response: httpx.Response) -> None:
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if response.status_code == status.HTTP_404_NOT_FOUND:
+                raise NotFound(e)
+            if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                raise TmdbUnavailable(e)
+            if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+                raise Throttled(
+                    wait=TmdbRateLimiter.parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+                )
+            raise APIException(e)
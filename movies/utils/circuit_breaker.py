@@ -0,0 +1,96 @@
+import enum
+import threading
+import time
+from typing import Dict, Optional, Union
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class TmdbUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "TMDB is unavailable, try again later."
+    default_code = "tmdb_unavailable"
+
+
+class CircuitState(enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    _shared_lock = threading.Lock()
+    _shared: Optional["CircuitBreaker"] = None
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "CircuitBreaker":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(
+                    settings.TMDB_CIRCUIT_FAILURE_THRESHOLD,
+                    settings.TMDB_CIRCUIT_RESET_TIMEOUT,
+                )
+            return cls._shared
+
+    def before_call(self) -> bool:
+        # True for the trial call, whose outcome must always be recorded
+        with self._lock:
+            if self.state is CircuitState.CLOSED:
+                return False
+            if self.state is CircuitState.OPEN and self.retry_in() <= 0:
+                # Let a single trial call through, everyone else keeps failing fast
+                self.state = CircuitState.HALF_OPEN
+                return True
+            self.rejected += 1
+        raise TmdbUnavailable()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if (
+                self.state is CircuitState.HALF_OPEN
+                or self.failures >= self.failure_threshold
+            ):
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+
+    def record_response(self, status_code: int) -> None:
+        # 4xx other than 429 means TMDB is up and answering
+        if status_code >= 500 or status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def allows_calls(self) -> bool:
+        with self._lock:
+            return self.state is CircuitState.CLOSED or (
+                self.state is CircuitState.OPEN and self.retry_in() <= 0
+            )
+
+    def retry_in(self) -> float:
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def stats(self) -> Dict[str, Union[str, int, float]]:
+        with self._lock:
+            return {
+                "state": self.state.value,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "retry_in": self.retry_in() if self.state is CircuitState.OPEN else 0.0,
+            }
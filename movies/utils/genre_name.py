@@ -1,5 +1,5 @@
 import enum
-from typing import List
+from typing import FrozenSet, List
 
 
 # TODO: find way to create Django/PostgreSQL EnumField
@@ -28,3 +28,6 @@ class GenreName(enum.Enum):
     @classmethod
     def values(cls) -> List[str]:
         return [name.value for name in GenreName]
+
+
+GENRE_NAMES: FrozenSet[str] = frozenset(GenreName.values())
@@ -0,0 +1,96 @@
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Iterable, List, Mapping, Optional, Set
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from movies.models import Genre
+
+# Replaced on every genre change, processes compare it with their snapshot's
+VERSION_KEY = "genre_registry:version"
+
+
+@dataclass(frozen=True)
+class GenreRegistry:
+    ids_by_name: Mapping[str, int]
+    ids_by_tmdb_id: Mapping[int, int]
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _current: ClassVar[Optional["GenreRegistry"]] = None
+    _generation: ClassVar[int] = 0
+    _version: ClassVar[Optional[str]] = None
+    _checked_at: ClassVar[float] = 0.0
+
+    @classmethod
+    def current(cls) -> "GenreRegistry":
+        registry: Optional[GenreRegistry] = cls._current
+        checked_at: float = time.monotonic()
+        if registry is not None and (
+            checked_at - cls._checked_at < settings.GENRE_REGISTRY_CHECK_INTERVAL
+        ):
+            return registry
+        # Genres changed by another process only show up in the shared version
+        version: Optional[str] = caches[settings.GENRE_REGISTRY_CACHE].get(VERSION_KEY)
+        if registry is not None and version == cls._version:
+            cls._checked_at = checked_at
+            return registry
+        generation: int = cls._generation
+        registry = cls.build()
+        with cls._lock:
+            # A genre saved while building invalidated this snapshot, don't publish it
+            if generation == cls._generation:
+                cls._current = registry
+                cls._version = version
+                cls._checked_at = checked_at
+        return registry
+
+    @classmethod
+    def build(cls) -> "GenreRegistry":
+        ids_by_name: Dict[str, int] = {}
+        ids_by_tmdb_id: Dict[int, int] = {}
+        for genre_id, name, tmdb_id in Genre.objects.values_list(
+            "id", "name", "tmdb_id"
+        ):
+            ids_by_name[name] = genre_id
+            if tmdb_id is not None:
+                ids_by_tmdb_id[tmdb_id] = genre_id
+        return cls(MappingProxyType(ids_by_name), MappingProxyType(ids_by_tmdb_id))
+
+    @classmethod
+    def invalidate(cls, *args, using: Optional[str] = None, **kwargs) -> None:
+        # Dropped now so the writing transaction sees its own rows, and again on
+        # commit, since other threads may rebuild from the pre-commit rows meanwhile
+        cls.drop_snapshot()
+        transaction.on_commit(cls.publish_change, using=using)
+
+    @classmethod
+    def publish_change(cls) -> None:
+        cls.drop_snapshot()
+        caches[settings.GENRE_REGISTRY_CACHE].set(
+            VERSION_KEY, uuid.uuid4().hex, timeout=None
+        )
+
+    @classmethod
+    def drop_snapshot(cls) -> None:
+        with cls._lock:
+            cls._generation += 1
+            cls._current = None
+
+    def resolve(self, tmdb_genres: Iterable[Dict[str, Any]]) -> List[int]:
+        genre_ids: List[int] = []
+        seen: Set[int] = set()
+        for genre in tmdb_genres:
+            tmdb_id: Any = genre.get("id")
+            genre_id: Optional[int] = self.ids_by_tmdb_id.get(tmdb_id)
+            if genre_id is None:
+                name: Any = genre.get("name")
+                genre_id = self.ids_by_name.get(name)
+            if genre_id is not None and genre_id not in seen:
+                seen.add(genre_id)
+                genre_ids.append(genre_id)
+        return genre_ids
@@ -0,0 +1,119 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import BaseSerializer
+
+from movies.serializers.sparse_fieldset import only_columns
+
+
+@dataclass(frozen=True)
+class KeysetPage:
+    data: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+
+
+class KeysetPaginator:
+    def __init__(self, sort_fields: Dict[str, str]) -> None:
+        # Public sort key -> model field, each backed by a (field, pk) index
+        self.sort_fields = sort_fields
+
+    def paginate(
+        self,
+        queryset: QuerySet,
+        serializer_class: Type[BaseSerializer],
+        sort: str = "id",
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        key_paths: Optional[Dict[str, str]] = None,
+    ) -> KeysetPage:
+        field, descending = self.parse_sort(sort)
+        # Sort field or "pk" -> lookup path, for keys read through a relation
+        paths: Dict[str, str] = key_paths or {}
+        path: str = paths.get(field, field)
+        pk_path: str = paths.get("pk", "pk")
+        size: int = self.parse_page_size(page_size)
+        serializer_kwargs: Dict[str, Any] = {}
+        if fields is not None:
+            # The sort column stays loaded, the next cursor is read from the last row
+            queryset = queryset.only(*only_columns(serializer_class, fields), field)
+            serializer_kwargs["fields"] = fields
+        if cursor:
+            queryset = queryset.filter(
+                self.after(path, pk_path, descending, self.decode_cursor(cursor, sort))
+            )
+        direction: str = "-" if descending else ""
+        ordering: List[str] = [f"{direction}{path}"]
+        if path != pk_path:
+            ordering.append(f"{direction}{pk_path}")
+        rows: List[Model] = list(queryset.order_by(*ordering)[: size + 1])
+        next_cursor: Optional[str] = None
+        if len(rows) > size:
+            rows = rows[:size]
+            next_cursor = self.encode_cursor(sort, field, rows[-1])
+        return KeysetPage(
+            serializer_class(rows, many=True, **serializer_kwargs).data, next_cursor
+        )
+
+    def parse_sort(self, sort: str) -> Tuple[str, bool]:
+        descending: bool = sort.startswith("-")
+        field: Optional[str] = self.sort_fields.get(sort.lstrip("-"))
+        if field is None:
+            raise ValidationError(
+                {"sort": f"Supported sort keys: {', '.join(self.sort_fields)}"}
+            )
+        return field, descending
+
+    @staticmethod
+    def parse_page_size(page_size: Optional[Any]) -> int:
+        if page_size is None:
+            return settings.PAGE_SIZE
+        try:
+            size: int = int(page_size)
+        except (TypeError, ValueError):
+            raise ValidationError({"page_size": "Must be an integer"})
+        if not 1 <= size <= settings.MAX_PAGE_SIZE:
+            raise ValidationError(
+                {"page_size": f"Must be between 1 and {settings.MAX_PAGE_SIZE}"}
+            )
+        return size
+
+    @staticmethod
+    def after(path: str, pk_path: str, descending: bool, position: List[Any]) -> Q:
+        value, last_id = position
+        lookup: str = "lt" if descending else "gt"
+        if path == pk_path:
+            return Q(**{f"{pk_path}__{lookup}": last_id})
+        # The leading inclusive bound lets the planner range-scan the (field, id) index
+        return Q(**{f"{path}__{lookup}e": value}) & (
+            Q(**{f"{path}__{lookup}": value}) | Q(**{f"{pk_path}__{lookup}": last_id})
+        )
+
+    @staticmethod
+    def encode_cursor(sort: str, field: str, row: Model) -> str:
+        position: Dict[str, Any] = {
+            "sort": sort,
+            "after": [getattr(row, field), row.pk],
+        }
+        payload: bytes = json.dumps(position, cls=DjangoJSONEncoder).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str, sort: str) -> List[Any]:
+        try:
+            payload: bytes = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            position: Dict[str, Any] = json.loads(payload)
+            after: List[Any] = position["after"]
+            valid: bool = position["sort"] == sort and len(after) == 2
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            valid = False
+        if not valid:
+            raise ValidationError({"cursor": "Invalid cursor for this sort order"})
+        return after
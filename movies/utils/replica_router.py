@@ -0,0 +1,95 @@
+import functools
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpRequest, HttpResponse
+
+PIN_COOKIE = "db_primary_until"
+# Model label of DatabaseCache entries
+CACHE_APP_LABEL = "django_cache"
+
+# Context variables rather than thread locals, so routing follows the request on
+# both WSGI worker threads and ASGI tasks
+replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+wrote_primary: ContextVar[bool] = ContextVar("wrote_primary", default=False)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model: Any, **hints: Any) -> str:
+        if (
+            model._meta.app_label == CACHE_APP_LABEL
+            or not replica_reads.get()
+            or primary_pinned.get()
+            or wrote_primary.get()
+            or not settings.DATABASE_REPLICAS
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model: Any, **hints: Any) -> str:
+        if model._meta.app_label == CACHE_APP_LABEL:
+            # Shared cache counters, not data the client has to read back
+            return DEFAULT_DB_ALIAS
+        # Later reads in this request, and the client's next requests, must see the write
+        wrote_primary.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> Optional[bool]:
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool:
+        return db not in settings.DATABASE_REPLICAS
+
+
+def read_from_replica(
+    handler: Callable[..., HttpResponse],
+) -> Callable[..., HttpResponse]:
+    @functools.wraps(handler)
+    def wrapper(*args: Any, **kwargs: Any) -> HttpResponse:
+        token = replica_reads.set(True)
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            replica_reads.reset(token)
+
+    return wrapper
+
+
+class PrimaryPinningMiddleware:
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        pinned_token = primary_pinned.set(self.recently_wrote(request))
+        wrote_token = wrote_primary.set(False)
+        try:
+            response: HttpResponse = self.get_response(request)
+            wrote: bool = wrote_primary.get()
+        finally:
+            primary_pinned.reset(pinned_token)
+            wrote_primary.reset(wrote_token)
+        if wrote or request.method not in ("GET", "HEAD", "OPTIONS"):
+            window: float = settings.REPLICA_FRESHNESS_WINDOW
+            response.set_cookie(
+                PIN_COOKIE,
+                str(time.time() + window),
+                max_age=int(window) or 1,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    @staticmethod
+    def recently_wrote(request: HttpRequest) -> bool:
+        try:
+            return float(request.COOKIES.get(PIN_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
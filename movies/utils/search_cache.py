@@ -0,0 +1,112 @@
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from django.conf import settings
+
+
+def normalize_query(query: str) -> str:
+    # "  Amélie " and "amelie" share one entry: case-folded, accents and
+    # repeated whitespace removed
+    decomposed: str = unicodedata.normalize("NFKD", query.casefold())
+    stripped: str = "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+    return " ".join(stripped.split())
+
+
+class SearchResultCache:
+    _shared_lock = threading.Lock()
+    _shared: Optional["SearchResultCache"] = None
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.prefix_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # normalized query -> (expires_at, TMDB search payload)
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @classmethod
+    def shared(cls) -> "SearchResultCache":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(
+                    settings.SEARCH_CACHE_TTL, settings.SEARCH_CACHE_MAX_ENTRIES
+                )
+            return cls._shared
+
+    def get(self, query: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            results: Optional[Dict[str, Any]] = self._fresh(query)
+            if results is not None:
+                self.hits += 1
+                return results
+            # A complete result set for "gum" already holds every match for "gump"
+            for length in range(len(query) - 1, 0, -1):
+                prefix_results: Optional[Dict[str, Any]] = self._fresh(query[:length])
+                if prefix_results is not None and self.is_complete(prefix_results):
+                    self.prefix_hits += 1
+                    return self.narrow(prefix_results, query)
+            self.misses += 1
+            return None
+
+    def put(self, query: str, results: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[query] = (time.monotonic() + self.ttl, results)
+            self._entries.move_to_end(query)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        with self._lock:
+            lookups: int = self.hits + self.prefix_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "prefix_hits": self.prefix_hits,
+                "misses": self.misses,
+                "hit_ratio": (
+                    (self.hits + self.prefix_hits) / lookups if lookups else 0.0
+                ),
+            }
+
+    @staticmethod
+    def is_complete(results: Dict[str, Any]) -> bool:
+        return results.get("total_pages", 1) <= 1 and len(
+            results.get("results", [])
+        ) >= results.get("total_results", 0)
+
+    @staticmethod
+    def narrow(results: Dict[str, Any], query: str) -> Dict[str, Any]:
+        terms: List[str] = query.split()
+        movies: List[Dict[str, Any]] = [
+            movie
+            for movie in results["results"]
+            if all(term in normalize_query(movie.get("title", "")) for term in terms)
+        ]
+        return {
+            "page": 1,
+            "results": movies,
+            "total_pages": 1,
+            "total_results": len(movies),
+        }
+
+    def _fresh(self, query: str) -> Optional[Dict[str, Any]]:
+        entry: Optional[Tuple[float, Dict[str, Any]]] = self._entries.get(query)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at <= time.monotonic():
+            del self._entries[query]
+            return None
+        self._entries.move_to_end(query)
+        return results
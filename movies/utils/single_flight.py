@@ -0,0 +1,94 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class InFlightCall:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    # Callers asking for the same key while a call is running wait for its result
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, InFlightCall] = {}
+        self.calls = 0
+        self.saved = 0
+
+    def do(self, key: str, function: Callable[[], T]) -> T:
+        with self._lock:
+            call: Optional[InFlightCall] = self._calls.get(key)
+            leader: bool = call is None
+            if call is None:
+                call = InFlightCall()
+                self._calls[key] = call
+                self.calls += 1
+            else:
+                self.saved += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"calls": self.calls, "saved": self.saved}
+
+
+class AsyncSingleFlight:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Tuple[int, str], "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.saved = 0
+
+    async def do(self, key: str, function: Callable[[], Awaitable[T]]) -> T:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        # Futures belong to one loop, calls are only merged within the same loop
+        call_key: Tuple[int, str] = (id(loop), key)
+        with self._lock:
+            future: "Optional[asyncio.Future[Any]]" = self._calls.get(call_key)
+            leader: bool = future is None
+            if future is None:
+                future = loop.create_future()
+                self._calls[call_key] = future
+                self.calls += 1
+            else:
+                self.saved += 1
+        if not leader:
+            return await asyncio.shield(future)
+        try:
+            result: T = await function()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve it so an exception nobody else awaited is not logged
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                del self._calls[call_key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"calls": self.calls, "saved": self.saved}
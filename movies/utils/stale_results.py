@@ -0,0 +1,56 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
+
+from django.conf import settings
+
+
+class StaleResults:
+    # Last successful TMDB result per key, served while TMDB is unavailable
+    _shared_lock = threading.Lock()
+    _shared: Optional["StaleResults"] = None
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.served = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+
+    @classmethod
+    def shared(cls) -> "StaleResults":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(settings.TMDB_STALE_SEARCH_ENTRIES)
+            return cls._shared
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result: Optional[Dict[str, Any]] = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.served += 1
+            return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def start_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def finish_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._refreshing.clear()
@@ -0,0 +1,92 @@
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+
+
+class TmdbResponseCache:
+    _shared_lock = threading.Lock()
+    _shared: Optional["TmdbResponseCache"] = None
+
+    def __init__(self, max_bytes: int, ttl: Dict[str, int]) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+        # key -> (expires_at, raw response body), oldest first
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    @classmethod
+    def shared(cls) -> "TmdbResponseCache":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(
+                    settings.TMDB_CACHE_MAX_BYTES, settings.TMDB_CACHE_TTL
+                )
+            return cls._shared
+
+    @classmethod
+    def for_services(cls) -> Optional["TmdbResponseCache"]:
+        return cls.shared() if settings.TMDB_CACHE_ENABLED else None
+
+    @staticmethod
+    def make_key(path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        query: str = urllib.parse.urlencode(sorted((params or {}).items()))
+        return f"{path}?{query}" if query else path
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry: Optional[Tuple[float, bytes]] = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, content = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return content
+
+    def put(self, endpoint: str, key: str, content: bytes) -> None:
+        ttl: int = self.ttl.get(endpoint, 0)
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, content)
+            self.size += len(content)
+            while self.size > self.max_bytes:
+                oldest_key: str = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _remove(self, key: str) -> None:
+        _, content = self._entries.pop(key)
+        self.size -= len(content)
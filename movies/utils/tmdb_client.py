@@ -1,38 +1,215 @@
+import atexit
+import os
+import threading
+import time
 import urllib.parse
+from typing import Any, Dict, Optional, Tuple
 
-import requests
 from django.conf import settings
-from requests import Response, HTTPError
-from rest_framework.exceptions import APIException
+from requests import Response, HTTPError, RequestException, Session
+from requests.adapters import HTTPAdapter
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, Throttled
+
+from movies.utils.circuit_breaker import CircuitBreaker, TmdbUnavailable
+from movies.utils.tmdb_rate_limiter import TmdbRateLimiter
+from movies.utils.tmdb_store import TmdbResponseStore, TmdbStoreMode
+
+RETRY_STATUSES = (
+    status.HTTP_429_TOO_MANY_REQUESTS,
+    status.HTTP_503_SERVICE_UNAVAILABLE,
+)
+
+
+class TmdbSessionPool:
+    _lock = threading.Lock()
+    _session: Optional[Session] = None
+    _adapter: Optional[HTTPAdapter] = None
+    _pid: Optional[int] = None
+
+    @classmethod
+    def get_session(cls) -> Session:
+        # Sessions are not shared across fork(), every worker process builds its own
+        session: Optional[Session] = cls._session
+        if session is not None and cls._pid == os.getpid():
+            return session
+        with cls._lock:
+            if cls._session is None or cls._pid != os.getpid():
+                cls._session, cls._adapter = cls.create_session()
+                cls._pid = os.getpid()
+            return cls._session
+
+    @classmethod
+    def create_session(cls) -> Tuple[Session, HTTPAdapter]:
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=settings.TMDB_POOL_CONNECTIONS,
+            pool_maxsize=settings.TMDB_POOL_MAXSIZE,
+            pool_block=settings.TMDB_POOL_BLOCK,
+        )
+        session: Session = Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session, adapter
+
+    @classmethod
+    def close(cls) -> None:
+        with cls._lock:
+            if cls._session is not None and cls._pid == os.getpid():
+                cls._session.close()
+            cls._session = None
+            cls._adapter = None
+            cls._pid = None
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        # Drop inherited sockets without closing them, the parent still owns them
+        cls._lock = threading.Lock()
+        cls._session = None
+        cls._adapter = None
+        cls._pid = None
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        requests_count: int = 0
+        connections_count: int = 0
+        adapter: Optional[HTTPAdapter] = cls._adapter
+        if adapter is not None and cls._pid == os.getpid():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_count += pool.num_requests
+                connections_count += pool.num_connections
+        return {
+            "requests": requests_count,
+            "connections": connections_count,
+            "reused": requests_count - connections_count,
+        }
+
+
+atexit.register(TmdbSessionPool.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=TmdbSessionPool.reset_after_fork)
 
 
 class TmdbClient:
     def __init__(self) -> None:
         self.base_uri = settings.TMDB_URI
+        self.rate_limiter = TmdbRateLimiter.shared()
+        self.circuit_breaker = CircuitBreaker.shared()
 
     @classmethod
-    def get_auth_headers(cls):
+    def get_auth_headers(cls) -> Dict[str, str]:
         return {"Authorization": f"Bearer {settings.TMDB_KEY}"}
 
-    def get(self, path: str, params: dict = None) -> Response:
+    @classmethod
+    def connection_stats(cls) -> Dict[str, int]:
+        return TmdbSessionPool.stats()
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Response:
         return self.make_request("GET", path, params)
 
-    def make_request(self, method: str, path: str, params: dict) -> Response:
+    def make_request(
+        self, method: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> Response:
         params = params if params else {}
         headers = self.get_auth_headers()
 
-        response: Response = requests.request(
-            method=method,
-            url=urllib.parse.urljoin(self.base_uri, path),
-            params=urllib.parse.urlencode(params),
-            headers=headers,
-        )
+        store_mode: TmdbStoreMode = TmdbStoreMode.current()
+        store_key: str = TmdbResponseStore.make_key(method, path, params)
+        if store_mode.reads:
+            stored: Optional[Tuple[int, bytes]] = TmdbResponseStore.shared().load(
+                store_key
+            )
+            if stored is not None:
+                response: Response = self.build_stored_response(*stored)
+                self.handle_exception(response)
+                return response
+            if store_mode is TmdbStoreMode.REPLAY:
+                raise APIException(f"No recorded TMDB response for {store_key}")
+
+        trial: bool = self.circuit_breaker.before_call()
+        try:
+            response = self.send_with_retries(method, path, params, headers)
+        except RequestException as e:
+            self.circuit_breaker.record_failure()
+            raise TmdbUnavailable(e)
+        except BaseException:
+            # Cancelled or failed otherwise, don't leave the circuit half-open
+            if trial:
+                self.circuit_breaker.record_failure()
+            raise
+        self.circuit_breaker.record_response(response.status_code)
+        if store_mode.writes and TmdbResponseStore.storable(response.status_code):
+            TmdbResponseStore.shared().save(
+                store_key, response.status_code, response.content
+            )
         self.handle_exception(response)
         return response
 
+    @staticmethod
+    def build_stored_response(status_code: int, content: bytes) -> Response:
+        response: Response = Response()
+        response.status_code = status_code
+        response._content = content
+        response.headers["Content-Type"] = "application/json"
+        return response
+
+    def send_with_retries(
+        self, method: str, path: str, params: Dict[str, Any], headers: Dict[str, str]
+    ) -> Response:
+        attempt: int = 0
+        while True:
+            response: Response = self.send(method, path, params, headers)
+            if (
+                response.status_code not in RETRY_STATUSES
+                or attempt >= settings.TMDB_MAX_RETRIES
+            ):
+                return response
+            time.sleep(
+                self.rate_limiter.backoff_delay(
+                    attempt, response.headers.get("Retry-After")
+                )
+            )
+            attempt += 1
+
+    def send(
+        self, method: str, path: str, params: Dict[str, Any], headers: Dict[str, str]
+    ) -> Response:
+        self.rate_limiter.acquire()
+        started: float = time.monotonic()
+        try:
+            response: Response = TmdbSessionPool.get_session().request(
+                method=method,
+                url=urllib.parse.urljoin(self.base_uri, path),
+                params=urllib.parse.urlencode(params),
+                headers=headers,
+                timeout=settings.TMDB_TIMEOUT,
+            )
+        except RequestException:
+            # Connection failures shrink the concurrency limit like slow responses
+            self.rate_limiter.release(float("inf"), throttled=False)
+            raise
+        self.rate_limiter.release(
+            time.monotonic() - started,
+            throttled=response.status_code == status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+        return response
+
     # TODO: improve this
     def handle_exception(self, response: Response) -> None:
         try:
             response.raise_for_status()
         except HTTPError as e:
+            if response.status_code == status.HTTP_404_NOT_FOUND:
+                raise NotFound(e)
+            if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                raise TmdbUnavailable(e)
+            if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+                raise Throttled(
+                    wait=TmdbRateLimiter.parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+                )
             raise APIException(e)
@@ -0,0 +1,48 @@
+import asyncio
+import atexit
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from movies.utils.async_tmdb_client import AsyncTmdbClient
+
+T = TypeVar("T")
+
+
+class TmdbEventLoop:
+    # Background loop that lets sync code (WSGI views, management commands)
+    # run async TMDB calls while sharing one AsyncTmdbClient pool per process
+    _lock = threading.Lock()
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _pid: Optional[int] = None
+
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls._lock:
+            if cls._loop is None or cls._pid != os.getpid():
+                loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="tmdb-event-loop", daemon=True
+                )
+                thread.start()
+                cls._loop = loop
+                cls._pid = os.getpid()
+            return cls._loop
+
+    @classmethod
+    def run(cls, coroutine: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, cls.get_loop()).result()
+
+    @classmethod
+    def close(cls) -> None:
+        with cls._lock:
+            loop: Optional[asyncio.AbstractEventLoop] = cls._loop
+            if loop is None or cls._pid != os.getpid():
+                return
+            asyncio.run_coroutine_threadsafe(AsyncTmdbClient.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            cls._loop = None
+            cls._pid = None
+
+
+atexit.register(TmdbEventLoop.close)
@@ -0,0 +1,108 @@
+import json
+from typing import Any, Callable, Dict, Iterable
+
+from movies.payload.tmdb_actor_response import TmdbActorResponse
+from movies.payload.tmdb_movie_search_response import TmdbMovieSearchResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+MOVIE_FIELDS = (
+    "id",
+    "title",
+    "overview",
+    "budget",
+    "runtime",
+    "release_date",
+    "poster_path",
+    "backdrop_path",
+    "adult",
+    "imdb_id",
+    "revenue",
+    "status",
+    "tagline",
+    "genres",
+)
+VIDEO_FIELDS = ("key", "site", "type", "official")
+GENRE_FIELDS = ("id", "name")
+
+
+def loads(content: bytes) -> Any:
+    return orjson.loads(content) if orjson else json.loads(content)
+
+
+def dumps(payload: Any) -> bytes:
+    return orjson.dumps(payload) if orjson else json.dumps(payload).encode()
+
+
+def pick(payload: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    return {field: payload[field] for field in fields if field in payload}
+
+
+def project_actor(actor: Dict[str, Any]) -> Dict[str, Any]:
+    return pick(actor, ("id", *TmdbActorResponse.__slots__))
+
+
+def project_credits(credits: Dict[str, Any]) -> Dict[str, Any]:
+    # Only cast ids and the director are read by the import
+    return {
+        **pick(credits, ("id",)),
+        "cast": [{"id": member["id"]} for member in credits.get("cast", [])],
+        "crew": [
+            pick(member, ("name", "job"))
+            for member in credits.get("crew", [])
+            if member.get("job") == "Director"
+        ],
+    }
+
+
+def project_videos(videos: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **pick(videos, ("id",)),
+        "results": [pick(video, VIDEO_FIELDS) for video in videos.get("results", [])],
+    }
+
+
+def project_movie(movie: Dict[str, Any]) -> Dict[str, Any]:
+    projected: Dict[str, Any] = pick(movie, MOVIE_FIELDS)
+    if "genres" in projected:
+        projected["genres"] = [pick(genre, GENRE_FIELDS) for genre in movie["genres"]]
+    if "credits" in movie:
+        projected["credits"] = project_credits(movie["credits"])
+    if "videos" in movie:
+        projected["videos"] = project_videos(movie["videos"])
+    return projected
+
+
+def project_search(search: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **pick(search, ("page", "total_pages", "total_results")),
+        "results": [
+            pick(movie, TmdbMovieSearchResponse.__slots__)
+            for movie in search.get("results", [])
+        ],
+    }
+
+
+def project_genres(genres: Dict[str, Any]) -> Dict[str, Any]:
+    return {"genres": [pick(genre, GENRE_FIELDS) for genre in genres.get("genres", [])]}
+
+
+PROJECTIONS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "actor": project_actor,
+    "credits": project_credits,
+    "videos": project_videos,
+    "movie": project_movie,
+    "search": project_search,
+    "genre": project_genres,
+}
+
+
+def decode_projected(endpoint: str, content: bytes) -> Any:
+    # The response is decoded whole once (no field-selective decoder is available),
+    # what gets cached, shared and decoded again on cache hits is the projection
+    payload: Any = loads(content)
+    projection = PROJECTIONS.get(endpoint)
+    return payload if projection is None else projection(payload)
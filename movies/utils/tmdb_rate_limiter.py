@@ -0,0 +1,196 @@
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Union
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import checks
+from django.core.cache import BaseCache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.cache.backends.redis import RedisCache
+
+RATE_KEY_PREFIX = "tmdb:rate"
+PAUSE_KEY = "tmdb:rate:paused_until"
+SLOT_POLL_INTERVAL = 0.01
+# Responses to requests sent before a decrease report the same congestion
+DECREASE_INTERVAL = 1.0
+# incr is one atomic command on these, BaseCache falls back to get + set, which
+# loses increments between workers
+ATOMIC_INCR_BACKENDS = (RedisCache, BaseMemcachedCache)
+
+
+class TmdbRateLimiter:
+    # The per-second quota and the Retry-After pause live in the Django cache, so
+    # every worker sharing that cache backend (Redis, Memcached) shares them.
+    # The concurrency limit is per process and adapts with AIMD.
+    _shared_lock = threading.Lock()
+    _shared: Optional["TmdbRateLimiter"] = None
+
+    def __init__(
+        self,
+        rate: int,
+        min_concurrency: int,
+        max_concurrency: int,
+        latency_target: float,
+        cache: BaseCache,
+    ) -> None:
+        self.rate = rate
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_target = latency_target
+        self.cache = cache
+        self.limit: float = float(max(min_concurrency, max_concurrency // 2))
+        self.in_flight = 0
+        self.throttled = 0
+        self.retries = 0
+        self._decreased_at = float("-inf")
+        self._condition = threading.Condition()
+
+    @classmethod
+    def shared(cls) -> "TmdbRateLimiter":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(
+                    rate=settings.TMDB_RATE_LIMIT,
+                    min_concurrency=settings.TMDB_CONCURRENCY_MIN,
+                    max_concurrency=settings.TMDB_CONCURRENCY_MAX,
+                    latency_target=settings.TMDB_LATENCY_TARGET,
+                    cache=caches[settings.TMDB_RATE_LIMIT_CACHE],
+                )
+            return cls._shared
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+        delay: float = self.reserve()
+        while delay > 0:
+            time.sleep(delay)
+            delay = self.reserve()
+
+    async def aacquire(self) -> None:
+        while not self.try_acquire_slot():
+            await asyncio.sleep(SLOT_POLL_INTERVAL)
+        delay: float = await self.areserve()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = await self.areserve()
+
+    def try_acquire_slot(self) -> bool:
+        with self._condition:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, latency: float, throttled: bool) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            now: float = time.monotonic()
+            if throttled or latency > self.latency_target:
+                if now - self._decreased_at >= DECREASE_INTERVAL:
+                    self.limit = max(float(self.min_concurrency), self.limit / 2)
+                    self._decreased_at = now
+            else:
+                self.limit = min(
+                    float(self.max_concurrency), self.limit + 1 / self.limit
+                )
+            if throttled:
+                self.throttled += 1
+            self._condition.notify_all()
+
+    def reserve(self) -> float:
+        # Returns 0 when a request may be sent now, otherwise seconds to wait
+        now: float = time.time()
+        paused_until: Optional[float] = self.cache.get(PAUSE_KEY)
+        if paused_until and paused_until > now:
+            return paused_until - now
+        window: int = int(now)
+        key: str = f"{RATE_KEY_PREFIX}:{window}"
+        self.cache.add(key, 0, timeout=2)
+        try:
+            count: int = self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, 1, timeout=2)
+            count = 1
+        if count <= self.rate:
+            return 0.0
+        return window + 1 - now + random.uniform(0, 0.05)
+
+    async def areserve(self) -> float:
+        # Like Django's async cache methods, keeps database cache I/O off the loop
+        return await sync_to_async(self.reserve)()
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        self.retries += 1
+        delay: Optional[float] = self.parse_retry_after(retry_after)
+        if delay is not None:
+            # Don't hold request threads, and every worker, for an hour-long pause
+            delay = min(delay, settings.TMDB_BACKOFF_MAX)
+            self.pause(delay)
+            return delay
+        ceiling: float = min(
+            settings.TMDB_BACKOFF_MAX, settings.TMDB_BACKOFF_BASE * 2**attempt
+        )
+        return random.uniform(0, ceiling)
+
+    async def abackoff_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        return await sync_to_async(self.backoff_delay)(attempt, retry_after)
+
+    def pause(self, seconds: float) -> None:
+        paused_until: float = time.time() + seconds
+        self.cache.set(PAUSE_KEY, paused_until, timeout=int(seconds) + 1)
+
+    @staticmethod
+    def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at: datetime = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "throttled": self.throttled,
+                "retries": self.retries,
+            }
+
+
+def check_shared_cache(app_configs: Any, **kwargs: Any) -> List[checks.CheckMessage]:
+    alias: str = settings.TMDB_RATE_LIMIT_CACHE
+    cache: BaseCache = caches[alias]
+    if isinstance(cache, ATOMIC_INCR_BACKENDS):
+        return []
+    if isinstance(cache, (LocMemCache, DummyCache)):
+        return [
+            checks.Warning(
+                f"TMDB_RATE_LIMIT_CACHE {alias!r} is not shared between processes, "
+                "every worker gets the full TMDB quota",
+                hint="Set CACHE_REDIS_URL, or point it at a Memcached cache backend.",
+                id="movies.W001",
+            )
+        ]
+    return [
+        checks.Error(
+            f"TMDB_RATE_LIMIT_CACHE {alias!r} has no atomic incr, concurrent "
+            "workers lose increments and exceed the TMDB quota",
+            hint="Set CACHE_REDIS_URL, or point it at a Memcached cache backend.",
+            id="movies.E001",
+        )
+    ]
@@ -0,0 +1,120 @@
+import enum
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from movies.utils.tmdb_cache import TmdbResponseCache
+
+
+class TmdbStoreMode(enum.Enum):
+    OFF = "off"
+    # Save every response fetched from TMDB
+    RECORD = "record"
+    # Serve only from the store, never touch the network
+    REPLAY = "replay"
+    # Serve from the store, fetch and save on a miss
+    READ_THROUGH = "read-through"
+
+    @classmethod
+    def current(cls) -> "TmdbStoreMode":
+        return cls(settings.TMDB_STORE_MODE)
+
+    @property
+    def reads(self) -> bool:
+        return self in (TmdbStoreMode.REPLAY, TmdbStoreMode.READ_THROUGH)
+
+    @property
+    def writes(self) -> bool:
+        return self in (TmdbStoreMode.RECORD, TmdbStoreMode.READ_THROUGH)
+
+
+class TmdbResponseStore:
+    _shared_lock = threading.Lock()
+    _shared: Dict[str, "TmdbResponseStore"] = {}
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._local = threading.local()
+        self._create_table()
+
+    @classmethod
+    def shared(cls) -> "TmdbResponseStore":
+        path: str = str(settings.TMDB_STORE_PATH)
+        with cls._shared_lock:
+            store: Optional[TmdbResponseStore] = cls._shared.get(path)
+            if store is None:
+                store = cls(path)
+                cls._shared[path] = store
+            return store
+
+    @staticmethod
+    def make_key(method: str, path: str, params: Optional[Dict[str, Any]]) -> str:
+        return f"{method} {TmdbResponseCache.make_key(path, params)}"
+
+    @staticmethod
+    def storable(status_code: int) -> bool:
+        # Successes and missing resources are stable, replaying an outage is not
+        return 200 <= status_code < 300 or status_code == 404
+
+    def load(self, key: str) -> Optional[Tuple[int, bytes]]:
+        row: Optional[Tuple[int, bytes]] = (
+            self._connection()
+            .execute("SELECT status, body FROM tmdb_response WHERE key = ?", (key,))
+            .fetchone()
+        )
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        status_code, body = row
+        return status_code, zlib.decompress(body)
+
+    def save(self, key: str, status_code: int, content: bytes) -> None:
+        connection: sqlite3.Connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO tmdb_response (key, status, body, recorded_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, status_code, zlib.compress(content), time.time()),
+            )
+        self.writes += 1
+
+    async def aload(self, key: str) -> Optional[Tuple[int, bytes]]:
+        # Blocking sqlite calls, keep them off the event loop
+        return await sync_to_async(self.load)(key)
+
+    async def asave(self, key: str, status_code: int, content: bytes) -> None:
+        await sync_to_async(self.save)(key, status_code, content)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections may not cross threads or fork(), keep one per thread
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        if connection is None or getattr(self._local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _create_table(self) -> None:
+        connection: sqlite3.Connection = self._connection()
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tmdb_response ("
+                "key TEXT PRIMARY KEY, status INTEGER NOT NULL, "
+                "body BLOB NOT NULL, recorded_at REAL NOT NULL)"
+            )
@@ -6,6 +6,9 @@ from rest_framework.utils.serializer_helpers import ReturnDict
 from rest_framework.views import APIView
 
 from movies.services.actor_service import ActorService
+from movies.services.catalog_search_service import CatalogSearchService
+from movies.utils.keyset_pagination import KeysetPage
+from movies.utils.replica_router import read_from_replica
 
 
 class ActorView(APIView):
@@ -13,12 +16,22 @@ class ActorView(APIView):
         self.actor_service = ActorService()
         super().__init__(*args, **kwargs)
 
+    @read_from_replica
     def get(self, request: HttpRequest, actor_id: Optional[int] = None) -> JsonResponse:
         if actor_id:
-            actor: ReturnDict = self.actor_service.get_actor(actor_id)
+            actor: ReturnDict = self.actor_service.get_actor(
+                actor_id, request.GET.get("fields")
+            )
             return JsonResponse({"data": actor}, status=status.HTTP_200_OK)
-        actors: ReturnDict = self.actor_service.get_all_actors()
-        return JsonResponse({"data": actors}, status=status.HTTP_200_OK)
+        page: KeysetPage = self.actor_service.get_all_actors(
+            sort=request.GET.get("sort", "id"),
+            cursor=request.GET.get("cursor"),
+            page_size=request.GET.get("page_size"),
+            fields=request.GET.get("fields"),
+        )
+        return JsonResponse(
+            {"data": page.data, "next": page.next_cursor}, status=status.HTTP_200_OK
+        )
 
     def post(self, request: HttpRequest) -> JsonResponse:
         actor: ReturnDict = self.actor_service.create_actor(request)
@@ -47,6 +60,7 @@ class ActorMoviesView(APIView):
 
     # permission_classes = [IsAuthenticated]
 
+    @read_from_replica
     def get(self, request: HttpRequest, actor_id: int):
         movies: ReturnDict = self.actor_service.get_movies_from_actor(actor_id)
         return JsonResponse({"data": movies}, status=status.HTTP_200_OK)
@@ -56,3 +70,17 @@ class ActorMoviesView(APIView):
         return JsonResponse(
             {"message": "Actor added to movie successfully"}, status=status.HTTP_200_OK
         )
+
+
+class ActorCatalogSearchView(APIView):
+    catalog_search_service = CatalogSearchService()
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        page: KeysetPage = self.catalog_search_service.search_actors(
+            request.GET.get("query", default=""),
+            cursor=request.GET.get("cursor"),
+            page_size=request.GET.get("page_size"),
+        )
+        return JsonResponse(
+            {"data": page.data, "next": page.next_cursor}, status=status.HTTP_200_OK
+        )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from django.http import HttpRequest, JsonResponse
 from rest_framework import status
@@ -6,25 +6,46 @@ from rest_framework.parsers import JSONParser
 from rest_framework.utils.serializer_helpers import ReturnDict
 from rest_framework.views import APIView
 
+from movies.services.catalog_search_service import CatalogSearchService
+from movies.services.movie_facet_service import MovieFacetService
 from movies.services.movie_service import MovieService
 from movies.services.tmdb_service import TmdbService
+from movies.utils.keyset_pagination import KeysetPage
+from movies.utils.replica_router import read_from_replica
 
 
 # TODO: ask about ReturnList, ReturnDict and serialized types (serializer.data)
 class MovieView(APIView):
     movie_service: MovieService = MovieService(TmdbService())
 
+    @read_from_replica
     def get(self, request: HttpRequest, movie_id: Optional[int] = None) -> JsonResponse:
         if movie_id:
-            movie: dict = self.movie_service.get_movie(movie_id)
+            include: str = request.GET.get("include", "")
+            movie: Dict[str, Any] = self.movie_service.get_movie(
+                movie_id,
+                [name for name in include.split(",") if name],
+                request.GET.get("fields"),
+            )
             return JsonResponse({"data": movie}, status=status.HTTP_200_OK)
-        movies = self.movie_service.get_all_movies()
-        return JsonResponse({"data": movies}, status=status.HTTP_200_OK)
+        page: KeysetPage = self.movie_service.get_all_movies(
+            sort=request.GET.get("sort"),
+            cursor=request.GET.get("cursor"),
+            page_size=request.GET.get("page_size"),
+            fields=request.GET.get("fields"),
+            filters=request.GET,
+        )
+        return JsonResponse(
+            {"data": page.data, "next": page.next_cursor}, status=status.HTTP_200_OK
+        )
 
     def post(self, request: HttpRequest) -> JsonResponse:
         movie_id: int = JSONParser().parse(request)["movie_id"]
-        movie: dict = self.movie_service.create_movie(movie_id)
-        return JsonResponse({"data": movie}, status=status.HTTP_201_CREATED)
+        movie, created = self.movie_service.create_movie(movie_id)
+        return JsonResponse(
+            {"data": movie},
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
 
     def put(self, request: HttpRequest, movie_id: int) -> JsonResponse:
         update_request = JSONParser().parse(request)
@@ -50,6 +71,7 @@ class MovieActorsView(APIView):
 
     # permission_classes = [IsAuthenticated]
 
+    @read_from_replica
     def get(self, request: HttpRequest, movie_id: int) -> JsonResponse:
         movie_actors: ReturnDict = self.movie_service.get_movie_actors(movie_id)
         return JsonResponse({"data": movie_actors}, status=status.HTTP_200_OK)
@@ -74,6 +96,7 @@ class MovieGenresView(APIView):
             {"message": "Genres added to movie successfully"}, status=status.HTTP_200_OK
         )
 
+    @read_from_replica
     def get(self, request: HttpRequest, movie_id: int) -> JsonResponse:
         movie_genres = self.movie_service.get_genres_from_movie(movie_id)
         return JsonResponse({"data": movie_genres}, status=status.HTTP_200_OK)
@@ -84,5 +107,35 @@ class MovieSearchView(APIView):
 
     def get(self, request: HttpRequest) -> JsonResponse:
         search_query: str = request.GET.get("query", default="")
-        movies: ReturnDict = self.movie_service.movie_admin_search(search_query)
-        return JsonResponse({"data": movies}, status=status.HTTP_200_OK)
+        movies, stale = self.movie_service.movie_admin_search(search_query)
+        response = JsonResponse({"data": movies}, status=status.HTTP_200_OK)
+        if stale:
+            response["Warning"] = '110 - "Response is Stale"'
+        return response
+
+
+class MovieCatalogSearchView(APIView):
+    catalog_search_service = CatalogSearchService()
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        page: KeysetPage = self.catalog_search_service.search_movies(
+            request.GET.get("query", default=""),
+            cursor=request.GET.get("cursor"),
+            page_size=request.GET.get("page_size"),
+        )
+        return JsonResponse(
+            {"data": page.data, "next": page.next_cursor}, status=status.HTTP_200_OK
+        )
+
+
+# Takes the movie list filters genre, director, status, adult or a release year
+# range spanning one decade. Combinations the movie list serves from an index are
+# counted over the movies they match, up to FACET_COMBINED_MAX_MOVIES; broader
+# combinations and other filters get a 400
+class MovieFacetsView(APIView):
+    movie_facet_service = MovieFacetService()
+
+    @read_from_replica
+    def get(self, request: HttpRequest) -> JsonResponse:
+        facets: Dict[str, Any] = self.movie_facet_service.get_facets(request.GET)
+        return JsonResponse({"data": facets}, status=status.HTTP_200_OK)
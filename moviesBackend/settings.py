@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/4.1/ref/settings/
 import os
 from datetime import timedelta
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 import sys
 
 
@@ -29,7 +29,57 @@ SECRET_KEY = "django-insecure-t)t2w#+0occ#a%&fd*x=i8soau!0)k6rm(_%%()#=i)%mp0*x^
 DEBUG = True
 
 TMDB_KEY = os.environ.get("TMDB_KEY")
-TMDB_URI = "https://api.themoviedb.org/3/"
+TMDB_URI = os.environ.get("TMDB_URI", "https://api.themoviedb.org/3/")
+# Keep-alive connection pool shared by every TmdbClient in a process
+TMDB_POOL_CONNECTIONS = int(os.environ.get("TMDB_POOL_CONNECTIONS", 4))
+TMDB_POOL_MAXSIZE = int(os.environ.get("TMDB_POOL_MAXSIZE", 20))
+TMDB_POOL_BLOCK = True
+# In-process TMDB response cache, TTL in seconds per endpoint type
+TMDB_CACHE_ENABLED = True
+TMDB_CACHE_MAX_BYTES = int(os.environ.get("TMDB_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+TMDB_CACHE_TTL = {
+    "genre": 24 * 60 * 60,
+    "movie": 60 * 60,
+    "credits": 60 * 60,
+    "videos": 60 * 60,
+    "actor": 60 * 60,
+    "search": 60,
+}
+# Requests per second shared by every worker using TMDB_RATE_LIMIT_CACHE
+TMDB_RATE_LIMIT = int(os.environ.get("TMDB_RATE_LIMIT", 40))
+TMDB_MAX_RETRIES = 4
+TMDB_BACKOFF_BASE = 0.5
+TMDB_BACKOFF_MAX = 30.0
+# Per-process AIMD concurrency window, shrinks on 429s and slow responses
+TMDB_CONCURRENCY_MIN = 1
+TMDB_CONCURRENCY_MAX = TMDB_POOL_MAXSIZE
+TMDB_LATENCY_TARGET = 2.0
+# (connect, read) timeout in seconds for every TMDB call
+TMDB_TIMEOUT = (3.05, 10.0)
+# Fail fast after consecutive TMDB failures, probe again after the reset timeout
+TMDB_CIRCUIT_FAILURE_THRESHOLD = 5
+TMDB_CIRCUIT_RESET_TIMEOUT = 30.0
+TMDB_STALE_SEARCH_ENTRIES = 1000
+# Admin search results per normalized query, including empty ones
+SEARCH_CACHE_ENABLED = True
+SEARCH_CACHE_TTL = 5 * 60
+SEARCH_CACHE_MAX_ENTRIES = 5000
+# Persistent TMDB response store: "off", "record", "replay" or "read-through"
+TMDB_STORE_MODE = os.environ.get("TMDB_STORE_MODE", "off")
+TMDB_STORE_PATH = os.environ.get("TMDB_STORE_PATH", BASE_DIR / "tmdb_store.sqlite3")
+# Cast members imported per movie (None imports the full cast) and parallel fetches
+MOVIE_CAST_LIMIT = 5
+TMDB_CAST_CONCURRENCY = 8
+MOVIE_LISTING_LEAD_ACTORS = 3
+# Facet counts for combined filters are computed from at most this many movies
+FACET_COMBINED_MAX_MOVIES = 5000
+# Genre changes reach other processes through a version key in this cache, each
+# process checks it at most once per interval (seconds)
+GENRE_REGISTRY_CACHE = "shared"
+GENRE_REGISTRY_CHECK_INTERVAL = 5.0
+
+PAGE_SIZE = int(os.environ.get("PAGE_SIZE", 50))
+MAX_PAGE_SIZE = 200
 
 ALLOWED_HOSTS: List[str] = []
 
@@ -44,6 +94,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 CORS_ALLOWED_ORIGINS = [
@@ -59,6 +110,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "movies.utils.replica_router.PrimaryPinningMiddleware",
 ]
 
 ROOT_URLCONF = "moviesBackend.urls"
@@ -84,14 +136,34 @@ WSGI_APPLICATION = "moviesBackend.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
-DATABASES = {
+# Pooled connections go back to a per-process pool at the end of every request,
+# otherwise each thread keeps its own persistent connection
+DATABASE_POOL = os.environ.get("DATABASE_POOL", "true").lower() == "true"
+DATABASES: Dict[str, Dict[str, Any]] = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": (
+            "movies.db.pooled_postgresql"
+            if DATABASE_POOL
+            else "django.db.backends.postgresql"
+        ),
         "NAME": "filmweb",
         "USER": "postgres",
         "PASSWORD": "postgres",
         "HOST": "127.0.0.1",
         "PORT": "5432",
+        "CONN_MAX_AGE": 0 if DATABASE_POOL else 60,
+        "CONN_HEALTH_CHECKS": True,
+        "POOL": {
+            # Opened when the pool is created and kept open through quiet periods
+            "MIN_SIZE": int(os.environ.get("DATABASE_POOL_MIN_SIZE", 2)),
+            "MAX_SIZE": int(os.environ.get("DATABASE_POOL_MAX_SIZE", 20)),
+            # Seconds a checkout waits for a free connection before failing
+            "TIMEOUT": 10.0,
+            "MAX_IDLE": 5 * 60,
+            "MAX_LIFETIME": 60 * 60,
+            # Idle seconds after which a checkout pings the server first
+            "PING_AFTER_IDLE": 1.0,
+        },
     }
 }
 
@@ -101,6 +173,47 @@ if 'test' in sys.argv:
         'NAME': 'test_database'
     }
 
+# Comma-separated read replica hosts sharing the primary's credentials
+REPLICA_HOSTS = [
+    host.strip()
+    for host in os.environ.get("DATABASE_REPLICA_HOSTS", "").split(",")
+    if host.strip()
+]
+DATABASE_REPLICAS: List[str] = []
+for index, host in enumerate(REPLICA_HOSTS):
+    alias = f"replica_{index}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["movies.utils.replica_router.ReplicaRouter"]
+
+# State every worker process must see, e.g. the genre registry version. Set
+# CACHE_REDIS_URL for Redis, otherwise run createcachetable for the database table
+CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL")
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "shared": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_REDIS_URL,
+        }
+        if CACHE_REDIS_URL
+        else {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "shared_cache",
+        }
+    ),
+}
+# The quota counter needs an atomic incr, which the database cache lacks. Without
+# Redis every process counts its own quota
+TMDB_RATE_LIMIT_CACHE = "shared" if CACHE_REDIS_URL else "default"
+# Seconds a client keeps reading from the primary after a write, cover replica lag
+REPLICA_FRESHNESS_WINDOW = float(os.environ.get("REPLICA_FRESHNESS_WINDOW", 5))
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
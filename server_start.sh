@@ -1,3 +1,4 @@
 #!/bin/bash
 python manage.py migrate
+python manage.py createcachetable
 python manage.py runserver
\ No newline at end of file
@@ -1,10 +1,18 @@
 import datetime
+import json
 import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator
 
 import pytest
+from django.conf import settings
 
 from movies.models.movie import Movie
 from movies.payload.tmdb_actor_response import TmdbActorResponse
+from movies.utils.circuit_breaker import CircuitBreaker
+from movies.utils.genre_registry import GenreRegistry
+from movies.utils.tmdb_rate_limiter import TmdbRateLimiter
 
 RESOURCE_ID = 1
 ENCODING = "utf-8"
@@ -26,6 +34,74 @@ def tmdb_actor() -> TmdbActorResponse:
     )
 
 
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(tmp_path_factory) -> None:
+    # In-memory SQLite fails concurrent readers with "table is locked" instead of
+    # waiting, a file lets the import writer thread overlap with lookups
+    settings.DATABASES["default"]["TEST"]["NAME"] = str(
+        tmp_path_factory.mktemp("database") / "test_database.sqlite3"
+    )
+
+
+@pytest.fixture(autouse=True)
+def disable_tmdb_cache(settings) -> None:
+    # Services built in tests talk to mocks or FakeTmdbService, never reuse responses
+    settings.TMDB_CACHE_ENABLED = False
+    settings.SEARCH_CACHE_ENABLED = False
+
+
+@pytest.fixture(autouse=True)
+def close_tmdb_circuit_breaker() -> Iterator[None]:
+    # Failures recorded by one test must not trip the breaker for the next one
+    yield
+    CircuitBreaker.shared().record_success()
+
+
+@pytest.fixture(autouse=True)
+def reset_genre_registry(settings) -> None:
+    # bulk_create skips post_save, drop the registry built from an earlier test's rows
+    settings.GENRE_REGISTRY_CACHE = "default"
+    GenreRegistry.drop_snapshot()
+
+
+@pytest.fixture(autouse=True)
+def local_tmdb_rate_limiter(settings) -> Iterator[None]:
+    # The shared quota may live in Redis, tests keep it per process
+    settings.TMDB_RATE_LIMIT_CACHE = "default"
+    TmdbRateLimiter._shared = None
+    yield
+    TmdbRateLimiter._shared = None
+
+
+class TmdbRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        resource_id: str = self.path.split("?")[0].rstrip("/").split("/")[-1]
+        payload: Dict[str, Any] = {"path": self.path}
+        if resource_id.isdigit():
+            payload["id"] = int(resource_id)
+        body: bytes = json.dumps(payload).encode(ENCODING)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def tmdb_http_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TmdbRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def resource_id() -> int:
     return RESOURCE_ID
@@ -41,6 +117,7 @@ def cleanup() -> None:
 @pytest.fixture
 def tmdb_movie_response() -> dict:
     return {
+        "id": 13,
         "title": "Forrest Gump",
         "overview": "Description",
         "budget": 55000000.0,
@@ -80,6 +157,7 @@ def movie_1() -> Movie:
             "tagline": "The world will never be the same once you've seen it through the eyes of Forrest Gump.",
             "trailer_key": "0YAKkHutmFI",
             "director": "Robert Zemeckis",
+            "tmdb_id": 13,
         }
     )
 
@@ -102,6 +180,7 @@ def movie_2():
             "tagline": "The world forever changes.",
             "trailer_key": "e25RoI3rykw",
             "director": "Christopher Nolan",
+            "tmdb_id": 872585,
         }
     )
 
@@ -124,6 +203,7 @@ def movie_3():
             "tagline": "She's everything. He's just Ken.",
             "trailer_key": "74Ie5QZC3Mc",
             "director": "Greta Gerwig",
+            "tmdb_id": 346698,
         }
     )
 
@@ -145,6 +225,7 @@ def created_movie_response() -> dict:
         "status": "Released",
         "tagline": "The world will never be the same once you've seen it through the eyes of Forrest Gump.",
         "director": "Robert Zemeckis",
+        "tmdb_id": 13,
         "trailer_key": "0YAKkHutmFI",
     }
 
@@ -166,6 +247,7 @@ def get_full_movie_1_response() -> dict:
         "status": "Released",
         "tagline": "The world will never be the same once you've seen it through the eyes of Forrest Gump.",
         "director": "Robert Zemeckis",
+        "tmdb_id": 13,
         "trailer_key": "0YAKkHutmFI",
     }
 
@@ -179,6 +261,13 @@ def get_simple_movie_1_response() -> dict:
         "release_date": "1994-06-23",
         "duration": 142,
         "poster_key": "/arw2vcBveWOVZr6pxd9XTd1TdQa.jpg",
+        "director": "Robert Zemeckis",
+        "status": "Released",
+        "adult": False,
+        "revenue": 677387716.0,
+        "box_office": 55000000.0,
+        "genres": [],
+        "lead_actors": [],
     }
 
 
@@ -191,6 +280,13 @@ def get_simple_movie_2_response() -> dict:
         "duration": 181,
         "release_date": "2023-07-19",
         "poster_key": "/8Gxv8gSFCU0XGDykEGv7zR1n2ua.jpg",
+        "director": "Christopher Nolan",
+        "status": "Released",
+        "adult": False,
+        "revenue": 671426709.0,
+        "box_office": 100000000.0,
+        "genres": [],
+        "lead_actors": [],
     }
 
 
@@ -203,6 +299,13 @@ def get_simple_movie_3_response() -> dict:
         "description": "Barbie and Ken are having the time of their lives in the colorful and seemingly perfect world of Barbie Land. However, when they get a chance to go to the real world, they soon discover the joys and perils of living among humans.",
         "duration": 114,
         "poster_key": "/iuFNMS8U5cb6xfzi51Dbkovj7vM.jpg",
+        "director": "Greta Gerwig",
+        "status": "Released",
+        "adult": False,
+        "revenue": 1202507382.0,
+        "box_office": 145000000.0,
+        "genres": [],
+        "lead_actors": [],
     }
 
 
@@ -290,6 +393,22 @@ def movie_genres_data() -> dict:
     }
 
 
+@pytest.fixture
+def tmdb_movie_search() -> Dict[str, Any]:
+    return {
+        "page": 1,
+        "results": [
+            {
+                "id": 13,
+                "title": "Forrest Gump",
+                "poster_path": "/arw2vcBveWOVZr6pxd9XTd1TdQa.jpg",
+            }
+        ],
+        "total_pages": 1,
+        "total_results": 1,
+    }
+
+
 # @pytest.fixture
 # def tmdb_movie_search() -> bytes:
 #     return json.dumps(
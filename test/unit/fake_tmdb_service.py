@@ -1,8 +1,9 @@
-from typing import Dict
+from typing import Any, Dict, Optional
 
 
 class FakeTmdbService:
     responses: Dict[str, dict] = {}
+    cache = None
 
     def clear_responses(self) -> None:
         self.responses.clear()
@@ -13,11 +14,24 @@ class FakeTmdbService:
     def fetch_movie(self, movie_id: int) -> dict:
         return self.responses.get("fetch_movie")
 
+    def fetch_full_movie(self, movie_id: int) -> Dict[str, Any]:
+        return {
+            **self.responses.get("fetch_movie", {}),
+            **self.responses.get("fetch_movie_credits", {}),
+            **self.responses.get("fetch_movie_trailer", {}),
+        }
+
     def fetch_movie_trailer(self, movie_id: int) -> dict:
         return self.responses.get("fetch_movie_trailer")
 
     def fetch_movie_credits(self, movie_id: int) -> dict:
         return self.responses.get("fetch_movie_credits")
 
+    def movie_search(self, search_query: str) -> Optional[Dict[str, Any]]:
+        response = self.responses.get("movie_search")
+        if isinstance(response, Exception):
+            raise response
+        return response
+
     def fetch_genre_list(self, movie_id: int) -> dict:
         return self.responses.get("fetch_genre_list")
@@ -0,0 +1,112 @@
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from movies.models.actor import Actor
+from movies.services.actor_service import ActorService
+
+actor_service = ActorService()
+
+
+def tmdb_actor_details(name: str, birthday: Optional[str]) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "biography": "Description",
+        "place_of_birth": "Haverfordwest, Pembrokeshire, Wales, UK",
+        "birthday": birthday,
+        "imdb_id": "nm0000288",
+        "profile_path": "/qCpZn2e3dimwbryLnqxZuI88PTi.jpg",
+    }
+
+
+@pytest.mark.django_db
+def test_should_reuse_existing_actors_and_create_missing_in_one_batch(
+    mocker: MockerFixture, settings
+):
+    # given
+    settings.MOVIE_CAST_LIMIT = None
+    Actor.from_response(tmdb_actor_details("Christian Bale", "1974-01-30")).save()
+    fetch_actors: AsyncMock = mocker.patch.object(
+        actor_service.async_tmdb_service,
+        "fetch_actors",
+        new=AsyncMock(
+            return_value=[
+                tmdb_actor_details("Christian Bale", "1974-01-30"),
+                tmdb_actor_details("Heath Ledger", "1979-04-04"),
+                tmdb_actor_details("Unknown", None),
+            ]
+        ),
+    )
+
+    # when
+    result: List[Actor] = actor_service.get_or_create_actors(list(range(1, 8)))
+
+    # then
+    fetch_actors.assert_awaited_once_with(list(range(1, 8)))
+    assert [actor.name for actor in result] == ["Christian Bale", "Heath Ledger"]
+    assert all(actor.id for actor in result)
+    assert Actor.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_should_limit_imported_cast_size(mocker: MockerFixture, settings):
+    # given
+    settings.MOVIE_CAST_LIMIT = 2
+    fetch_actors: AsyncMock = mocker.patch.object(
+        actor_service.async_tmdb_service,
+        "fetch_actors",
+        new=AsyncMock(return_value=[]),
+    )
+
+    # when
+    actor_service.get_or_create_actors([1, 2, 3, 4])
+
+    # then
+    fetch_actors.assert_awaited_once_with([1, 2])
+
+
+@pytest.mark.django_db
+def test_should_upsert_actors_in_one_statement(django_assert_num_queries):
+    # given
+    existing = Actor.from_response(tmdb_actor_details("Christian Bale", "1974-01-30"))
+    existing.biography = "Edited"
+    existing.save()
+    actors: List[Actor] = [
+        Actor.from_response(tmdb_actor_details("Heath Ledger", "1979-04-04")),
+        Actor.from_response(tmdb_actor_details("Christian Bale", "1974-01-30")),
+        Actor.from_response(tmdb_actor_details("Heath Ledger", "1979-04-04")),
+    ]
+
+    # when
+    with django_assert_num_queries(1):
+        result: List[Actor] = actor_service.save_actors(actors)
+
+    # then
+    assert [actor.name for actor in result] == [
+        "Heath Ledger",
+        "Christian Bale",
+        "Heath Ledger",
+    ]
+    assert result[1].id == existing.id
+    assert result[1].biography == "Edited"
+    assert result[0].id == result[2].id
+    assert Actor.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_should_list_only_requested_actor_fields(django_assert_num_queries, settings):
+    # given
+    settings.PAGE_SIZE = 1
+    Actor.from_response(tmdb_actor_details("Christian Bale", "1974-01-30")).save()
+    Actor.from_response(tmdb_actor_details("Heath Ledger", "1979-04-04")).save()
+
+    # when
+    with django_assert_num_queries(1) as queries:
+        page = actor_service.get_all_actors(sort="name", fields="id,name")
+
+    # then
+    assert page.data == [{"id": page.data[0]["id"], "name": "Christian Bale"}]
+    assert page.next_cursor is not None
+    assert '"biography"' not in queries.captured_queries[0]["sql"]
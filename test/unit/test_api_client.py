@@ -5,7 +5,7 @@ from pytest_mock import MockerFixture
 from requests.models import HTTPError
 from rest_framework.exceptions import APIException
 
-from movies.utils.tmdb_client import TmdbClient
+from movies.utils.tmdb_client import TmdbClient, TmdbSessionPool
 
 api_client = TmdbClient()
 
@@ -27,3 +27,27 @@ def test_should_raise_api_exception(mocker: MockerFixture):
 def test_should_prepare_valid_uri(resource_id):
     result = api_client.prepare_uri("movies", f"{resource_id}", "actors")
     assert result == "https://api.themoviedb.org/3/movies/1/actors"
+
+
+def test_should_share_one_session_between_clients():
+    # when
+    first_session = TmdbSessionPool.get_session()
+    second_session = TmdbSessionPool.get_session()
+
+    # then
+    assert first_session is second_session
+
+
+def test_should_reuse_keep_alive_connections(tmdb_http_server):
+    # given
+    TmdbSessionPool.close()
+    client = TmdbClient()
+    client.base_uri = tmdb_http_server
+
+    # when
+    for _ in range(3):
+        client.get("movie/1")
+    stats = TmdbClient.connection_stats()
+
+    # then
+    assert stats == {"requests": 3, "connections": 1, "reused": 2}
@@ -0,0 +1,75 @@
+import datetime
+
+import pytest
+
+from movies.models.actor import Actor
+from movies.models.movie import Movie
+from movies.services.catalog_search_service import CatalogSearchService
+
+catalog_search_service = CatalogSearchService()
+
+
+@pytest.fixture
+def catalog(movie_1, movie_2, movie_3) -> None:
+    movie_1.save()
+    movie_2.save()
+    movie_3.tagline = "Ken and the bomb"
+    movie_3.save()
+    Movie.objects.create(
+        title="Bombshell",
+        description="Not about bombs",
+        release_date=datetime.date(2019, 12, 13),
+        tmdb_id=525661,
+    )
+
+
+@pytest.mark.django_db
+def test_should_rank_title_matches_before_tagline_and_description(catalog):
+    # when
+    result = catalog_search_service.search_movies("  BOMB ")
+
+    # then
+    assert [movie["title"] for movie in result.data] == [
+        "Bombshell",
+        "Barbie",
+        "Oppenheimer",
+    ]
+    assert result.next_cursor is None
+
+
+@pytest.mark.django_db
+def test_should_page_through_ranked_results(catalog):
+    # given
+    first_page = catalog_search_service.search_movies("bomb", page_size=2)
+
+    # when
+    second_page = catalog_search_service.search_movies(
+        "bomb", first_page.next_cursor, page_size=2
+    )
+
+    # then
+    assert [movie["title"] for movie in first_page.data] == ["Bombshell", "Barbie"]
+    assert [movie["title"] for movie in second_page.data] == ["Oppenheimer"]
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.django_db
+def test_should_search_actors_by_name_and_biography():
+    # given
+    Actor.objects.create(name="Tom Hanks", biography="Played Forrest Gump")
+    Actor.objects.create(name="Robin Wright", biography="Starred with Tom Hanks")
+
+    # when
+    result = catalog_search_service.search_actors("hanks")
+
+    # then
+    assert [actor["name"] for actor in result.data] == ["Tom Hanks", "Robin Wright"]
+
+
+def test_should_return_empty_page_for_blank_query():
+    # when
+    result = catalog_search_service.search_movies("   ")
+
+    # then
+    assert result.data == []
+    assert result.next_cursor is None
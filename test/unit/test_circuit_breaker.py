@@ -0,0 +1,98 @@
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from movies.utils.async_tmdb_client import AsyncTmdbClient
+from movies.utils.circuit_breaker import CircuitBreaker, CircuitState, TmdbUnavailable
+
+
+def test_should_open_after_consecutive_failures():
+    # given
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_response(503)
+
+    # when
+    with pytest.raises(TmdbUnavailable) as e:
+        breaker.before_call()
+
+    # then
+    assert e.value.status_code == 503
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_should_let_one_probe_through_after_reset_timeout(mocker: MockerFixture):
+    # given
+    monotonic: MagicMock = mocker.patch(
+        "movies.utils.circuit_breaker.time.monotonic", return_value=100.0
+    )
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    monotonic.return_value = 131.0
+
+    # when
+    breaker.before_call()
+    probe_state: CircuitState = breaker.state
+
+    # then
+    assert probe_state is CircuitState.HALF_OPEN
+    with pytest.raises(TmdbUnavailable):
+        breaker.before_call()
+    breaker.record_response(404)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_should_reopen_when_probe_fails(mocker: MockerFixture):
+    # given
+    monotonic: MagicMock = mocker.patch(
+        "movies.utils.circuit_breaker.time.monotonic", return_value=100.0
+    )
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    monotonic.return_value = 131.0
+    breaker.before_call()
+
+    # when
+    breaker.record_failure()
+
+    # then
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_in() == 30.0
+
+
+def test_should_reopen_when_probe_is_cancelled(mocker: MockerFixture):
+    # given
+    monotonic: MagicMock = mocker.patch(
+        "movies.utils.circuit_breaker.time.monotonic", return_value=100.0
+    )
+    client = AsyncTmdbClient()
+    client.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    client.circuit_breaker.record_failure()
+    monotonic.return_value = 131.0
+
+    async def hang(*args: Any) -> None:
+        await asyncio.sleep(10)
+
+    mocker.patch.object(client, "send_with_retries", side_effect=hang)
+
+    async def cancel_probe() -> None:
+        probe: "asyncio.Task[httpx.Response]" = asyncio.ensure_future(
+            client.get("movie/1")
+        )
+        await asyncio.sleep(0)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    # when
+    asyncio.run(cancel_probe())
+
+    # then
+    assert client.circuit_breaker.state is CircuitState.OPEN
+    monotonic.return_value = 162.0
+    assert client.circuit_breaker.before_call()
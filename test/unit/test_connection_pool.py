@@ -0,0 +1,177 @@
+import threading
+from typing import Any, Dict, List
+
+import pytest
+
+from movies.db.connection_pool import ConnectionPool, PoolTimeout
+from movies.db.pooled_postgresql.base import DatabaseWrapper
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+        self.healthy = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def create_pool(**options) -> ConnectionPool:
+    return ConnectionPool(
+        check=lambda connection, idle: connection.healthy,
+        reset=lambda connection: not connection.closed,
+        **options,
+    )
+
+
+def test_should_reuse_returned_connection():
+    # given
+    pool: ConnectionPool = create_pool(max_size=2)
+    first = pool.checkout(FakeConnection)
+    pool.checkin(first)
+
+    # when
+    second = pool.checkout(FakeConnection)
+
+    # then
+    assert second is first
+    assert pool.stats()["opened"] == 1
+    assert pool.stats()["in_use"] == 1
+
+
+def test_should_replace_connection_failing_health_check():
+    # given
+    pool: ConnectionPool = create_pool(max_size=1)
+    broken = pool.checkout(FakeConnection)
+    pool.checkin(broken)
+    broken.healthy = False
+
+    # when
+    connection = pool.checkout(FakeConnection)
+
+    # then
+    assert connection is not broken
+    assert broken.closed
+    assert pool.stats()["health_check_failures"] == 1
+    assert pool.stats()["size"] == 1
+
+
+def test_should_open_min_size_connections_ahead_of_time():
+    # given
+    pool: ConnectionPool = create_pool(min_size=2, max_size=3)
+    pool.prewarm(FakeConnection)
+
+    # when
+    connection = pool.checkout(FakeConnection)
+
+    # then
+    assert isinstance(connection, FakeConnection)
+    stats: Dict[str, int] = pool.stats()
+    assert stats["opened"] == stats["size"] == 2
+    assert stats["idle"] == 1
+
+
+def test_should_prewarm_once_per_pool():
+    # given
+    pool: ConnectionPool = create_pool(min_size=1, max_size=3)
+    pool.prewarm(FakeConnection)
+    pool.checkout(FakeConnection)
+
+    # when
+    pool.prewarm(FakeConnection)
+
+    # then
+    assert pool.stats()["opened"] == 1
+    assert pool.stats()["idle"] == 0
+
+
+def test_should_keep_separate_pools_per_database_of_an_alias():
+    # given
+    settings_dict: Dict[str, Any] = {
+        "HOST": "127.0.0.1",
+        "PORT": "5432",
+        "NAME": "filmweb",
+        "USER": "postgres",
+        "OPTIONS": {},
+    }
+    ConnectionPool.close_all()
+    wrapper = DatabaseWrapper(dict(settings_dict), "default")
+
+    # when
+    # Like create_test_db, which renames the database of the open connection
+    test_wrapper = DatabaseWrapper({**settings_dict, "NAME": "test_filmweb"}, "default")
+
+    # then
+    assert test_wrapper.pool is not wrapper.pool
+    assert DatabaseWrapper(dict(settings_dict), "default").pool is wrapper.pool
+    ConnectionPool.close_all()
+
+
+def test_should_stop_prewarming_when_connecting_fails():
+    # given
+    pool: ConnectionPool = create_pool(min_size=2, max_size=3)
+    attempts: List[FakeConnection] = []
+
+    def connect() -> FakeConnection:
+        if attempts:
+            raise ConnectionError("database is down")
+        attempts.append(FakeConnection())
+        return attempts[0]
+
+    # when
+    pool.prewarm(connect)
+
+    # then
+    assert pool.stats()["size"] == pool.stats()["idle"] == 1
+    assert pool.checkout(FakeConnection) is attempts[0]
+
+
+def test_should_close_idle_connections_above_min_size():
+    # given
+    pool: ConnectionPool = create_pool(min_size=1, max_size=3, max_idle=0)
+    connections: List[FakeConnection] = [
+        pool.checkout(FakeConnection) for _ in range(3)
+    ]
+
+    # when
+    for connection in connections:
+        pool.checkin(connection)
+
+    # then
+    assert [connection.closed for connection in connections] == [True, True, False]
+    assert pool.stats()["size"] == 1
+
+
+def test_should_time_out_and_count_saturation():
+    # given
+    pool: ConnectionPool = create_pool(max_size=1, timeout=0.05)
+    pool.checkout(FakeConnection)
+
+    # when
+    with pytest.raises(PoolTimeout):
+        pool.checkout(FakeConnection)
+
+    # then
+    stats: Dict[str, int] = pool.stats()
+    assert stats["waits"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["size"] == stats["max_size"] == 1
+
+
+def test_should_hand_connection_to_waiting_thread():
+    # given
+    pool: ConnectionPool = create_pool(max_size=1, timeout=5)
+    connection = pool.checkout(FakeConnection)
+    received: List[FakeConnection] = []
+    waiter = threading.Thread(
+        target=lambda: received.append(pool.checkout(FakeConnection))
+    )
+    waiter.start()
+
+    # when
+    pool.checkin(connection)
+    waiter.join(timeout=5)
+
+    # then
+    assert received == [connection]
+    assert pool.stats()["opened"] == 1
@@ -0,0 +1,122 @@
+from io import StringIO
+from typing import Optional
+
+import pytest
+from django.core.cache import caches
+from django.core.management import call_command
+from pytest_mock import MockerFixture
+
+from movies.models import Genre
+from movies.serializers.genre_serializer import FullGenreSerializer
+from movies.utils.genre_registry import VERSION_KEY, GenreRegistry
+
+
+@pytest.mark.django_db
+def test_should_resolve_genres_without_queries(django_assert_num_queries):
+    # given
+    comedy = Genre.objects.create(name="Comedy", tmdb_id=35)
+    drama = Genre.objects.create(name="Drama")
+    GenreRegistry.current()
+
+    # when
+    with django_assert_num_queries(0):
+        result = GenreRegistry.current().resolve(
+            [
+                {"id": 35, "name": "Komedia"},
+                {"id": 18, "name": "Drama"},
+                {"id": 10749, "name": "Romance"},
+                {"id": 35, "name": "Comedy"},
+            ]
+        )
+
+    # then
+    assert result == [comedy.id, drama.id]
+
+
+@pytest.mark.django_db
+def test_should_refresh_registry_when_genre_table_changes():
+    # given
+    Genre.objects.create(name="Comedy")
+    registry = GenreRegistry.current()
+
+    # when
+    western = Genre.objects.create(name="Western", tmdb_id=37)
+
+    # then
+    assert "Western" not in registry.ids_by_name
+    assert GenreRegistry.current().ids_by_tmdb_id == {37: western.id}
+
+    # when
+    western.delete()
+
+    # then
+    assert "Western" not in GenreRegistry.current().ids_by_name
+
+
+@pytest.mark.django_db
+def test_should_refresh_registry_changed_by_another_process(settings):
+    # given
+    registry = GenreRegistry.current()
+    # Another process creates a genre, no signal reaches this one
+    Genre.objects.bulk_create([Genre(name="Western", tmdb_id=37)])
+    caches[settings.GENRE_REGISTRY_CACHE].set(VERSION_KEY, "other process")
+
+    # when
+    cached = GenreRegistry.current()
+    settings.GENRE_REGISTRY_CHECK_INTERVAL = 0
+    refreshed = GenreRegistry.current()
+
+    # then
+    assert cached is registry
+    assert "Western" in refreshed.ids_by_name
+
+
+@pytest.mark.django_db
+def test_should_publish_genre_change_once_committed(
+    settings, django_capture_on_commit_callbacks
+):
+    # given
+    cache = caches[settings.GENRE_REGISTRY_CACHE]
+    version: Optional[str] = cache.get(VERSION_KEY)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        Genre.objects.create(name="Western")
+        uncommitted_version: Optional[str] = cache.get(VERSION_KEY)
+
+    # then
+    assert uncommitted_version == version
+    assert cache.get(VERSION_KEY) != version
+
+
+@pytest.mark.django_db
+def test_should_sync_genres_from_tmdb(mocker: MockerFixture):
+    # given
+    Genre.objects.create(name="Comedy")
+    mocker.patch(
+        "movies.services.tmdb_service.TmdbService.fetch_genre_list",
+        return_value={
+            "genres": [{"id": 35, "name": "Comedy"}, {"id": 18, "name": "Drama"}]
+        },
+    )
+
+    # when
+    call_command("sync_genres", stdout=StringIO())
+
+    # then
+    assert Genre.objects.count() == 2
+    assert GenreRegistry.current().ids_by_tmdb_id[35] == (
+        Genre.objects.get(name="Comedy").id
+    )
+
+
+@pytest.mark.django_db
+def test_should_replace_unknown_genre_name_with_other():
+    # when
+    serializer = FullGenreSerializer(
+        data=[{"name": "Drama"}, {"name": "Polka"}], many=True
+    )
+
+    # then
+    assert serializer.is_valid()
+    assert [genre["name"] for genre in serializer.validated_data] == ["Drama", "Other"]
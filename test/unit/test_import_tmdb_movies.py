@@ -0,0 +1,150 @@
+import gzip
+import json
+import threading
+from io import StringIO
+from typing import Any, Dict, List, Set
+from unittest.mock import AsyncMock
+
+import pytest
+from django.core.management import call_command
+from pytest_mock import MockerFixture
+from rest_framework.exceptions import NotFound
+
+from movies.management.commands.import_tmdb_movies import Command
+from movies.models import Genre, Movie, MovieGenre
+from movies.services.movie_service import MovieService
+
+
+@pytest.fixture
+def tmdb_export(tmp_path) -> str:
+    path = tmp_path / "movie_ids.json.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as export:
+        for tmdb_id in (13, 14, 15):
+            export.write(json.dumps({"id": tmdb_id, "adult": False}) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def full_tmdb_movie(tmdb_movie_response, tmdb_movie_trailer, tmdb_movie_credits):
+    def full_tmdb_movie(tmdb_id: int) -> Dict[str, Any]:
+        if tmdb_id == 15:
+            raise NotFound()
+        return {
+            **tmdb_movie_response,
+            **tmdb_movie_credits,
+            **tmdb_movie_trailer,
+            "id": tmdb_id,
+            "title": f"Movie {tmdb_id}",
+        }
+
+    return full_tmdb_movie
+
+
+@pytest.mark.django_db(transaction=True)
+def test_should_stream_export_into_movies_with_checkpoint(
+    mocker: MockerFixture, tmdb_export, full_tmdb_movie
+):
+    # given
+    Genre.objects.bulk_create([Genre(name="Comedy"), Genre(name="Drama")])
+    mocker.patch(
+        "movies.services.async_tmdb_service.AsyncTmdbService.fetch_full_movie",
+        new=AsyncMock(side_effect=full_tmdb_movie),
+    )
+    output = StringIO()
+
+    # when
+    call_command("import_tmdb_movies", tmdb_export, "--batch-size", "2", stdout=output)
+
+    # then
+    assert set(Movie.objects.values_list("tmdb_id", flat=True)) == {13, 14}
+    assert MovieGenre.objects.count() == 4
+    assert "2 imported, 1 skipped, 0 failed" in output.getvalue()
+    with open(f"{tmdb_export}.checkpoint") as checkpoint:
+        assert json.load(checkpoint) == {"line": 3}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_should_resume_after_checkpoint(
+    mocker: MockerFixture, tmdb_export, full_tmdb_movie
+):
+    # given
+    with open(f"{tmdb_export}.checkpoint", "w") as checkpoint:
+        json.dump({"line": 1}, checkpoint)
+    fetch_full_movie: AsyncMock = mocker.patch(
+        "movies.services.async_tmdb_service.AsyncTmdbService.fetch_full_movie",
+        new=AsyncMock(side_effect=full_tmdb_movie),
+    )
+
+    # when
+    call_command("import_tmdb_movies", tmdb_export, "--resume", stdout=StringIO())
+
+    # then
+    assert sorted(call.args[0] for call in fetch_full_movie.await_args_list) == [14, 15]
+    assert list(Movie.objects.values_list("tmdb_id", flat=True)) == [14]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_should_look_up_next_batch_while_previous_batch_is_written(
+    mocker: MockerFixture, tmdb_export, full_tmdb_movie
+):
+    # given
+    mocker.patch(
+        "movies.services.async_tmdb_service.AsyncTmdbService.fetch_full_movie",
+        new=AsyncMock(side_effect=full_tmdb_movie),
+    )
+    lookups: List[List[int]] = []
+    second_lookup = threading.Event()
+    find_existing_tmdb_ids = MovieService.find_existing_tmdb_ids
+
+    def record_lookup(tmdb_ids) -> Set[int]:
+        lookups.append(list(tmdb_ids))
+        if len(lookups) == 2:
+            second_lookup.set()
+        return find_existing_tmdb_ids(tmdb_ids)
+
+    write_batch = Command.write_batch
+    overlapped: List[bool] = []
+
+    def wait_for_next_lookup(command, payloads, last_line):
+        if not overlapped:
+            # Serialized pipelines never reach the second lookup during this write
+            overlapped.append(second_lookup.wait(timeout=5))
+        return write_batch(command, payloads, last_line)
+
+    mocker.patch.object(
+        MovieService, "find_existing_tmdb_ids", side_effect=record_lookup
+    )
+    mocker.patch.object(
+        Command, "write_batch", autospec=True, side_effect=wait_for_next_lookup
+    )
+
+    # when
+    call_command(
+        "import_tmdb_movies", tmdb_export, "--batch-size", "1", stdout=StringIO()
+    )
+
+    # then
+    assert overlapped == [True]
+    assert set(Movie.objects.values_list("tmdb_id", flat=True)) == {13, 14}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_should_not_count_movies_dropped_on_conflict_as_imported(
+    mocker: MockerFixture, tmdb_export, full_tmdb_movie, movie_1
+):
+    # given
+    movie_1.tmdb_id = None
+    movie_1.title = "Movie 14"
+    movie_1.save()
+    mocker.patch(
+        "movies.services.async_tmdb_service.AsyncTmdbService.fetch_full_movie",
+        new=AsyncMock(side_effect=full_tmdb_movie),
+    )
+    output = StringIO()
+
+    # when
+    call_command("import_tmdb_movies", tmdb_export, stdout=output)
+
+    # then
+    assert set(Movie.objects.values_list("tmdb_id", flat=True)) == {None, 13}
+    assert "1 imported, 2 skipped, 0 failed" in output.getvalue()
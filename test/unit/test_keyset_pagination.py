@@ -0,0 +1,78 @@
+import datetime
+from typing import List
+
+import pytest
+from rest_framework.exceptions import ValidationError
+
+from movies.models.actor import Actor
+from movies.services.actor_service import ActorService
+
+actor_service = ActorService()
+
+
+@pytest.fixture
+def actors() -> None:
+    Actor.objects.bulk_create(
+        [
+            Actor(name=name, date_of_birth=datetime.date(1970 + index % 2, 1, 1))
+            for index, name in enumerate(["Eve", "Bob", "Dan", "Amy", "Cid"])
+        ]
+    )
+
+
+def collect_names(sort: str, page_size: int) -> List[str]:
+    names: List[str] = []
+    cursor = None
+    while True:
+        page = actor_service.get_all_actors(sort, cursor, page_size)
+        names.extend(actor["name"] for actor in page.data)
+        assert len(page.data) <= page_size
+        if page.next_cursor is None:
+            return names
+        cursor = page.next_cursor
+
+
+@pytest.mark.django_db
+def test_should_walk_all_pages_in_sort_order(actors):
+    # then
+    assert collect_names("name", 2) == ["Amy", "Bob", "Cid", "Dan", "Eve"]
+    assert collect_names("-name", 3) == ["Eve", "Dan", "Cid", "Bob", "Amy"]
+    assert collect_names("date_of_birth", 2) == ["Eve", "Dan", "Cid", "Bob", "Amy"]
+    assert collect_names("-id", 4) == ["Cid", "Amy", "Dan", "Bob", "Eve"]
+
+
+@pytest.mark.django_db
+def test_should_not_repeat_rows_inserted_before_cursor(actors):
+    # given
+    first_page = actor_service.get_all_actors("name", page_size=2)
+    Actor.objects.create(name="Abe", date_of_birth=datetime.date(1980, 1, 1))
+
+    # when
+    second_page = actor_service.get_all_actors("name", first_page.next_cursor, 2)
+
+    # then
+    assert [actor["name"] for actor in first_page.data] == ["Amy", "Bob"]
+    assert [actor["name"] for actor in second_page.data] == ["Cid", "Dan"]
+
+
+@pytest.mark.django_db
+def test_should_reject_cursor_from_other_sort_order(actors):
+    # given
+    cursor = actor_service.get_all_actors("name", page_size=2).next_cursor
+
+    # when
+    with pytest.raises(ValidationError) as error:
+        actor_service.get_all_actors("-name", cursor, 2)
+
+    # then
+    assert "cursor" in error.value.detail
+
+
+@pytest.mark.parametrize(
+    "sort, cursor, page_size",
+    [("biography", None, None), ("id", "not-a-cursor", None), ("id", None, 0)],
+)
+def test_should_reject_invalid_page_request(sort, cursor, page_size):
+    # when
+    with pytest.raises(ValidationError):
+        actor_service.get_all_actors(sort, cursor, page_size)
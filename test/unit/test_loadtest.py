@@ -0,0 +1,100 @@
+from typing import Any, Dict
+
+import pytest
+import requests
+
+from movies.loadtest.driver import (
+    TOTAL,
+    EndpointReport,
+    LoadDriver,
+    TrafficRequest,
+    compare_reports,
+    percentile,
+)
+from movies.loadtest.emulator import EmulatorConfig, TmdbEmulator
+
+
+@pytest.fixture
+def tmdb_emulator():
+    emulator = TmdbEmulator(EmulatorConfig(latency=0.0, jitter=0.0))
+    emulator.start()
+    yield emulator
+    emulator.stop()
+
+
+def test_should_serve_appended_movie_fixture(tmdb_emulator):
+    # when
+    response = requests.get(
+        f"{tmdb_emulator.base_uri}3/movie/550",
+        params={"append_to_response": "videos,credits"},
+    )
+
+    # then
+    movie: Dict[str, Any] = response.json()
+    assert response.status_code == 200
+    assert movie["id"] == 550
+    assert movie["title"] == "Forrest Gump 550"
+    assert movie["credits"]["crew"][0]["job"] == "Director"
+    assert movie["videos"]["results"][0]["official"] is True
+
+
+def test_should_inject_throttling_with_retry_after(tmdb_emulator):
+    # given
+    tmdb_emulator.server.RequestHandlerClass.config.throttle_rate = 1.0
+
+    # when
+    response = requests.get(f"{tmdb_emulator.base_uri}person/31")
+
+    # then
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_should_report_latency_percentiles_per_endpoint(tmdb_emulator):
+    # given
+    driver = LoadDriver(
+        base_url=tmdb_emulator.base_uri,
+        traffic=[
+            TrafficRequest(method="GET", path="/movie/1"),
+            TrafficRequest(method="GET", path="/movie/2/credits"),
+            TrafficRequest(method="GET", path="/unknown"),
+        ],
+        rps=60,
+        duration=0.5,
+        concurrency=4,
+    )
+
+    # when
+    reports: Dict[str, EndpointReport] = driver.run()
+
+    # then
+    assert reports["GET /movie/{id}"].requests == 10
+    assert reports["GET /movie/{id}/credits"].errors == 0
+    assert reports["GET /unknown"].errors == 10
+    assert reports[TOTAL].requests == 30
+    assert reports[TOTAL].p50 <= reports[TOTAL].p95 <= reports[TOTAL].p99
+
+
+def test_should_use_nearest_rank_percentile():
+    # given
+    latencies = [float(value) for value in range(1, 101)]
+
+    # then
+    assert percentile(latencies, 50) == 50.0
+    assert percentile(latencies, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_should_flag_regressions_against_baseline():
+    # given
+    baseline = {"GET /movies": EndpointReport(100, 0, 20.0, 0.01, 0.02, 0.03)}
+    current = {"GET /movies": EndpointReport(100, 5, 20.0, 0.01, 0.05, 0.06)}
+
+    # when
+    regressions = compare_reports(current, baseline, tolerance=0.1)
+
+    # then
+    assert regressions == [
+        "GET /movies: p95 20.0ms -> 50.0ms",
+        "GET /movies: error rate 0.0% -> 5.0%",
+    ]
@@ -0,0 +1,170 @@
+from typing import Any, Dict
+
+import pytest
+from django.db.models import QuerySet
+from pytest_mock import MockerFixture
+from rest_framework.exceptions import ValidationError
+
+from movies.models import Genre, Movie, MovieFacetCount, MovieGenre
+from movies.services.movie_facet_service import MovieFacetService
+from movies.services.movie_listing_service import MovieListingService
+
+movie_facet_service = MovieFacetService()
+
+
+def stored_counts() -> Dict[Any, int]:
+    return {
+        (row.filter_facet, row.filter_value, row.facet, row.value): row.count
+        for row in MovieFacetCount.objects.filter(count__gt=0)
+    }
+
+
+@pytest.mark.django_db
+def test_should_count_facets_incrementally_like_recompute(movie_1, movie_2, movie_3):
+    # given
+    for movie in (movie_1, movie_2, movie_3):
+        movie.save()
+    drama = Genre.objects.create(name="Drama")
+    comedy = Genre.objects.create(name="Comedy")
+    MovieGenre.objects.create(movie=movie_1, genre=drama)
+    MovieGenre.objects.create(movie=movie_2, genre=drama)
+    MovieGenre.objects.create(movie=movie_3, genre=comedy)
+
+    # when
+    movie_2.status = "Post Production"
+    movie_2.save()
+    comedy.name = "Satire"
+    comedy.save()
+    movie_1.delete()
+    incremental: Dict[Any, int] = stored_counts()
+    MovieFacetService.recompute()
+
+    # then
+    assert incremental == stored_counts()
+    assert movie_facet_service.get_facets({}) == {
+        "genre": [{"value": "Drama", "count": 1}, {"value": "Satire", "count": 1}],
+        "decade": [{"value": "2020", "count": 2}],
+        "status": [
+            {"value": "Post Production", "count": 1},
+            {"value": "Released", "count": 1},
+        ],
+        "director": [
+            {"value": "Christopher Nolan", "count": 1},
+            {"value": "Greta Gerwig", "count": 1},
+        ],
+        "adult": [{"value": "false", "count": 2}],
+    }
+
+
+@pytest.mark.django_db
+def test_should_count_facets_for_active_filter(
+    django_assert_num_queries, movie_1, movie_2, movie_3
+):
+    # given
+    for movie in (movie_1, movie_2, movie_3):
+        movie.save()
+
+    # when
+    with django_assert_num_queries(1):
+        facets: Dict[str, Any] = movie_facet_service.get_facets(
+            {"release_year_min": "2020", "release_year_max": "2029"}
+        )
+
+    # then
+    assert facets["decade"] == [{"value": "2020", "count": 2}]
+    assert [row["value"] for row in facets["director"]] == [
+        "Christopher Nolan",
+        "Greta Gerwig",
+    ]
+
+
+@pytest.mark.django_db
+def test_should_count_facets_for_combined_filters(movie_1, movie_2, movie_3):
+    # given
+    for movie in (movie_1, movie_2, movie_3):
+        movie.save()
+    drama = Genre.objects.create(name="Drama")
+    MovieGenre.objects.create(movie=movie_1, genre=drama)
+    MovieGenre.objects.create(movie=movie_3, genre=drama)
+
+    # when
+    recent_drama: Dict[str, Any] = movie_facet_service.get_facets(
+        {"genre": "Drama", "release_year_min": "2020", "release_year_max": "2029"}
+    )
+    released: Dict[str, Any] = movie_facet_service.get_facets(
+        {"status": "Released", "adult": "false"}
+    )
+
+    # then
+    assert recent_drama == {
+        "genre": [{"value": "Drama", "count": 1}],
+        "decade": [{"value": "2020", "count": 1}],
+        "status": [{"value": "Released", "count": 1}],
+        "director": [{"value": "Greta Gerwig", "count": 1}],
+        "adult": [{"value": "false", "count": 1}],
+    }
+    assert released["decade"] == [
+        {"value": "2020", "count": 2},
+        {"value": "1990", "count": 1},
+    ]
+
+
+@pytest.mark.django_db
+def test_should_reject_combined_filters_matching_too_many_movies(
+    settings, movie_1, movie_2
+):
+    # given
+    settings.FACET_COMBINED_MAX_MOVIES = 1
+    movie_1.save()
+    movie_2.save()
+
+    # when
+    with pytest.raises(ValidationError) as e:
+        movie_facet_service.get_facets({"status": "Released", "adult": "false"})
+
+    # then
+    assert "more than 1 movies" in str(e.value.detail["filters"])
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"genre": "Drama", "status": "Released"},
+        {"adult": "false", "director": "Greta Gerwig"},
+        {"release_year_min": "2020", "release_year_max": "2023"},
+        {"release_year_min": "2020"},
+    ],
+)
+def test_should_reject_filters_without_counters_or_index(filters):
+    # when
+    with pytest.raises(ValidationError) as e:
+        movie_facet_service.get_facets(filters)
+
+    # then
+    assert "filters" in e.value.detail
+
+
+def test_should_reject_unknown_filters():
+    # when
+    with pytest.raises(ValidationError) as e:
+        movie_facet_service.get_facets({"decade": "2020", "duration_min": "90"})
+
+    # then
+    assert sorted(e.value.detail) == ["decade", "duration_min"]
+
+
+@pytest.mark.django_db
+def test_should_lock_movie_before_first_listing_refresh(mocker: MockerFixture, movie_1):
+    # given
+    movie_1.save()
+    movie_1.listing.delete()
+    select_for_update = mocker.spy(QuerySet, "select_for_update")
+
+    # when
+    MovieListingService.refresh([movie_1.id])
+
+    # then
+    assert [call.args[0].model for call in select_for_update.call_args_list] == [Movie]
+    assert movie_facet_service.get_facets({"adult": "false"})["director"] == [
+        {"value": "Robert Zemeckis", "count": 1}
+    ]
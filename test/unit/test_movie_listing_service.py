@@ -0,0 +1,244 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ValidationError
+
+from movies.models import Actor, Genre, MovieGenre, MovieListing
+from movies.services.movie_listing_service import MovieListingService
+
+movie_listing_service = MovieListingService()
+
+
+def page_plan(sort, filters) -> str:
+    with CaptureQueriesContext(connection) as context:
+        movie_listing_service.get_page(sort, filters=filters)
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {context.captured_queries[-1]['sql']}")
+        return " ".join(str(row) for row in cursor.fetchall())
+
+
+@pytest.mark.django_db
+def test_should_keep_listing_in_sync_with_movie_genres_and_cast(settings, movie_1):
+    # given
+    settings.MOVIE_LISTING_LEAD_ACTORS = 2
+    movie_1.save()
+    drama = Genre.objects.create(name="Drama")
+    comedy = Genre.objects.create(name="Comedy")
+    actors = [
+        Actor.objects.create(name=name)
+        for name in ("Tom Hanks", "Robin Wright", "Gary Sinise")
+    ]
+
+    # when
+    MovieGenre.objects.create(movie=movie_1, genre=drama)
+    MovieGenre.objects.create(movie=movie_1, genre=comedy)
+    movie_1.actors.add(*actors)
+    movie_1.title = "Forrest Gump (1994)"
+    movie_1.save()
+
+    # then
+    listing = MovieListing.objects.get(movie=movie_1)
+    assert listing.title == "Forrest Gump (1994)"
+    assert listing.director == "Robert Zemeckis"
+    assert listing.genres == ["Comedy", "Drama"]
+    assert listing.lead_actors == ["Tom Hanks", "Robin Wright"]
+
+    # when
+    comedy.name = "Romance"
+    comedy.save()
+    actors[0].delete()
+
+    # then
+    listing.refresh_from_db()
+    assert listing.genres == ["Drama", "Romance"]
+    assert listing.lead_actors == ["Robin Wright", "Gary Sinise"]
+
+
+@pytest.mark.django_db
+def test_should_drop_listing_with_movie(movie_1):
+    # given
+    movie_1.save()
+    MovieGenre.objects.create(movie=movie_1, genre=Genre.objects.create(name="Drama"))
+    movie_1.actors.add(Actor.objects.create(name="Tom Hanks"))
+
+    # when
+    movie_1.delete()
+
+    # then
+    assert not MovieListing.objects.exists()
+
+
+@pytest.mark.django_db
+def test_should_read_list_page_without_joins(
+    django_assert_num_queries, movie_1, movie_2
+):
+    # given
+    movie_1.save()
+    movie_2.save()
+    MovieGenre.objects.create(movie=movie_2, genre=Genre.objects.create(name="Drama"))
+
+    # when
+    with django_assert_num_queries(1) as context:
+        page = movie_listing_service.get_page(sort="-title")
+
+    # then
+    assert "JOIN" not in context.captured_queries[0]["sql"]
+    assert [movie["title"] for movie in page.data] == ["Oppenheimer", "Forrest Gump"]
+    assert page.data[0]["genres"] == ["Drama"]
+
+
+@pytest.mark.django_db
+def test_should_filter_by_director_and_release_years(movie_1, movie_2, movie_3):
+    # given
+    for movie in (movie_1, movie_2, movie_3):
+        movie.save()
+    filters = {
+        "director": "Christopher Nolan",
+        "release_year_min": "2000",
+        "release_year_max": "2023",
+        "sort": "-release_date",
+    }
+
+    # when
+    page = movie_listing_service.get_page(sort="-release_date", filters=filters)
+
+    # then
+    assert [movie["title"] for movie in page.data] == ["Oppenheimer"]
+
+
+@pytest.mark.django_db
+def test_should_page_genre_filter_on_listing_genre_rows(
+    django_assert_num_queries, movie_1, movie_2, movie_3
+):
+    # given
+    for movie in (movie_1, movie_2, movie_3):
+        movie.save()
+    drama = Genre.objects.create(name="Drama")
+    MovieGenre.objects.create(movie=movie_1, genre=drama)
+    MovieGenre.objects.create(movie=movie_2, genre=Genre.objects.create(name="War"))
+    MovieGenre.objects.create(movie=movie_3, genre=drama)
+
+    # when
+    first = movie_listing_service.get_page(
+        "title", page_size=1, filters={"genre": "Drama"}
+    )
+    with django_assert_num_queries(1) as context:
+        second = movie_listing_service.get_page(
+            "title", first.next_cursor, page_size=1, filters={"genre": "Drama"}
+        )
+    recent = movie_listing_service.get_page(
+        filters={"genre": "Drama", "release_year_min": "2000"}
+    )
+
+    # then
+    assert [movie["title"] for movie in first.data + second.data] == [
+        "Barbie",
+        "Forrest Gump",
+    ]
+    assert second.next_cursor is None
+    assert context.captured_queries[0]["sql"].count("JOIN") == 1
+    assert [movie["title"] for movie in recent.data] == ["Barbie"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "sort, filters",
+    [
+        ("title", {"genre": "Drama"}),
+        ("-release_date", {"genre": "Drama", "release_year_min": "1990"}),
+        ("-revenue", {"genre": "Drama"}),
+        (None, {"genre": "Drama"}),
+        (None, {"director": "Christopher Nolan"}),
+        (None, {"release_year_min": "1990"}),
+        ("-box_office", {"status": "Released"}),
+    ],
+)
+def test_should_serve_list_query_from_one_index(sort, filters):
+    # given
+    Genre.objects.create(name="Drama")
+
+    # when
+    plan: str = page_plan(sort, filters)
+
+    # then
+    assert "USING INDEX" in plan or "USING COVERING INDEX" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "sort, filters",
+    [
+        ("-revenue", {"adult": "false"}),
+        ("release_date", {"status": "Released", "adult": "true"}),
+        ("duration", {"duration_min": "100", "duration_max": "150"}),
+    ],
+)
+def test_should_serve_filters_from_listing_indexes(sort, filters):
+    # given
+    listings = movie_listing_service.filter_listings(
+        MovieListing.objects.all(), sort, filters
+    )
+    column: str = sort.lstrip("-")
+
+    # when
+    plan: str = listings.order_by(column, "movie").explain()
+
+    # then
+    assert "USING INDEX" in plan or "USING COVERING INDEX" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize(
+    "sort, filters",
+    [
+        ("duration", {"director": "Christopher Nolan"}),
+        ("release_date", {"duration_min": "90"}),
+        ("duration", {"status": "Released"}),
+        ("id", {"genre": "Drama", "adult": "true"}),
+    ],
+)
+def test_should_reject_filters_without_matching_index(sort, filters):
+    # when
+    with pytest.raises(ValidationError) as e:
+        movie_listing_service.filter_listings(MovieListing.objects.all(), sort, filters)
+
+    # then
+    assert "filters" in e.value.detail
+
+
+def test_should_reject_unknown_filters():
+    # when
+    with pytest.raises(ValidationError) as e:
+        movie_listing_service.filter_listings(
+            MovieListing.objects.all(), "title", {"year": "2023", "sort": "title"}
+        )
+
+    # then
+    assert list(e.value.detail) == ["year"]
+
+
+@pytest.mark.parametrize(
+    "filters, message",
+    [
+        (
+            {"genre": "Drama", "release_year_min": "1990"},
+            "Supported sort keys for these filters: release_date",
+        ),
+        (
+            {"director": "Christopher Nolan"},
+            "Supported sort keys for these filters: id, title, release_date, "
+            "revenue, box_office",
+        ),
+        ({"genre": "Drama", "status": "Released"}, "No sort supports these filters"),
+    ],
+)
+def test_should_name_sorts_supported_by_filters(filters, message):
+    # when
+    with pytest.raises(ValidationError) as e:
+        movie_listing_service.filter_listings(
+            MovieListing.objects.all(), "duration", filters
+        )
+
+    # then
+    assert str(e.value.detail["filters"]).startswith(message)
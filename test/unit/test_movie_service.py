@@ -1,9 +1,15 @@
+import json
+
 import pytest
+from django.http import JsonResponse
 from pytest_mock import MockerFixture
 from rest_framework.exceptions import ValidationError
 
-from movies.models import MovieGenre, Genre, Movie
+from movies.models import Actor, MovieGenre, Genre, Movie
+from movies.serializers.movie_serializer import FullTmdbMovieSerializer
 from movies.services.movie_service import MovieService
+from movies.utils.circuit_breaker import TmdbUnavailable
+from movies.utils.stale_results import StaleResults
 from test.unit.fake_tmdb_service import FakeTmdbService
 
 service = FakeTmdbService()
@@ -28,10 +34,11 @@ def test_should_create_movie_with_director_and_trailer_key(
     spy = mocker.spy(movie_service, "prepare_movie_data")
 
     # when
-    result: dict = movie_service.create_movie(resource_id)
+    result, created = movie_service.create_movie(resource_id)
 
     # then
     assert spy.call_count == 1
+    assert created
     assert result == created_movie_response
 
 
@@ -114,9 +121,10 @@ def test_should_get_simple_all_movie_data(
     result = movie_service.get_all_movies()
 
     # then
-    assert dict(result[0]) == get_simple_movie_1_response
-    assert dict(result[1]) == get_simple_movie_2_response
-    assert dict(result[2]) == get_simple_movie_3_response
+    assert dict(result.data[0]) == get_simple_movie_1_response
+    assert dict(result.data[1]) == get_simple_movie_2_response
+    assert dict(result.data[2]) == get_simple_movie_3_response
+    assert result.next_cursor is None
 
 
 @pytest.mark.django_db(reset_sequences=True)
@@ -233,3 +241,229 @@ def prepare_movie_genres(movie_genres_data):
 def prepare_genres(tmdb_genre_list):
     genres = [Genre(name=genre["name"]) for genre in tmdb_genre_list["genres"]]
     Genre.objects.bulk_create(genres)
+
+
+def test_should_serve_stale_search_results_when_tmdb_is_unavailable(
+    mocker: MockerFixture, tmdb_movie_search, search_query
+):
+    # given
+    StaleResults.shared().clear()
+    service.clear_responses()
+    service.add_response("movie_search", tmdb_movie_search)
+    fresh_results, fresh_stale = movie_service.movie_admin_search(search_query)
+    service.add_response("movie_search", TmdbUnavailable())
+    submit = mocker.patch.object(movie_service.search_refresher, "submit")
+
+    # when
+    result, stale = movie_service.movie_admin_search(search_query)
+
+    # then
+    assert not fresh_stale
+    assert stale
+    assert result == fresh_results
+    assert result[0]["poster_path"] == (
+        "https://image.tmdb.org/t/p/w500/arw2vcBveWOVZr6pxd9XTd1TdQa.jpg"
+    )
+    submit.assert_called_once_with(movie_service.refresh_search, "gump", "Gump")
+
+
+@pytest.mark.parametrize("search_query", ["ゴジラ", "기생충", "Amélie"])
+def test_should_send_search_query_to_tmdb_as_typed(
+    mocker: MockerFixture, tmdb_movie_search, search_query
+):
+    # given
+    StaleResults.shared().clear()
+    service.clear_responses()
+    service.add_response("movie_search", tmdb_movie_search)
+    movie_search = mocker.spy(service, "movie_search")
+
+    # when
+    movie_service.movie_admin_search(f"  {search_query} ")
+
+    # then
+    movie_search.assert_called_once_with(search_query)
+
+
+def test_should_fail_fast_without_stale_search_results(search_query):
+    # given
+    StaleResults.shared().clear()
+    service.clear_responses()
+    service.add_response("movie_search", TmdbUnavailable())
+
+    # when
+    with pytest.raises(TmdbUnavailable):
+        movie_service.movie_admin_search(search_query)
+
+
+@pytest.mark.django_db
+def test_should_return_existing_movie_without_calling_tmdb(
+    mocker: MockerFixture, movie_1, movie_2
+):
+    # given
+    movie_1.save()
+    movie_2.save()
+    spy = mocker.spy(movie_service, "prepare_movie_data")
+
+    # when
+    result, created = movie_service.create_movie(movie_1.tmdb_id)
+
+    # then
+    assert not created
+    assert spy.call_count == 0
+    assert result["id"] == movie_1.id
+    assert result["tmdb_id"] == movie_1.tmdb_id
+    assert Movie.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_should_return_serializable_existing_movie_with_relations(movie_1):
+    # given
+    movie_1.save()
+    MovieGenre.objects.create(movie=movie_1, genre=Genre.objects.create(name="Drama"))
+    movie_1.actors.add(Actor.objects.create(name="Tom Hanks"))
+
+    # when
+    result, created = movie_service.create_movie(movie_1.tmdb_id)
+
+    # then
+    assert not created
+    assert "genres" not in result and "actors" not in result
+    assert (
+        json.loads(JsonResponse({"data": result}).content)["data"]["id"] == movie_1.id
+    )
+
+
+@pytest.mark.django_db
+def test_should_return_movie_created_concurrently_under_another_tmdb_id(
+    mocker: MockerFixture,
+    movie_1,
+    tmdb_movie_response,
+    tmdb_movie_trailer,
+    tmdb_movie_credits,
+):
+    # given
+    movie_1.tmdb_id = None
+    mocker.patch.object(
+        movie_service,
+        "prepare_movie_data",
+        return_value={
+            **tmdb_movie_response,
+            **tmdb_movie_credits,
+            **tmdb_movie_trailer,
+        },
+    )
+    is_valid = FullTmdbMovieSerializer.is_valid
+
+    def is_valid_then_competing_insert(serializer, **kwargs) -> bool:
+        valid: bool = is_valid(serializer, **kwargs)
+        # Another request stores the same title and release date before our save
+        movie_1.save()
+        return valid
+
+    mocker.patch.object(
+        FullTmdbMovieSerializer,
+        "is_valid",
+        autospec=True,
+        side_effect=is_valid_then_competing_insert,
+    )
+
+    # when
+    result, created = movie_service.create_movie(tmdb_movie_response["id"])
+
+    # then
+    assert not created
+    assert result["id"] == movie_1.id
+    assert Movie.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_should_find_existing_tmdb_ids(movie_1, movie_3):
+    # given
+    movie_1.save()
+    movie_3.save()
+
+    # when
+    result = MovieService.find_existing_tmdb_ids([movie_3.tmdb_id, 1, movie_1.tmdb_id])
+
+    # then
+    assert result == {movie_1.tmdb_id, movie_3.tmdb_id}
+
+
+@pytest.mark.django_db
+def test_should_get_movie_with_genres_and_actors_in_fixed_queries(
+    django_assert_num_queries, movie_1
+):
+    # given
+    movie_1.save()
+    comedy, drama = Genre.objects.bulk_create(
+        [Genre(name="Comedy"), Genre(name="Drama")]
+    )
+    MovieGenre.objects.bulk_create(
+        [
+            MovieGenre(movie=movie_1, genre=comedy),
+            MovieGenre(movie=movie_1, genre=drama),
+        ]
+    )
+    movie_1.actors.add(
+        Actor.objects.create(name="Tom Hanks"),
+        Actor.objects.create(name="Robin Wright"),
+    )
+
+    # when
+    with django_assert_num_queries(3):
+        result = movie_service.get_movie(movie_1.id, ["genres", "actors"])
+
+    # then
+    assert result["title"] == movie_1.title
+    assert {genre["name"] for genre in result["genres"]} == {"Comedy", "Drama"}
+    assert {actor["name"] for actor in result["actors"]} == {
+        "Tom Hanks",
+        "Robin Wright",
+    }
+
+
+@pytest.mark.django_db
+def test_should_get_genres_from_movie_in_one_query(django_assert_num_queries, movie_1):
+    # given
+    movie_1.save()
+    comedy = Genre.objects.create(name="Comedy")
+    MovieGenre.objects.create(movie=movie_1, genre=comedy)
+
+    # when
+    with django_assert_num_queries(1):
+        result = movie_service.get_genres_from_movie(movie_1.id)
+
+    # then
+    assert [genre["name"] for genre in result] == ["Comedy"]
+
+
+def test_should_reject_unknown_movie_relation():
+    # when
+    with pytest.raises(ValidationError) as e:
+        movie_service.get_movie(1, ["reviews"])
+
+    # then
+    assert "include" in e.value.detail
+
+
+@pytest.mark.django_db
+def test_should_select_only_requested_movie_fields(django_assert_num_queries, movie_1):
+    # given
+    movie_1.save()
+
+    # when
+    with django_assert_num_queries(1) as queries:
+        result = movie_service.get_movie(movie_1.id, fields="title,poster_key")
+
+    # then
+    assert result == {"title": movie_1.title, "poster_key": movie_1.poster_key}
+    assert '"description"' not in queries.captured_queries[0]["sql"]
+
+
+def test_should_reject_field_outside_whitelist():
+    # when
+    with pytest.raises(ValidationError) as e:
+        movie_service.get_movie(1, fields="title,search_vector")
+
+    # then
+    assert "fields" in e.value.detail
@@ -0,0 +1,109 @@
+import time
+from typing import Iterator
+
+import pytest
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from movies.models import Movie
+from movies.utils.replica_router import (
+    PIN_COOKIE,
+    PrimaryPinningMiddleware,
+    ReplicaRouter,
+    read_from_replica,
+    wrote_primary,
+)
+
+router = ReplicaRouter()
+
+
+@pytest.fixture
+def replicas(settings) -> Iterator[None]:
+    settings.DATABASE_REPLICAS = ["replica_0"]
+    settings.REPLICA_FRESHNESS_WINDOW = 5
+    # Writes made by earlier tests ran outside the middleware and left the flag set
+    token = wrote_primary.set(False)
+    yield
+    wrote_primary.reset(token)
+
+
+def read_then_write() -> HttpResponse:
+    before_write: str = router.db_for_read(Movie)
+    router.db_for_write(Movie)
+    return HttpResponse(f"{before_write},{router.db_for_read(Movie)}")
+
+
+def test_should_route_only_replica_handler_reads_to_replica(replicas):
+    # when
+    outside: str = router.db_for_read(Movie)
+    inside: str = read_from_replica(lambda: router.db_for_read(Movie))()
+
+    # then
+    assert outside == "default"
+    assert inside == "replica_0"
+
+
+def test_should_read_from_primary_after_write_and_pin_client(replicas):
+    # given
+    middleware = PrimaryPinningMiddleware(
+        read_from_replica(lambda request: read_then_write())
+    )
+
+    # when
+    response = middleware(RequestFactory().get("/api/movies"))
+
+    # then
+    assert response.content == b"replica_0,default"
+    assert float(response.cookies[PIN_COOKIE].value) > time.time() + 4
+    assert response.cookies[PIN_COOKIE]["max-age"] == 5
+
+
+@pytest.mark.parametrize(
+    "pinned_until, expected", [(60, "default"), (-60, "replica_0")]
+)
+def test_should_honour_freshness_window(replicas, pinned_until, expected):
+    # given
+    request = RequestFactory().get("/api/movies")
+    request.COOKIES[PIN_COOKIE] = str(time.time() + pinned_until)
+    middleware = PrimaryPinningMiddleware(
+        read_from_replica(lambda request: HttpResponse(router.db_for_read(Movie)))
+    )
+
+    # when
+    response = middleware(request)
+
+    # then
+    assert response.content.decode() == expected
+    assert PIN_COOKIE not in response.cookies
+
+
+def test_should_pin_client_after_unsafe_request(replicas):
+    # given
+    middleware = PrimaryPinningMiddleware(lambda request: HttpResponse())
+
+    # when
+    response = middleware(RequestFactory().delete("/api/movies/1"))
+
+    # then
+    assert PIN_COOKIE in response.cookies
+
+
+def test_should_keep_shared_cache_on_primary_without_pinning(replicas):
+    # given
+    cache_model = caches["shared"].cache_model_class
+    middleware = PrimaryPinningMiddleware(
+        read_from_replica(
+            lambda request: HttpResponse(
+                f"{router.db_for_write(cache_model)},{router.db_for_read(cache_model)},"
+                f"{router.db_for_read(Movie)}"
+            )
+        )
+    )
+
+    # when
+    response = middleware(RequestFactory().get("/api/movies"))
+
+    # then
+    assert response.content == b"default,default,replica_0"
+    assert PIN_COOKIE not in response.cookies
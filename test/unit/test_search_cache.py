@@ -0,0 +1,81 @@
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from movies.utils.search_cache import SearchResultCache, normalize_query
+
+
+def search_results(*titles: str, total_results: int = 0) -> Dict[str, Any]:
+    return {
+        "page": 1,
+        "results": [
+            {"id": index, "title": title} for index, title in enumerate(titles)
+        ],
+        "total_pages": 1,
+        "total_results": total_results or len(titles),
+    }
+
+
+def test_should_normalize_case_accents_and_whitespace():
+    # then
+    assert normalize_query("  Amélie   Poulain ") == "amelie poulain"
+    assert normalize_query("GUMP") == normalize_query("gump")
+
+
+def test_should_narrow_complete_prefix_results():
+    # given
+    cache = SearchResultCache(ttl=60, max_entries=10)
+    cache.put("gum", search_results("Forrest Gump", "Gummo"))
+
+    # when
+    result = cache.get("gump")
+
+    # then
+    assert result is not None
+    assert [movie["title"] for movie in result["results"]] == ["Forrest Gump"]
+    assert result["total_results"] == 1
+    assert cache.stats()["prefix_hits"] == 1
+
+
+def test_should_not_narrow_incomplete_prefix_results():
+    # given
+    cache = SearchResultCache(ttl=60, max_entries=10)
+    cache.put("g", search_results("Gladiator", "Gump", total_results=9000))
+
+    # when
+    result = cache.get("gu")
+
+    # then
+    assert result is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_should_cache_empty_results_and_report_hit_ratio():
+    # given
+    cache = SearchResultCache(ttl=60, max_entries=10)
+    cache.put("zzzz", search_results())
+
+    # when
+    first = cache.get("zzzz")
+    second = cache.get("qqqq")
+
+    # then
+    assert first is not None
+    assert first["results"] == []
+    assert second is None
+    assert cache.stats()["hit_ratio"] == 0.5
+
+
+def test_should_expire_entries_after_ttl(mocker: MockerFixture):
+    # given
+    monotonic: MagicMock = mocker.patch(
+        "movies.utils.search_cache.time.monotonic", return_value=100.0
+    )
+    cache = SearchResultCache(ttl=60, max_entries=10)
+    cache.put("gump", search_results("Forrest Gump"))
+    monotonic.return_value = 161.0
+
+    # then
+    assert cache.get("gump") is None
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+from movies.utils.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def test_should_merge_identical_calls_from_threads():
+    # given
+    single_flight = SingleFlight()
+    calls: List[int] = []
+    results: List[bytes] = []
+
+    def fetch() -> bytes:
+        calls.append(1)
+        time.sleep(0.2)
+        return b"{}"
+
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(single_flight.do("person/1", fetch))
+        )
+        for _ in range(5)
+    ]
+
+    # when
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert len(calls) == 1
+    assert results == [b"{}"] * 5
+    assert single_flight.stats() == {"calls": 1, "saved": 4}
+
+
+def test_should_share_error_with_waiting_threads():
+    # given
+    single_flight = SingleFlight()
+    errors: List[Exception] = []
+
+    def fetch() -> bytes:
+        time.sleep(0.2)
+        raise ValueError("TMDB is down")
+
+    def call() -> None:
+        try:
+            single_flight.do("movie/1", fetch)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+
+    # when
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert len(errors) == 3
+    assert single_flight.stats()["calls"] == 1
+
+
+def test_should_merge_identical_calls_from_coroutines():
+    # given
+    single_flight = AsyncSingleFlight()
+    calls: List[int] = []
+
+    async def fetch() -> bytes:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return b"{}"
+
+    async def fetch_all() -> List[bytes]:
+        return await asyncio.gather(
+            *[single_flight.do("person/1", fetch) for _ in range(5)],
+            single_flight.do("person/2", fetch),
+        )
+
+    # when
+    results: List[bytes] = asyncio.run(fetch_all())
+
+    # then
+    assert results == [b"{}"] * 6
+    assert len(calls) == 2
+    assert single_flight.stats() == {"calls": 2, "saved": 4}
+
+
+def test_should_start_new_call_after_previous_finished():
+    # given
+    single_flight = SingleFlight()
+
+    # when
+    single_flight.do("movie/1", lambda: b"1")
+    result = single_flight.do("movie/1", lambda: b"2")
+
+    # then
+    assert result == b"2"
+    assert single_flight.stats() == {"calls": 2, "saved": 0}
@@ -0,0 +1,97 @@
+import json
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from movies.services.tmdb_service import TmdbService
+from movies.utils.tmdb_cache import TmdbResponseCache
+
+TTL = {"movie": 60, "search": 60}
+
+
+def test_should_return_cached_response_and_count_hits():
+    # given
+    cache = TmdbResponseCache(max_bytes=1024, ttl=TTL)
+    cache.put("movie", "movie/1", b"{}")
+
+    # when
+    hit = cache.get("movie/1")
+    miss = cache.get("movie/2")
+
+    # then
+    assert hit == b"{}"
+    assert miss is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_should_evict_least_recently_used_entries_when_size_exceeded():
+    # given
+    cache = TmdbResponseCache(max_bytes=10, ttl=TTL)
+    cache.put("movie", "movie/1", b"1234")
+    cache.put("movie", "movie/2", b"1234")
+    cache.get("movie/1")
+
+    # when
+    cache.put("movie", "movie/3", b"1234")
+
+    # then
+    assert cache.get("movie/2") is None
+    assert cache.get("movie/1") == b"1234"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 8
+
+
+def test_should_expire_entries_after_endpoint_ttl(mocker: MockerFixture):
+    # given
+    cache = TmdbResponseCache(max_bytes=1024, ttl=TTL)
+    monotonic: MagicMock = mocker.patch(
+        "movies.utils.tmdb_cache.time.monotonic", return_value=100.0
+    )
+    cache.put("search", "search/movie?query=gump", b"[]")
+    monotonic.return_value = 161.0
+
+    # when
+    result = cache.get("search/movie?query=gump")
+
+    # then
+    assert result is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_should_not_cache_endpoints_without_ttl():
+    # given
+    cache = TmdbResponseCache(max_bytes=1024, ttl=TTL)
+
+    # when
+    cache.put("actor", "person/1", b"{}")
+
+    # then
+    assert cache.stats()["entries"] == 0
+
+
+def test_should_reuse_full_movie_payload_for_movie_details(
+    mocker: MockerFixture, tmdb_movie_response, resource_id
+):
+    # given
+    service = TmdbService()
+    service.cache = TmdbResponseCache(
+        max_bytes=1024 * 1024, ttl={"movie": 60, "credits": 60, "videos": 60}
+    )
+    response: MagicMock = MagicMock(
+        content=json.dumps(
+            {**tmdb_movie_response, "videos": {"results": []}, "credits": {}}
+        ).encode()
+    )
+    get_mock: MagicMock = mocker.patch.object(
+        service.client, "get", return_value=response
+    )
+
+    # when
+    service.fetch_full_movie(resource_id)
+    result: Dict[str, Any] = service.fetch_movie(resource_id)
+
+    # then
+    assert get_mock.call_count == 1
+    assert result == tmdb_movie_response
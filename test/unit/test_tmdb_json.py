@@ -0,0 +1,60 @@
+import json
+from typing import Any, Dict
+
+from movies.payload.tmdb_actor_response import TmdbActorResponse
+from movies.utils import tmdb_json
+
+
+def test_should_keep_only_cast_ids_and_director_from_credits(tmdb_movie_credits):
+    # given
+    tmdb_movie_credits["cast"][0]["character"] = "Forrest Gump"
+    content: bytes = json.dumps(tmdb_movie_credits).encode()
+
+    # when
+    result: Dict[str, Any] = tmdb_json.decode_projected("credits", content)
+
+    # then
+    assert result == {
+        "cast": [{"id": 1}, {"id": 2}, {"id": 3}],
+        "crew": [{"name": "Robert Zemeckis", "job": "Director"}],
+    }
+
+
+def test_should_project_appended_movie_parts(
+    tmdb_movie_response, tmdb_movie_trailer, tmdb_movie_credits
+):
+    # given
+    content: bytes = json.dumps(
+        {
+            **tmdb_movie_response,
+            "id": 13,
+            "popularity": 48.3,
+            "production_companies": [{"id": 4, "name": "Paramount"}],
+            "videos": tmdb_movie_trailer,
+            "credits": tmdb_movie_credits,
+        }
+    ).encode()
+
+    # when
+    result: Dict[str, Any] = tmdb_json.decode_projected("movie", content)
+
+    # then
+    assert "popularity" not in result
+    assert "production_companies" not in result
+    assert result["title"] == tmdb_movie_response["title"]
+    assert result["videos"]["results"][0]["key"] == "0YAKkHutmFI"
+    assert result["credits"]["crew"] == [{"name": "Robert Zemeckis", "job": "Director"}]
+
+
+def test_should_leave_unknown_endpoints_untouched():
+    # given
+    content: bytes = b'{"anything": [1, 2, 3]}'
+
+    # then
+    assert tmdb_json.decode_projected("unknown", content) == {"anything": [1, 2, 3]}
+
+
+def test_should_build_actor_record_without_instance_dict(tmdb_actor):
+    # then
+    assert not hasattr(tmdb_actor, "__dict__")
+    assert isinstance(tmdb_actor, TmdbActorResponse)
@@ -0,0 +1,194 @@
+import asyncio
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import CheckMessage
+from pytest_mock import MockerFixture
+from requests import HTTPError
+from rest_framework.exceptions import Throttled
+
+from movies.utils.tmdb_client import TmdbClient
+from movies.utils.tmdb_rate_limiter import TmdbRateLimiter, check_shared_cache
+
+
+@pytest.fixture
+def rate_limiter() -> TmdbRateLimiter:
+    cache = LocMemCache("tmdb-rate-limiter-test", {})
+    cache.clear()
+    return TmdbRateLimiter(
+        rate=2, min_concurrency=1, max_concurrency=8, latency_target=1.0, cache=cache
+    )
+
+
+def test_should_delay_requests_over_shared_quota(mocker: MockerFixture, rate_limiter):
+    # given
+    mocker.patch("movies.utils.tmdb_rate_limiter.time.time", return_value=1000.5)
+
+    # when
+    delays = [rate_limiter.reserve() for _ in range(3)]
+
+    # then
+    assert delays[:2] == [0.0, 0.0]
+    assert 0.5 <= delays[2] <= 0.55
+
+
+def test_should_share_quota_between_workers_from_async_code(mocker: MockerFixture):
+    # given
+    mocker.patch("movies.utils.tmdb_rate_limiter.time.time", return_value=1000.5)
+    cache = LocMemCache("tmdb-rate-limiter-shared-test", {})
+    cache.clear()
+    workers = [
+        TmdbRateLimiter(
+            rate=2,
+            min_concurrency=1,
+            max_concurrency=8,
+            latency_target=1.0,
+            cache=cache,
+        )
+        for _ in range(2)
+    ]
+
+    # when
+    async def reserve_all() -> List[float]:
+        return [await worker.areserve() for worker in (*workers, workers[0])]
+
+    delays: List[float] = asyncio.run(reserve_all())
+
+    # then
+    assert delays[:2] == [0.0, 0.0]
+    assert 0.5 <= delays[2] <= 0.55
+
+
+def test_should_pause_all_workers_for_retry_after(rate_limiter):
+    # when
+    delay: float = rate_limiter.backoff_delay(0, "3")
+
+    # then
+    assert delay == 3.0
+    assert 2.5 < rate_limiter.reserve() <= 3.0
+
+
+def test_should_cap_retry_after_at_backoff_max(settings, rate_limiter):
+    # given
+    settings.TMDB_BACKOFF_MAX = 30.0
+
+    # when
+    delay: float = rate_limiter.backoff_delay(0, "3600")
+
+    # then
+    assert delay == 30.0
+    assert 29.5 < rate_limiter.reserve() <= 30.0
+
+
+def test_should_halve_limit_on_throttle_and_grow_on_success(rate_limiter):
+    # given
+    rate_limiter.try_acquire_slot()
+    rate_limiter.release(0.1, throttled=True)
+    limit_after_throttle: float = rate_limiter.limit
+
+    # when
+    rate_limiter.try_acquire_slot()
+    rate_limiter.release(0.1, throttled=False)
+
+    # then
+    assert limit_after_throttle == 2.0
+    assert rate_limiter.limit == 2.5
+    assert rate_limiter.stats()["throttled"] == 1
+
+
+def test_should_halve_limit_once_per_window(mocker: MockerFixture, rate_limiter):
+    # given
+    monotonic: MagicMock = mocker.patch(
+        "movies.utils.tmdb_rate_limiter.time.monotonic", return_value=100.0
+    )
+    for _ in range(3):
+        rate_limiter.try_acquire_slot()
+    for _ in range(2):
+        rate_limiter.release(5.0, throttled=False)
+    limit_in_window: float = rate_limiter.limit
+
+    # when
+    monotonic.return_value = 101.0
+    rate_limiter.release(5.0, throttled=True)
+
+    # then
+    assert limit_in_window == 2.0
+    assert rate_limiter.limit == 1.0
+    assert rate_limiter.stats()["in_flight"] == 0
+
+
+def test_should_warn_when_rate_limit_cache_is_per_process(settings):
+    # given
+    settings.TMDB_RATE_LIMIT_CACHE = "default"
+
+    # when
+    warnings: List[CheckMessage] = check_shared_cache(None)
+
+    # then
+    assert [warning.id for warning in warnings] == ["movies.W001"]
+
+
+def test_should_fail_checks_when_rate_limit_cache_has_no_atomic_incr(settings):
+    # given
+    settings.CACHES = {
+        **settings.CACHES,
+        "database": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "shared_cache",
+        },
+    }
+    settings.TMDB_RATE_LIMIT_CACHE = "database"
+
+    # when
+    errors: List[CheckMessage] = check_shared_cache(None)
+
+    # then
+    assert [error.id for error in errors] == ["movies.E001"]
+    assert errors[0].is_serious()
+
+
+def test_should_retry_throttled_request(mocker: MockerFixture, rate_limiter):
+    # given
+    client = TmdbClient()
+    client.rate_limiter = rate_limiter
+    throttled: MagicMock = MagicMock(status_code=429, headers={"Retry-After": "0"})
+    ok: MagicMock = MagicMock(status_code=200, headers={})
+    session: MagicMock = MagicMock()
+    session.request.side_effect = [throttled, ok]
+    mocker.patch(
+        "movies.utils.tmdb_client.TmdbSessionPool.get_session", return_value=session
+    )
+    sleep: MagicMock = mocker.patch("movies.utils.tmdb_client.time.sleep")
+
+    # when
+    response = client.get("movie/1")
+
+    # then
+    assert response is ok
+    assert session.request.call_count == 2
+    sleep.assert_called_once_with(0.0)
+
+
+def test_should_raise_throttled_when_retries_exhausted(
+    mocker: MockerFixture, settings, rate_limiter
+):
+    # given
+    settings.TMDB_MAX_RETRIES = 0
+    client = TmdbClient()
+    client.rate_limiter = rate_limiter
+    throttled: MagicMock = MagicMock(status_code=429, headers={"Retry-After": "5"})
+    throttled.raise_for_status.side_effect = HTTPError()
+    session: MagicMock = MagicMock()
+    session.request.return_value = throttled
+    mocker.patch(
+        "movies.utils.tmdb_client.TmdbSessionPool.get_session", return_value=session
+    )
+
+    # when
+    with pytest.raises(Throttled) as e:
+        client.get("movie/1")
+
+    # then
+    assert e.value.status_code == 429
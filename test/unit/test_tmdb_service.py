@@ -0,0 +1,103 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from movies.services.async_tmdb_service import AsyncTmdbService
+from movies.services.tmdb_service import TmdbService
+from movies.utils import tmdb_json
+from movies.utils.async_tmdb_client import AsyncTmdbClient
+from movies.utils.tmdb_cache import TmdbResponseCache
+from movies.utils.tmdb_event_loop import TmdbEventLoop
+
+
+def test_should_fetch_full_movie_in_single_request(
+    mocker: MockerFixture,
+    tmdb_movie_response,
+    tmdb_movie_trailer,
+    tmdb_movie_credits,
+    resource_id,
+):
+    # given
+    service = TmdbService()
+    response: MagicMock = MagicMock(
+        content=json.dumps(
+            {
+                **tmdb_movie_response,
+                "videos": tmdb_movie_trailer,
+                "credits": tmdb_movie_credits,
+            }
+        ).encode()
+    )
+    get_mock: MagicMock = mocker.patch.object(
+        service.client, "get", return_value=response
+    )
+
+    # when
+    result: Dict[str, Any] = service.fetch_full_movie(resource_id)
+
+    # then
+    assert get_mock.call_count == 1
+    assert get_mock.call_args.kwargs["params"] == {
+        "append_to_response": "videos,credits"
+    }
+    assert result["results"] == tmdb_movie_trailer["results"]
+    assert result["crew"] == [{"name": "Robert Zemeckis", "job": "Director"}]
+    assert result["title"] == tmdb_movie_response["title"]
+    assert "videos" not in result
+    assert "credits" not in result
+
+
+def test_should_decode_fetched_payload_once_and_cache_projection(
+    mocker: MockerFixture, tmdb_movie_credits, resource_id
+):
+    # given
+    service = TmdbService()
+    service.cache = TmdbResponseCache(max_bytes=1024 * 1024, ttl={"credits": 60})
+    tmdb_movie_credits["cast"][0]["character"] = "Forrest Gump"
+    mocker.patch.object(
+        service.client,
+        "get",
+        return_value=MagicMock(content=json.dumps(tmdb_movie_credits).encode()),
+    )
+    loads: MagicMock = mocker.spy(tmdb_json, "loads")
+
+    # when
+    fetched: Dict[str, Any] = service.fetch_movie_credits(resource_id)
+    cached: Dict[str, Any] = service.fetch_movie_credits(resource_id)
+
+    # then
+    assert loads.call_count == 2
+    assert fetched == cached
+    assert fetched["cast"][0] == {"id": 1}
+
+
+def test_should_fetch_actors_concurrently_on_shared_loop(settings, tmdb_http_server):
+    # given
+    settings.TMDB_URI = tmdb_http_server
+    service = AsyncTmdbService()
+
+    # when
+    result: List[Dict[str, Any]] = TmdbEventLoop.run(service.fetch_actors([1, 2, 3]))
+
+    # then
+    assert [actor["id"] for actor in result] == [1, 2, 3]
+
+
+def test_should_use_separate_async_pool_per_event_loop(settings, tmdb_http_server):
+    # given
+    settings.TMDB_URI = tmdb_http_server
+
+    async def fetch_movie() -> Dict[str, Any]:
+        try:
+            return await AsyncTmdbService().fetch_movie(1)
+        finally:
+            await AsyncTmdbClient.aclose()
+
+    # when
+    result: Dict[str, Any] = asyncio.run(fetch_movie())
+
+    # then
+    assert result == {"id": 1}
@@ -0,0 +1,104 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+from pytest_mock import MockerFixture
+from requests import Response
+from rest_framework.exceptions import APIException, NotFound
+
+from movies.utils.async_tmdb_client import AsyncTmdbClient
+from movies.utils.circuit_breaker import TmdbUnavailable
+from movies.utils.tmdb_client import TmdbClient
+from movies.utils.tmdb_store import TmdbResponseStore
+
+
+@pytest.fixture
+def tmdb_store(settings, tmp_path) -> TmdbResponseStore:
+    settings.TMDB_STORE_PATH = tmp_path / "tmdb_store.sqlite3"
+    return TmdbResponseStore.shared()
+
+
+def test_should_replay_recorded_response_without_network(
+    settings, tmdb_store, tmdb_http_server
+):
+    # given
+    settings.TMDB_STORE_MODE = "record"
+    client = TmdbClient()
+    client.base_uri = tmdb_http_server
+    recorded: bytes = client.get("movie/1", {"language": "en"}).content
+    settings.TMDB_STORE_MODE = "replay"
+    client.base_uri = "http://127.0.0.1:9/"
+
+    # when
+    replayed = client.get("movie/1", {"language": "en"})
+
+    # then
+    assert replayed.content == recorded
+    assert replayed.json() == {"path": "/movie/1?language=en", "id": 1}
+    assert tmdb_store.stats() == {"hits": 1, "misses": 0, "writes": 1}
+
+
+def test_should_fail_replay_for_unrecorded_request(settings, tmdb_store):
+    # given
+    settings.TMDB_STORE_MODE = "replay"
+
+    # when
+    with pytest.raises(APIException) as e:
+        TmdbClient().get("movie/2")
+
+    # then
+    assert "No recorded TMDB response for GET movie/2" in str(e.value)
+
+
+def test_should_replay_recorded_errors(settings, tmdb_store):
+    # given
+    settings.TMDB_STORE_MODE = "replay"
+    tmdb_store.save("GET person/404", 404, b'{"status_code": 34}')
+
+    # when
+    with pytest.raises(NotFound):
+        TmdbClient().get("person/404")
+
+
+@pytest.mark.parametrize("status_code", [500, 502, 504])
+def test_should_not_store_server_errors(
+    mocker: MockerFixture, settings, tmdb_store, status_code
+):
+    # given
+    settings.TMDB_STORE_MODE = "read-through"
+    client = TmdbClient()
+    error: Response = TmdbClient.build_stored_response(status_code, b"{}")
+    mocker.patch.object(client, "send_with_retries", return_value=error)
+
+    # when
+    with pytest.raises(TmdbUnavailable):
+        client.get("movie/5")
+
+    # then
+    assert tmdb_store.stats()["writes"] == 0
+    assert tmdb_store.load("GET movie/5") is None
+
+
+def test_should_read_through_store_from_async_client(
+    settings, tmdb_store, tmdb_http_server
+):
+    # given
+    settings.TMDB_STORE_MODE = "read-through"
+    settings.TMDB_URI = tmdb_http_server
+
+    async def fetch_twice() -> List[Any]:
+        try:
+            client = AsyncTmdbClient()
+            first = (await client.get("movie/3")).json()
+            client.base_uri = "http://127.0.0.1:9/"
+            second = (await client.get("movie/3")).json()
+            return [first, second]
+        finally:
+            await AsyncTmdbClient.aclose()
+
+    # when
+    result: List[Any] = asyncio.run(fetch_twice())
+
+    # then
+    assert result == [{"path": "/movie/3", "id": 3}] * 2
+    assert tmdb_store.stats() == {"hits": 1, "misses": 1, "writes": 1}